@@ -33,13 +33,20 @@ a = Analysis(
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
+# One-directory build by default: the app starts without unpacking itself to a
+# temp dir on every launch. Set PYINSTALLER_BUILD_ONEFILE=yes for a single exe.
+onefile = os.environ.get('PYINSTALLER_BUILD_ONEFILE', '').lower() == 'yes'
+
+if onefile:
+    exe_contents = [a.binaries, a.zipfiles, a.datas, []]
+else:
+    exe_contents = [[]]
+
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    [],
+    *exe_contents,
+    exclude_binaries=not onefile,
     name='OCRInvoiceParser',
     debug=False,
     bootloader_ignore_signals=False,
@@ -55,3 +62,15 @@ exe = EXE(
     entitlements_file=None,
     icon='installer/icon.ico' if os.path.exists('installer/icon.ico') else None,
 )
+
+if not onefile:
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.zipfiles,
+        a.datas,
+        strip=False,
+        upx=True,
+        upx_exclude=[],
+        name='OCRInvoiceParser',
+    )
@@ -3,74 +3,89 @@
 import sys
 import os
 import re
+from bisect import bisect_right
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 
 from ocrinvoice.parsers.invoice_parser import InvoiceParser
 
+# Same amount pattern as InvoiceParser._AMOUNT_RE, but whitespace never spans a
+# newline so a single scan over the whole text yields the per-line matches
+_AMOUNT_RE = re.compile(
+    r"[\$€£¥]?[^\S\n]*(\d{1,3}(?:,\d{3})*)[^\S\n]*[٠٫٬\.][^\S\n]*(\d{2})"
+)
+
+# Keywords marking total lines, matched in one pass over the lowercased text
+_TOTAL_KEYWORD_RE = re.compile("total|mastercard")
+
+# Translation table deleting currency symbols and thousands separators
+_STRIP = str.maketrans("", "", "$,€£¥")
+
 # RONA invoice text from the OCR output (the new OCR version)
-rona_text = """Wty
-~
-KE XN KKK KK KN LRM AN KKK ARK ARK KKK CRRA KC CHEK
-RONA+ Saint-Jean~sur-Riche] ieu
-41350
-170 rue Moreau
-St-Jean-sur-Richelieu J2W 2M4
-450-359-4695
-X XK EK KKK IE KK KK KEK XK CERR
-TTEM ate Prix TOTAL
-1 1076.93 1,076.43
-Depot #413500151 703500
-Portion de taxe: $140.20
-S-Total: $1,076.43
-TPS : $0.00
-TVQ : $0.00
-Total: $1,076.43
-MasterCard $1,076.43
-HComp te xH¥RKHHAKHHHIBIG
-#Autor 09258E
-Employe:511
-RONA Inc.
-TPS/TVH # 103039624RT0001
-TvQ # 1001939455TQ0001
-Echange/rembours. Dans les 90 Jours,
-dans l'emballase original, sauf
-except., notamment les électroménagers.
-Détails en magasin ou au:
-rona.ca/fr/retours-et-remboursenents
-Interessé par une carriére chez RONA?
-Appiiquer en-ligne:
-wow. ronainc.ca/fr/carrieres
-4416 41350 25 25 7/10/25 18:25
-VOUS POURRIEZ GAGNER
-- 1000$ en carte cadeau RONA!
-Pour participer, répondre au sondage suv
-opinion.rona.ca
-Code acces: 25441641350191
-Dernier jour pour remplir le sondage:
-le 20 Juil, 2025
-*X82009025441 6%"""
+RONA_FIXTURE = Path(__file__).parent / "tests" / "fixtures" / "rona_ocr.txt"
+
+
+def _newline_offsets(text):
+    """Return the offsets of every newline in text, for bisecting to lines."""
+    return [match.start() for match in re.finditer("\n", text)]
+
+
+def find_amount_matches_by_line(text):
+    """Scan text once and group amount regex matches by line index."""
+    newline_offsets = _newline_offsets(text)
+    matches_by_line = {}
+    for match in _AMOUNT_RE.finditer(text):
+        line_index = bisect_right(newline_offsets, match.start())
+        matches_by_line.setdefault(line_index, []).append(match.groups())
+    return matches_by_line
+
+
+def find_total_keyword_lines(text):
+    """Scan the lowercased text once and return indexes of total lines."""
+    newline_offsets = _newline_offsets(text)
+    return {
+        bisect_right(newline_offsets, match.start())
+        for match in _TOTAL_KEYWORD_RE.finditer(text.lower())
+    }
+
+
+def amounts_to_floats(amount_strs):
+    """Convert amount strings to a float array in one vectorized pass.
+
+    Unparseable amounts become NaN, so they drop out of any range mask.
+    """
+    cleaned = np.char.translate(np.asarray(amount_strs, dtype=str), _STRIP)
+    return pd.to_numeric(cleaned, errors="coerce").astype(np.float64)
 
 
 def test_total_extraction():
     parser = InvoiceParser()
+    rona_text = RONA_FIXTURE.read_text(encoding="utf-8")
 
     print("Testing total extraction with RONA invoice text (OCR version)...")
     print("=" * 60)
 
     # Test the new OCR correction method
-    lines = [line.strip() for line in rona_text.split("\n")]
+    regex_matches = find_amount_matches_by_line(rona_text)
+    total_lines = find_total_keyword_lines(rona_text)
+    # Extract amounts once per line and reuse them for every debug section;
+    # each raw line is stripped as it is consumed, without an interim list
+    parsed = []
+    for i, raw_line in enumerate(rona_text.split("\n")):
+        line = raw_line.strip()
+        parsed.append((i, line, parser._extract_amounts_with_ocr_correction(line)))
 
     print("Looking for total lines:")
-    for i, line in enumerate(lines):
-        line_lower = line.lower()
-        if "total" in line_lower or "mastercard" in line_lower:
+    for i, line, amounts in parsed:
+        if i in total_lines:
             print(f"Line {i}: '{line}'")
-            amounts = parser._extract_amounts_with_ocr_correction(line)
             print(f"  Extracted amounts: {amounts}")
             # Debug regex match
-            pattern = r"[\$€£¥]?\s*(\d{1,3}(?:,\d{3})*)\s*[٠٫٬\.]\s*(\d{2})"
-            matches = re.findall(pattern, line)
+            matches = regex_matches.get(i, [])
             print(f"  Regex matches for pattern: {matches}")
 
     print("\n" + "=" * 60)
@@ -82,38 +97,27 @@ def test_total_extraction():
     print("\n" + "=" * 60)
     print("All amounts found in text:")
     all_amounts = []
-    for i, line in enumerate(lines):
-        amounts = parser._extract_amounts_with_ocr_correction(line)
+    for i, line, amounts in parsed:
         if amounts:
             print(f"Line {i}: '{line}' -> {amounts}")
             all_amounts.extend(amounts)
 
-    print(f"\nAll unique amounts: {list(set(all_amounts))}")
+    # Order-preserving dedup keeps the output stable between runs
+    unique_amounts = list(dict.fromkeys(all_amounts))
+    print(f"\nAll unique amounts: {unique_amounts}")
 
     # Debug: Show what happens in the $1000-$2000 range logic
     print("\n" + "=" * 60)
     print("Debugging $1000-$2000 range logic:")
-    float_amounts = []
-    for amount_str in all_amounts:
-        try:
-            cleaned = (
-                amount_str.replace("$", "")
-                .replace(",", "")
-                .replace("€", "")
-                .replace("£", "")
-                .replace("¥", "")
-            )
-            value = float(cleaned)
-            if 10 <= value <= 10000:
-                float_amounts.append(value)
-        except (ValueError, TypeError):
-            continue
+    values = amounts_to_floats(all_amounts)
+    # Keep the amounts in float64 arrays so range masks and max run in NumPy
+    float_amounts = values[(values >= 10) & (values <= 10000)]
 
-    print(f"All amounts in 10-10000 range: {float_amounts}")
-    in_range = [v for v in float_amounts if 1000 <= v <= 2000]
-    print(f"Amounts in 1000-2000 range: {in_range}")
-    if in_range:
-        print(f"Max in range: {max(in_range)}")
+    print(f"All amounts in 10-10000 range: {float_amounts.tolist()}")
+    in_range = float_amounts[(float_amounts >= 1000) & (float_amounts <= 2000)]
+    print(f"Amounts in 1000-2000 range: {in_range.tolist()}")
+    if in_range.size:
+        print(f"Max in range: {in_range.max()}")
 
     # Debug the problematic line specifically
     print("\n" + "=" * 60)
@@ -126,13 +130,7 @@ def test_total_extraction():
     # Test each amount conversion
     for amount_str in amounts:
         try:
-            cleaned = (
-                amount_str.replace("$", "")
-                .replace(",", "")
-                .replace("€", "")
-                .replace("£", "")
-                .replace("¥", "")
-            )
+            cleaned = amount_str.translate(_STRIP)
             value = float(cleaned)
             print(f"  '{amount_str}' -> cleaned: '{cleaned}' -> float: {value}")
         except (ValueError, TypeError) as e:
@@ -7,140 +7,331 @@ It builds the PyInstaller executable and then creates an NSIS installer.
 """
 
 import os
+import re
 import sys
-import subprocess
 import shutil
+import threading
+from functools import lru_cache
 from pathlib import Path
 import argparse
 
+# subprocess, concurrent.futures, hashlib, mmap, tempfile and tomllib are
+# imported in the functions that use them, so --help and early exits do not
+# pay for them
 
-def run_command(command, cwd=None, check=True):
-    """Run a command and return the result."""
-    print(f"Running: {command}")
+# Version lines rewritten in installer.nsi, compiled once at import
+_APP_VERSION_RE = re.compile(rb'!define APP_VERSION "[\d.]+"')
+_VI_PRODUCT_VERSION_RE = re.compile(rb'VIProductVersion "[\d.]+"')
+
+# One-directory builds skip the per-launch unpacking of a onefile exe; set
+# PYINSTALLER_BUILD_ONEFILE=yes to get the legacy single-file build
+BUILD_ONEFILE = os.environ.get("PYINSTALLER_BUILD_ONEFILE", "").lower() == "yes"
+EXECUTABLE_PATH = (
+    "dist/OCRInvoiceParser.exe" if BUILD_ONEFILE
+    else "dist/OCRInvoiceParser/OCRInvoiceParser.exe"
+)
+
+# Inputs of the PyInstaller build; if none changed, the executable is reused.
+# Keep in step with the files OCRInvoiceParser.spec embeds (datas, icon).
+FINGERPRINT_INPUTS = (
+    "src/ocrinvoice", "config", "docs", "installer/icon.ico",
+    "OCRInvoiceParser.spec", "pyproject.toml",
+)
+FINGERPRINT_PATH = os.path.join("dist", ".build_fingerprint")
+
+# Serializes console output of build steps that run concurrently
+_OUTPUT_LOCK = threading.Lock()
+
+# Absolute paths of build tools, resolved on PATH once per run
+_TOOLS = {}
+
+
+def _print(*args, **kwargs):
+    """print() under the output lock, for steps that run concurrently."""
+    with _OUTPUT_LOCK:
+        print(*args, **kwargs)
+
+
+def run_command(argv, cwd=None, check=True, env=None, quiet=False):
+    """Run a command given as an argv list and return the result.
+
+    The command is executed directly, without an intermediate shell, and its
+    combined stdout/stderr is streamed line by line instead of being buffered
+    in memory, so verbose PyInstaller/NSIS logs stay cheap. With quiet=True
+    stdout is discarded undecoded and stderr is only shown if the command fails.
+    """
+    import subprocess
+    
+    _print(f"Running: {subprocess.list2cmdline(argv)}")
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            check=check
-        )
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr:
-            print(f"STDERR: {result.stderr}")
-        return result
-    except subprocess.CalledProcessError as e:
-        print(f"Command failed: {e}")
-        if e.stdout:
-            print(f"STDOUT: {e.stdout}")
-        if e.stderr:
-            print(f"STDERR: {e.stderr}")
+        if quiet:
+            completed = subprocess.run(
+                argv,
+                cwd=cwd,
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
+            )
+            if completed.returncode != 0 and completed.stderr:
+                with _OUTPUT_LOCK:
+                    sys.stdout.write(completed.stderr.decode(errors="replace"))
+                    sys.stdout.flush()
+            result = subprocess.CompletedProcess(argv, completed.returncode)
+        else:
+            with subprocess.Popen(
+                argv,
+                cwd=cwd,
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1
+            ) as process:
+                for line in process.stdout:
+                    with _OUTPUT_LOCK:
+                        sys.stdout.write(line)
+                        sys.stdout.flush()
+            result = subprocess.CompletedProcess(argv, process.returncode)
+    except OSError as e:
+        # Missing executable: report it like a shell would (exit code 127)
+        _print(f"Command failed: {e}")
+        return subprocess.CompletedProcess(argv, 127)
+    
+    if check and result.returncode != 0:
+        e = subprocess.CalledProcessError(result.returncode, argv)
+        _print(f"Command failed: {e}")
         return e
+    return result
+
+
+def find_tool(name):
+    """Return the absolute path of a build tool, or None if not on PATH."""
+    if name not in _TOOLS:
+        _TOOLS[name] = shutil.which(name)
+    return _TOOLS[name]
+
+
+def pyinstaller_command():
+    """Return the argv prefix that runs PyInstaller, or None if it is missing.
+
+    Prefers the console script on PATH and falls back to running the module
+    with this interpreter when PyInstaller is installed but its scripts
+    directory is not on PATH (common for --user installs on Windows), so
+    neither case needs a probe process or a reinstall.
+    """
+    pyinstaller = find_tool("pyinstaller")
+    if pyinstaller:
+        return [pyinstaller]
+    
+    import importlib
+    import importlib.util
+    
+    # Pick up a package pip may have just installed into site-packages
+    importlib.invalidate_caches()
+    if importlib.util.find_spec("PyInstaller") is not None:
+        return [sys.executable, "-m", "PyInstaller"]
+    return None
 
 
 def check_dependencies():
     """Check if required dependencies are installed."""
-    print("Checking dependencies...")
+    _print("Checking dependencies...")
     
-    # Check PyInstaller
-    result = run_command("pyinstaller --version", check=False)
-    if result.returncode != 0:
-        print("PyInstaller not found. Installing...")
-        result = run_command("pip install pyinstaller")
+    # Check PyInstaller (PATH and import lookups, no process spawned)
+    if not pyinstaller_command():
+        _print("PyInstaller not found. Installing...")
+        result = run_command(
+            [sys.executable, "-m", "pip", "install", "pyinstaller"], quiet=True
+        )
         if result.returncode != 0:
-            print("Failed to install PyInstaller")
+            _print("Failed to install PyInstaller")
             return False
+        # Look it up again now that it is installed
+        _TOOLS.pop("pyinstaller", None)
     else:
-        print("PyInstaller found")
+        _print("PyInstaller found")
     
     # Check NSIS (optional, will warn if not found)
-    result = run_command("makensis /VERSION", check=False)
-    if result.returncode != 0:
-        print("NSIS not found. Please install NSIS to create the installer.")
-        print("   Download from: https://nsis.sourceforge.io/Download")
+    if not find_tool("makensis"):
+        _print("NSIS not found. Please install NSIS to create the installer.")
+        _print("   Download from: https://nsis.sourceforge.io/Download")
         return False
     else:
-        print("NSIS found")
+        _print("NSIS found")
         return True
 
 
+def _remove_tree(path):
+    """Delete a directory tree, tolerating it having already disappeared."""
+    try:
+        shutil.rmtree(path)
+    except FileNotFoundError:
+        pass
+    return path
+
+
 def clean_build_directories():
     """Clean previous build artifacts."""
-    print("Cleaning build directories...")
-    
-    dirs_to_clean = ["build", "dist", "__pycache__"]
-    for dir_name in dirs_to_clean:
-        if os.path.exists(dir_name):
-            shutil.rmtree(dir_name)
-            print(f"   Removed {dir_name}")
+    _print("Cleaning build directories...")
+    
+    from concurrent.futures import ThreadPoolExecutor
+    
+    # One directory listing finds both the build trees and the .spec files
+    dirs_to_clean = []
+    spec_files = []
+    with os.scandir(".") as it:
+        for entry in it:
+            if entry.name in ("build", "dist", "__pycache__"):
+                if entry.is_dir(follow_symlinks=False):
+                    dirs_to_clean.append(entry.name)
+            elif entry.name.endswith(".spec") and entry.is_file():
+                spec_files.append(entry.name)
+    
+    # Removal is unlink-bound I/O, so the trees are deleted concurrently
+    if dirs_to_clean:
+        with ThreadPoolExecutor(max_workers=len(dirs_to_clean)) as executor:
+            for dir_name in executor.map(_remove_tree, dirs_to_clean):
+                _print(f"   Removed {dir_name}")
     
     # Clean .spec files
-    for spec_file in Path(".").glob("*.spec"):
-        spec_file.unlink()
-        print(f"   Removed {spec_file}")
+    for spec_file in spec_files:
+        os.unlink(spec_file)
+        _print(f"   Removed {spec_file}")
+
+
+def _iter_input_files(path):
+    """Yield the files under path (or path itself) in a stable order."""
+    if os.path.isfile(path):
+        yield path
+        return
+    with os.scandir(path) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name != "__pycache__":
+                yield from _iter_input_files(entry.path)
+        elif entry.is_file() and not entry.name.endswith((".pyc", ".pyo")):
+            yield entry.path
+
+
+def _compute_input_hash():
+    """Fingerprint the build inputs by path and content.
+
+    File contents are hashed rather than mtimes, so a fresh checkout of
+    unchanged sources still matches the previous build.
+    """
+    import hashlib
+    
+    digest = hashlib.blake2b(digest_size=32)
+    digest.update(b"onefile" if BUILD_ONEFILE else b"onedir")
+    for root in FINGERPRINT_INPUTS:
+        if not os.path.exists(root):
+            continue
+        for path in _iter_input_files(root):
+            file_digest = hashlib.blake2b(digest_size=32)
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    file_digest.update(chunk)
+            digest.update(path.replace(os.sep, "/").encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(file_digest.digest())
+    return digest.hexdigest()
+
+
+def _read_fingerprint():
+    """Return the input hash recorded by the last successful build, if any."""
+    try:
+        with open(FINGERPRINT_PATH, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
 
 
 def build_executable():
     """Build the PyInstaller executable."""
-    print("Building executable with PyInstaller...")
+    import tempfile
+    
+    _print("Building executable with PyInstaller...")
+    
+    # Skip PyInstaller entirely when no build input changed since the last build
+    fingerprint = _compute_input_hash()
+    if os.path.exists(EXECUTABLE_PATH) and _read_fingerprint() == fingerprint:
+        _print("Executable up-to-date, skipping PyInstaller")
+        return True
+    
+    pyinstaller = pyinstaller_command() or ["pyinstaller"]
+    
+    # PyInstaller has no parallel-compile switch, but a private config/cache
+    # directory per build lets several builds run side by side on one agent
+    # without corrupting each other's bootloader/UPX cache
+    env = dict(os.environ)
+    env.setdefault(
+        "PYINSTALLER_CONFIG_DIR",
+        os.path.join(tempfile.gettempdir(), f"pyi-{os.getpid()}"),
+    )
     
     # Use the existing PyInstaller spec if available
     spec_file = "OCRInvoiceParser.spec"
     if os.path.exists(spec_file):
-        print(f"Using existing spec file: {spec_file}")
-        result = run_command(f"pyinstaller {spec_file}")
+        _print(f"Using existing spec file: {spec_file}")
+        result = run_command([*pyinstaller, spec_file], env=env)
     else:
-        print("Creating new PyInstaller build...")
-        result = run_command(
-            "pyinstaller --onefile --windowed --name OCRInvoiceParser "
-            "--add-data 'config;config' --add-data 'docs;docs' "
-            "src/ocrinvoice/gui/ocr_main_window.py"
-        )
+        _print("Creating new PyInstaller build...")
+        result = run_command([
+            *pyinstaller, "--onefile" if BUILD_ONEFILE else "--onedir", "--windowed", "--name", "OCRInvoiceParser",
+            "--add-data", "config;config", "--add-data", "docs;docs",
+            "src/ocrinvoice/gui/ocr_main_window.py",
+        ], env=env)
     
     if result.returncode != 0:
-        print("PyInstaller build failed")
+        _print("PyInstaller build failed")
         return False
     
-    print("Executable built successfully")
+    with open(FINGERPRINT_PATH, "w", encoding="utf-8") as f:
+        f.write(fingerprint)
+    
+    _print("Executable built successfully")
     return True
 
 
 def prepare_tesseract():
     """Prepare Tesseract OCR for inclusion in the installer."""
-    print("Preparing Tesseract OCR...")
+    _print("Preparing Tesseract OCR...")
     
-    installer_dir = Path("installer")
-    tesseract_dir = installer_dir / "tesseract"
-    
-    # Check if Tesseract is already prepared
-    if tesseract_dir.exists() and (tesseract_dir / "tesseract-installer.exe").exists():
-        print("   Tesseract OCR already prepared")
-        return True
-    
-    # Try to run the Tesseract download script
+    # Always run the Tesseract download script: it revalidates a cached
+    # installer with a conditional request and only downloads it if it changed
     try:
-        result = run_command("python installer/download_tesseract.py", check=False)
+        result = run_command(
+            [sys.executable, "installer/download_tesseract.py"], check=False
+        )
         if result and result.returncode == 0:
-            print("   Tesseract OCR prepared successfully")
+            _print("   Tesseract OCR prepared successfully")
             return True
         else:
-            print("   Warning: Could not prepare Tesseract OCR automatically")
-            print("   The installer will prompt users to install Tesseract manually")
+            _print("   Warning: Could not prepare Tesseract OCR automatically")
+            _print("   The installer will prompt users to install Tesseract manually")
             return False
     except Exception as e:
-        print(f"   Warning: Error preparing Tesseract OCR: {e}")
-        print("   The installer will prompt users to install Tesseract manually")
+        _print(f"   Warning: Error preparing Tesseract OCR: {e}")
+        _print("   The installer will prompt users to install Tesseract manually")
         return False
 
 
+def _scan_installer_assets():
+    """Return the names of the files in the installer directory.
+
+    One directory listing answers every asset check of a step instead of
+    stat-ing each asset separately. It is not cached: assets may be created
+    while the build runs.
+    """
+    installer_dir = os.path.dirname(os.path.abspath(__file__))
+    with os.scandir(installer_dir) as it:
+        return frozenset(entry.name for entry in it if entry.is_file())
+
+
 def create_installer_assets():
     """Create installer assets (icons, images, etc.)."""
-    print("Creating installer assets...")
-    
-    installer_dir = Path("installer")
-    installer_dir.mkdir(exist_ok=True)
+    _print("Creating installer assets...")
     
     # Create placeholder files if they don't exist
     assets = {
@@ -149,15 +340,15 @@ def create_installer_assets():
         "welcome.bmp": "Welcome page image (164x314)",
     }
     
+    installer_files = _scan_installer_assets()
     for asset, description in assets.items():
-        asset_path = installer_dir / asset
-        if not asset_path.exists():
-            print(f"   {asset} not found - {description}")
-            print(f"      Please create this file for a complete installer")
+        if asset not in installer_files:
+            _print(f"   {asset} not found - {description}")
+            _print(f"      Please create this file for a complete installer")
     
     # Create LICENSE file if it doesn't exist
     if not os.path.exists("LICENSE"):
-        print("   Creating placeholder LICENSE file...")
+        _print("   Creating placeholder LICENSE file...")
         with open("LICENSE", "w") as f:
             f.write("OCR Invoice Parser License\n\n")
             f.write("This software is provided as-is for educational and personal use.\n")
@@ -166,99 +357,114 @@ def create_installer_assets():
 
 def build_installer():
     """Build the NSIS installer."""
-    print("Building NSIS installer...")
+    _print("Building NSIS installer...")
     
     # Check if NSIS is available
-    result = run_command("makensis /VERSION", check=False)
-    if result.returncode != 0:
-        print("NSIS not available. Skipping installer creation.")
+    makensis = find_tool("makensis")
+    if not makensis:
+        _print("NSIS not available. Skipping installer creation.")
         return False
     
     # Before running NSIS, check for setup.ico
     nsis_icon_path = os.path.abspath(os.path.join(os.path.dirname(__file__), 'setup.ico'))
-    print(f"Checking for NSIS icon at: {nsis_icon_path}")
-    if not os.path.exists(nsis_icon_path):
-        print(f"ERROR: Required NSIS icon file not found: {nsis_icon_path}")
-        print("Please add a valid setup.ico file to the installer directory.")
+    _print(f"Checking for NSIS icon at: {nsis_icon_path}")
+    if 'setup.ico' not in _scan_installer_assets():
+        _print(f"ERROR: Required NSIS icon file not found: {nsis_icon_path}")
+        _print("Please add a valid setup.ico file to the installer directory.")
         sys.exit(1)
     else:
-        print("NSIS icon file found.")
+        _print("NSIS icon file found.")
 
-    # Build the installer
-    result = run_command("makensis installer/installer.nsi")
+    # Build the installer; /V2 keeps warnings and errors but drops the
+    # per-file log, which is a lot of console I/O for a large bundle
+    argv = [makensis, "/V2"]
+    if BUILD_ONEFILE:
+        argv.append("/DONEFILE")
+    argv.append("installer/installer.nsi")
+    result = run_command(argv)
     if result.returncode != 0:
-        print("NSIS installer build failed")
+        _print("NSIS installer build failed")
         return False
     
-    print("Installer built successfully")
+    _print("Installer built successfully")
     return True
 
 
 def update_version_in_installer(version):
     """Update version in the installer script."""
-    print(f"Updating installer version to {version}...")
+    import mmap
+    
+    _print(f"Updating installer version to {version}...")
     
     installer_script = Path("installer/installer.nsi")
     if not installer_script.exists():
-        print("Installer script not found")
+        _print("Installer script not found")
         return False
     
     # Clean version by removing 'v' prefix if present
     clean_version = version.lstrip('v')
-    print(f"Cleaned version: {clean_version}")
-    
-    # Read the script
-    with open(installer_script, "r", encoding="utf-8") as f:
-        content = f.read()
-    
-    # Update version
-    import re
-    content = re.sub(
-        r'!define APP_VERSION "[\d.]+"',
-        f'!define APP_VERSION "{clean_version}"',
-        content
-    )
-    
-    # Update VIProductVersion to use correct 4-number format
-    content = re.sub(
-        r'VIProductVersion "[\d.]+"',
-        f'VIProductVersion "{clean_version}.0"',
-        content
-    )
-    
-    # Write back
-    with open(installer_script, "w", encoding="utf-8") as f:
-        f.write(content)
+    _print(f"Cleaned version: {clean_version}")
+    
+    app_version = f'!define APP_VERSION "{clean_version}"'.encode()
+    # VIProductVersion needs the 4-number format
+    vi_product_version = f'VIProductVersion "{clean_version}.0"'.encode()
+    
+    # Substitute straight off a memory map of the script and only write back
+    # when a define actually changed, so idempotent rebuilds do no disk I/O
+    with open(installer_script, "r+b") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            updated = _VI_PRODUCT_VERSION_RE.sub(
+                vi_product_version, _APP_VERSION_RE.sub(app_version, mm)
+            )
+            unchanged = updated == mm[:]
+        if unchanged:
+            _print(f"Installer version already {clean_version}")
+            return True
+        f.seek(0)
+        f.write(updated)
+        f.truncate()
     
-    print(f"Updated installer version to {clean_version}")
+    _print(f"Updated installer version to {clean_version}")
     return True
 
 
+@lru_cache(maxsize=1)
 def get_current_version():
-    """Get current version from pyproject.toml."""
+    """Get current version from pyproject.toml (read once per run)."""
     try:
-        import toml
-        with open("pyproject.toml", "r", encoding="utf-8") as f:
-            data = toml.load(f)
-        version = data["project"]["version"]
-        print(f"✅ Read version from pyproject.toml: {version}")
-        return version
+        import tomllib  # Python 3.11+ stdlib, no third-party package needed
     except ImportError:
-        print("⚠️  toml package not found, trying alternative methods...")
+        try:
+            import tomli as tomllib
+        except ImportError:
+            tomllib = None
+    
+    if tomllib is not None:
+        try:
+            with open("pyproject.toml", "rb") as f:
+                data = tomllib.load(f)
+            version = data["project"]["version"]
+            print(f"✅ Read version from pyproject.toml: {version}")
+            return version
+        except Exception as e:
+            print(f"⚠️  Could not read version from pyproject.toml: {e}")
+    else:
+        print("⚠️  tomllib/tomli not available, trying alternative methods...")
         # Try reading with regex as fallback
         try:
-            import re
-            with open("pyproject.toml", "r", encoding="utf-8") as f:
-                content = f.read()
-            match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', content)
-            if match:
-                version = match.group(1)
+            import mmap
+            
+            # Search the mapped file directly and decode only the match
+            with open("pyproject.toml", "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mm:
+                match = re.search(rb'version\s*=\s*["\']([^"\']+)["\']', mm)
+                version = match.group(1).decode("utf-8") if match else None
+            if version:
                 print(f"✅ Read version with regex: {version}")
                 return version
         except Exception as e:
             print(f"⚠️  Regex fallback failed: {e}")
-    except Exception as e:
-        print(f"⚠️  Could not read version from pyproject.toml: {e}")
     
     print("❌ Using default version: 1.3.0")
     return "1.3.0"  # Default version
@@ -273,6 +479,8 @@ def main():
     
     args = parser.parse_args()
     
+    from concurrent.futures import ThreadPoolExecutor
+    
     print("Windows Installer Build Script")
     print("=" * 50)
     
@@ -284,20 +492,32 @@ def main():
     if args.clean:
         clean_build_directories()
     
-    # Check dependencies
-    nsis_available = check_dependencies()
-    
-    # Create installer assets
-    create_installer_assets()
-    
-    # Prepare Tesseract OCR
-    prepare_tesseract()
-    
-    # Update version in installer
-    update_version_in_installer(version)
-    
-    # Build executable
-    if not build_executable():
+    # The preparation steps are independent and mostly I/O-bound (tool lookup,
+    # Tesseract download, asset and script writes), so run them concurrently
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # Check dependencies
+        deps_future = executor.submit(check_dependencies)
+        # Create installer assets
+        assets_future = executor.submit(create_installer_assets)
+        # Prepare Tesseract OCR
+        tesseract_future = executor.submit(prepare_tesseract)
+        # Update version in installer
+        version_future = executor.submit(update_version_in_installer, version)
+        
+        nsis_available = deps_future.result()
+        
+        # PyInstaller only needs the dependency check (which may install it),
+        # so start the executable build while the Tesseract download and the
+        # other preparation steps are still running
+        executable_future = executor.submit(build_executable)
+        
+        for future in (assets_future, tesseract_future, version_future):
+            future.result()
+        
+        executable_built = executable_future.result()
+    
+    # Exit only once the pool is closed, not while other steps still run
+    if not executable_built:
         print("Build failed")
         sys.exit(1)
     
@@ -310,12 +530,12 @@ def main():
         print("Skipping installer creation")
     
     print("\nBuild completed successfully!")
-    print(f"Executable: dist/OCRInvoiceParser.exe")
+    print(f"Executable: {EXECUTABLE_PATH}")
     if nsis_available and not args.skip_nsis:
         print(f"Installer: OCRInvoiceParser-Windows-Setup-{version}.exe")
     
     print("\nNext steps:")
-    print("1. Test the executable: dist/OCRInvoiceParser.exe")
+    print(f"1. Test the executable: {EXECUTABLE_PATH}")
     if nsis_available and not args.skip_nsis:
         print("2. Test the installer: OCRInvoiceParser-Windows-Setup-{version}.exe")
     print("3. Distribute the files to users")
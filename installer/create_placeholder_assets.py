@@ -4,11 +4,49 @@ Create placeholder assets for the NSIS installer.
 This generates basic icon and image files to prevent NSIS build failures.
 """
 
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
+import io
+import numpy as np
 import os
 
-def create_application_icon():
-    """Create a simple application icon."""
+@lru_cache(maxsize=None)
+def load_font(size=16):
+    """Load the asset font once, falling back to PIL's default font."""
+    try:
+        # Try to use a system font
+        return ImageFont.truetype("arial.ttf", size)
+    except:
+        # Fallback to default font
+        return ImageFont.load_default()
+
+def save_image(image, path, **save_options):
+    """Save an image atomically, leaving an identical file untouched.
+
+    The image is encoded in memory first; if the bytes differ from the file on
+    disk they are written to a temporary file that replaces it with os.replace,
+    so an interrupted or failed save never leaves a corrupt asset behind.
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    buffer = io.BytesIO()
+    image.save(buffer, **save_options)
+    data = buffer.getvalue()
+    
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+def create_document_icon():
+    """Draw the 32x32 document icon shared by the application and setup icons."""
     size = (32, 32)
     image = Image.new('RGBA', size, (0, 120, 215, 255))  # Windows blue background
     
@@ -25,41 +63,46 @@ def create_application_icon():
     # Draw a fold corner
     draw.polygon([(20, 4), (28, 4), (28, 12), (20, 4)], fill=(220, 220, 220, 255))
     
+    return image
+
+def create_application_icon():
+    """Create a simple application icon."""
+    image = create_document_icon()
+    
     icon_path = os.path.join(os.path.dirname(__file__), 'icon.ico')
-    image.save(icon_path, format='ICO', sizes=[(32, 32)])
-    print(f"Created application icon: {icon_path}")
+    if save_image(image, icon_path, format='ICO', sizes=[(32, 32)]):
+        print(f"Created application icon: {icon_path}")
+    else:
+        print(f"Application icon up-to-date: {icon_path}")
 
 def create_welcome_image():
     """Create a simple welcome page image."""
-    size = (164, 314)
-    image = Image.new('RGB', size, (255, 255, 255))  # White background
-    
-    draw = ImageDraw.Draw(image)
+    # Fill the shapes as array slices, only the text goes through ImageDraw
+    pixels = np.full((314, 164, 3), 255, dtype=np.uint8)  # White background
     
     # Draw a border
-    draw.rectangle([0, 0, 163, 313], outline=(200, 200, 200), width=2)
+    pixels[:2, :] = pixels[-2:, :] = (200, 200, 200)
+    pixels[:, :2] = pixels[:, -2:] = (200, 200, 200)
     
     # Draw a simple logo area
-    draw.rectangle([20, 20, 144, 80], fill=(0, 120, 215), outline=(0, 100, 180), width=2)
+    pixels[20:81, 20:145] = (0, 100, 180)
+    pixels[22:79, 22:143] = (0, 120, 215)
+    
+    image = Image.fromarray(pixels, 'RGB')
+    draw = ImageDraw.Draw(image)
     
     # Add some text
-    try:
-        # Try to use a system font
-        font = ImageFont.truetype("arial.ttf", 16)
-    except:
-        # Fallback to default font
-        font = ImageFont.load_default()
+    font = load_font()
+    # Multiline spacing is added to the height of "A"; keep a 20px line pitch
+    spacing = 20 - font.getbbox("A")[3]
     
     # Draw title
-    draw.text((82, 35), "OCR", fill=(255, 255, 255), anchor="mm", font=font)
-    draw.text((82, 55), "Invoice", fill=(255, 255, 255), anchor="mm", font=font)
-    draw.text((82, 75), "Parser", fill=(255, 255, 255), anchor="mm", font=font)
+    draw.multiline_text((82, 55), "OCR\nInvoice\nParser", fill=(255, 255, 255),
+                        anchor="mm", align="center", font=font, spacing=spacing)
     
     # Draw some descriptive text
-    draw.text((82, 120), "Welcome to", fill=(0, 0, 0), anchor="mm", font=font)
-    draw.text((82, 140), "OCR Invoice Parser", fill=(0, 0, 0), anchor="mm", font=font)
-    draw.text((82, 160), "Professional PDF", fill=(0, 0, 0), anchor="mm", font=font)
-    draw.text((82, 180), "Invoice Processing", fill=(0, 0, 0), anchor="mm", font=font)
+    draw.multiline_text((82, 150), "Welcome to\nOCR Invoice Parser\nProfessional PDF\nInvoice Processing",
+                        fill=(0, 0, 0), anchor="mm", align="center", font=font, spacing=spacing)
     
     # Draw some features
     features = [
@@ -70,14 +113,14 @@ def create_welcome_image():
         "• Professional GUI"
     ]
     
-    y_start = 220
-    for i, feature in enumerate(features):
-        y = y_start + i * 20
-        draw.text((20, y), feature, fill=(0, 0, 0), font=font)
+    draw.multiline_text((20, 220), "\n".join(features), fill=(0, 0, 0),
+                        font=font, spacing=spacing)
     
     image_path = os.path.join(os.path.dirname(__file__), 'welcome.bmp')
-    image.save(image_path, format='BMP')
-    print(f"Created welcome image: {image_path}")
+    if save_image(image, image_path, format='BMP'):
+        print(f"Created welcome image: {image_path}")
+    else:
+        print(f"Welcome image up-to-date: {image_path}")
 
 def main():
     """Create all placeholder assets."""
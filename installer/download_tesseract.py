@@ -3,22 +3,42 @@
 Download Tesseract OCR for Windows and prepare it for inclusion in the installer.
 """
 
+import hashlib
+import json
 import os
 import sys
+import urllib.error
 import urllib.request
 import zipfile
 import tempfile
 import shutil
 from pathlib import Path
 
+# Tesseract download URL (latest stable version for Windows)
+TESSERACT_URL = "https://digi.bib.uni-mannheim.de/tesseract/tesseract-ocr-w64-setup-5.3.3.20231005.exe"
+
+# Pinned SHA-256 of the installer; downloads that do not match are rejected.
+# Left unset unless provided through the environment.
+EXPECTED_SHA256 = os.environ.get("TESSERACT_SHA256")
+
+
+def file_sha256(path):
+    """Return the hex SHA-256 digest of a file, read in 1 MB chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 
 def download_tesseract():
-    """Download Tesseract OCR for Windows."""
+    """Download Tesseract OCR for Windows.
+
+    The request is conditional on the ETag/Last-Modified of the cached copy,
+    so an unchanged upstream installer is not downloaded again.
+    """
     print("Downloading Tesseract OCR for Windows...")
     
-    # Tesseract download URL (latest stable version for Windows)
-    tesseract_url = "https://digi.bib.uni-mannheim.de/tesseract/tesseract-ocr-w64-setup-5.3.3.20231005.exe"
-    
     # Create installer directory if it doesn't exist
     installer_dir = Path("installer")
     installer_dir.mkdir(exist_ok=True)
@@ -27,27 +47,90 @@ def download_tesseract():
     tesseract_dir = installer_dir / "tesseract"
     tesseract_dir.mkdir(exist_ok=True)
     
-    # Download path
+    # Download path, and the sidecar holding its HTTP validators and hash
     installer_path = tesseract_dir / "tesseract-installer.exe"
-    
+    etag_path = tesseract_dir / "tesseract-installer.etag"
+    
+    cached = {}
+    if installer_path.exists() and etag_path.exists():
+        try:
+            cached = json.loads(etag_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            cached = {}
+    
+    request = urllib.request.Request(TESSERACT_URL)
+    if cached.get("etag"):
+        request.add_header("If-None-Match", cached["etag"])
+    if cached.get("last_modified"):
+        request.add_header("If-Modified-Since", cached["last_modified"])
+    
+    tmp_path = None
     try:
-        print(f"Downloading from: {tesseract_url}")
+        print(f"Downloading from: {TESSERACT_URL}")
         print(f"Downloading to: {installer_path}")
         
-        # Download the installer
-        urllib.request.urlretrieve(tesseract_url, installer_path)
+        try:
+            response = urllib.request.urlopen(request)
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                raise
+            if file_sha256(installer_path) == cached.get("sha256"):
+                print(f"Tesseract installer unchanged upstream, using cached copy: {installer_path}")
+                return str(installer_path)
+            # The cached file is corrupt, fetch it again unconditionally
+            print("Cached Tesseract installer is corrupt, downloading again...")
+            response = urllib.request.urlopen(TESSERACT_URL)
         
-        if installer_path.exists():
-            print(f"Download completed: {installer_path}")
-            print(f"File size: {installer_path.stat().st_size / (1024*1024):.1f} MB")
-            return str(installer_path)
-        else:
-            print("Download failed: file not found")
+        # Download to a temporary file in 1 MB chunks, hashing as we go, and
+        # only move it into place once it is complete and verified, so a
+        # partial download never replaces the cache
+        with response:
+            total = int(response.headers.get("Content-Length") or 0)
+            digest = hashlib.sha256()
+            downloaded = 0
+            with tempfile.NamedTemporaryFile(dir=tesseract_dir, delete=False) as tmp:
+                tmp_path = tmp.name
+                while chunk := response.read(1 << 20):
+                    tmp.write(chunk)
+                    digest.update(chunk)
+                    downloaded += len(chunk)
+                    if total:
+                        print(f"\r   {downloaded / total:.0%}", end="", flush=True)
+            if total:
+                print()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+        
+        if total and downloaded != total:
+            print(f"Download failed: incomplete ({downloaded} of {total} bytes)")
+            return None
+        
+        sha256 = digest.hexdigest()
+        if EXPECTED_SHA256 and sha256 != EXPECTED_SHA256.lower():
+            print(f"Download failed: SHA-256 mismatch (got {sha256})")
             return None
+        
+        os.replace(tmp_path, installer_path)
+        tmp_path = None
+        etag_path.write_text(
+            json.dumps({"etag": etag, "last_modified": last_modified, "sha256": sha256}),
+            encoding="utf-8",
+        )
+        
+        print(f"Download completed: {installer_path}")
+        print(f"File size: {installer_path.stat().st_size / (1024*1024):.1f} MB")
+        return str(installer_path)
             
     except Exception as e:
         print(f"Download failed: {e}")
+        # Offline or upstream unavailable: fall back to a previously cached copy
+        if installer_path.exists():
+            print(f"Using previously downloaded installer: {installer_path}")
+            return str(installer_path)
         return None
+    finally:
+        if tmp_path is not None:
+            os.unlink(tmp_path)
 
 
 def create_tesseract_section():
@@ -108,8 +191,17 @@ SectionEnd
 """
     
     script_path = Path("installer") / "tesseract-installer.nsi"
-    with open(script_path, "w") as f:
-        f.write(tesseract_script)
+    content = tesseract_script.encode()
+    
+    # Leave an identical script untouched so its mtime does not trigger a rebuild
+    if script_path.exists() and script_path.read_bytes() == content:
+        print(f"Tesseract NSIS script up-to-date: {script_path}")
+        return str(script_path)
+    
+    # Write through a temporary file so the script is replaced atomically
+    with tempfile.NamedTemporaryFile(dir=script_path.parent, delete=False) as tmp:
+        tmp.write(content)
+    os.replace(tmp.name, script_path)
     
     print(f"Created Tesseract NSIS script: {script_path}")
     return str(script_path)
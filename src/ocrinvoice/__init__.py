@@ -9,11 +9,34 @@ __version__ = "1.0.0"
 __author__ = "Invoice OCR Parser Team"
 __email__ = "support@ocrinvoice.com"
 
-# Import main classes for easy access
-from .core.ocr_engine import OCREngine
-from .parsers.invoice_parser import InvoiceParser
-from .parsers.credit_card_parser import CreditCardBillParser
-from .parsers.date_extractor import DateExtractor
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core.ocr_engine import OCREngine
+    from .parsers.invoice_parser import InvoiceParser
+    from .parsers.credit_card_parser import CreditCardBillParser
+    from .parsers.date_extractor import DateExtractor
+
+# Exports are imported on first access so that using a light submodule such
+# as ocrinvoice.business.database does not load OpenCV, Tesseract and the
+# PDF libraries
+_LAZY_EXPORTS = {
+    "OCREngine": ".core.ocr_engine",
+    "InvoiceParser": ".parsers.invoice_parser",
+    "CreditCardBillParser": ".parsers.credit_card_parser",
+    "DateExtractor": ".parsers.date_extractor",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "OCREngine",
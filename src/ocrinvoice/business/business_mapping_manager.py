@@ -1,8 +1,12 @@
 import json
 import os
-from typing import Optional, Tuple, Dict, List
+import re
+import unicodedata
+from typing import Optional, Pattern, Tuple, Dict, List
 from pathlib import Path
 
+from ocrinvoice.utils.substring_index import SubstringIndex
+
 # Import FuzzyMatcher from the utils module
 try:
     from ocrinvoice.utils.fuzzy_matcher import FuzzyMatcher
@@ -14,15 +18,36 @@ except ImportError:
             target: str, candidates: List[str], threshold: float = 0.3
         ) -> Optional[str]:
             # Simple fallback implementation
+            target_lower = target.lower()
             for candidate in candidates:
-                if (
-                    target.lower() in candidate.lower()
-                    or candidate.lower() in target.lower()
-                ):
+                candidate_lower = candidate.lower()
+                if target_lower in candidate_lower or candidate_lower in target_lower:
                     return candidate
             return None
 
 
+def _normalize(s: str) -> str:
+    """Lowercase, normalize unicode and collapse whitespace."""
+    s = s.lower()
+    s = unicodedata.normalize("NFKC", s)
+    s = " ".join(s.split())
+    return s
+
+
+def _spaced_variants(s: str) -> List[str]:
+    """Create variants of a string with different spacing patterns for OCR artifacts."""
+    variants = [s]
+    # Remove all spaces
+    no_spaces = s.replace(" ", "")
+    if no_spaces != s:
+        variants.append(no_spaces)
+    # Add spaces between each character (OCR artifact)
+    spaced = " ".join(no_spaces)
+    if spaced != s:
+        variants.append(spaced)
+    return variants
+
+
 class BusinessMappingManager:
     """
     Manages business name mappings for invoice OCR extraction.
@@ -49,6 +74,9 @@ class BusinessMappingManager:
         # Validate that all mappings resolve to a business name
         self._validate_mappings()
 
+        # Build case-insensitive lookup indexes
+        self._rebuild_lookup_index()
+
     def _resolve_mapping_file_path(self, mapping_file: Optional[str]) -> str:
         """
         Resolve the mapping file path using the same logic as the config system.
@@ -154,6 +182,47 @@ class BusinessMappingManager:
         for business_name in self.config.get("fuzzy_candidates", []):
             check_name(business_name)
 
+    def _rebuild_lookup_index(self) -> None:
+        """Rebuild every index derived from the config.
+
+        Covers the lowercased business name index, the exact and partial
+        substring indexes and the indicator patterns. Called from
+        _save_config() so no index outlives a config change.
+        """
+        self._business_name_index: Dict[str, str] = {
+            business.lower(): business for business in self.business_names
+        }
+
+        # Mapping needles are normalized once here rather than on every
+        # find_business_match call
+        self._exact_index = SubstringIndex(
+            [
+                (_spaced_variants(mapping.lower()), business_name)
+                for mapping, business_name in self.config.get(
+                    "exact_matches", {}
+                ).items()
+            ]
+        )
+        self._partial_index = SubstringIndex(
+            [
+                (_spaced_variants(_normalize(mapping)), business_name)
+                for mapping, business_name in self.config.get(
+                    "partial_matches", {}
+                ).items()
+            ]
+        )
+        # One alternation per business replaces a substring test per indicator
+        self._indicator_index: List[Tuple[str, Pattern[str]]] = [
+            (
+                business_name,
+                re.compile(
+                    "|".join(re.escape(indicator.lower()) for indicator in indicators)
+                ),
+            )
+            for business_name, indicators in self.config.get("indicators", {}).items()
+            if indicators
+        ]
+
     def get_business_names(self) -> List[str]:
         """Return the list of business names."""
         return sorted(list(self.business_names))
@@ -251,12 +320,8 @@ class BusinessMappingManager:
         """Check if a name is in the business names list (case-insensitive)."""
         if not name:
             return False
-        # Normalize both the input name and business names to lowercase for case-insensitive comparison
-        name_normalized = name.lower()
-        business_names_normalized = {
-            business.lower() for business in self.business_names
-        }
-        return name_normalized in business_names_normalized
+        # Look up the lowercased name in the prebuilt case-insensitive index
+        return name.lower() in self._business_name_index
 
     def find_business_match(self, text: str) -> Optional[Tuple[str, str, float]]:
         """
@@ -311,117 +376,48 @@ class BusinessMappingManager:
 
     def _find_exact_match(self, text: str) -> Optional[Tuple[str, str, float]]:
         """Find exact string matches (case-insensitive, substring detection)."""
-        exact_matches = self.config.get("exact_matches", {})
-
         # Normalize the input text (simple lowercase and whitespace normalization)
         text_norm = text.lower().strip()
 
-        def create_spaced_variants(s: str) -> List[str]:
-            """Create variants of a string with different spacing patterns for OCR artifacts."""
-            variants = [s]
-            # Remove all spaces
-            no_spaces = s.replace(" ", "")
-            if no_spaces != s:
-                variants.append(no_spaces)
-            # Add spaces between each character (OCR artifact)
-            spaced = " ".join(no_spaces)
-            if spaced != s:
-                variants.append(spaced)
-            return variants
-
-        for mapping, business_name in exact_matches.items():
-            mapping_lower = mapping.lower()
-            
-            # Check direct match
-            if mapping_lower in text_norm:
-                confidence = self.config.get("confidence_weights", {}).get(
-                    "exact_match", 1.0
-                )
-                return (business_name, "exact_match", confidence)
-            
-            # Check spaced variants for OCR artifacts
-            mapping_variants = create_spaced_variants(mapping_lower)
-            for variant in mapping_variants:
-                if variant in text_norm:
-                    confidence = self.config.get("confidence_weights", {}).get(
-                        "exact_match", 1.0
-                    )
-                    return (business_name, "exact_match", confidence)
+        business_name = self._exact_index.first_match(text_norm)
+        if business_name is not None:
+            confidence = self.config.get("confidence_weights", {}).get(
+                "exact_match", 1.0
+            )
+            return (business_name, "exact_match", confidence)
 
         return None
 
     def _find_partial_match(self, text: str) -> Optional[Tuple[str, str, float]]:
         """Find partial substring matches (case-insensitive, robust to whitespace and Unicode)."""
-        import unicodedata
-
-        def normalize(s: str) -> str:
-            # Lowercase, strip, normalize unicode, collapse whitespace
-            s = s.lower()
-            s = unicodedata.normalize("NFKC", s)
-            s = " ".join(s.split())
-            return s
-
-        def create_spaced_variants(s: str) -> List[str]:
-            """Create variants of a string with different spacing patterns for OCR artifacts."""
-            variants = [s]
-            # Remove all spaces
-            no_spaces = s.replace(" ", "")
-            if no_spaces != s:
-                variants.append(no_spaces)
-            # Add spaces between each character (OCR artifact)
-            spaced = " ".join(no_spaces)
-            if spaced != s:
-                variants.append(spaced)
-            return variants
-
         partial_matches = self.config.get("partial_matches", {})
         print("[DEBUG] BusinessMappingManager: Checking partial matches...")
         print(
             f"[DEBUG] BusinessMappingManager: Available partial matches: {list(partial_matches.keys())}"
         )
         print(f"[DEBUG] BusinessMappingManager: Text repr: {repr(text)}")
-        text_norm = normalize(text)
+        text_norm = _normalize(text)
         print(f"[DEBUG] BusinessMappingManager: Normalized text: {repr(text_norm)}")
 
-        for mapping, business_name in partial_matches.items():
-            mapping_norm = normalize(mapping)
+        business_name = self._partial_index.first_match(text_norm)
+        if business_name is not None:
             print(
-                f"[DEBUG] BusinessMappingManager: Checking if mapping '{mapping}' (norm: '{mapping_norm}') is in text (norm)..."
+                f"[DEBUG] BusinessMappingManager: Found partial match for '{business_name}' in text (norm)"
             )
-            
-            # Check direct match
-            if mapping_norm in text_norm:
-                print(
-                    f"[DEBUG] BusinessMappingManager: Found partial match! '{mapping_norm}' is in text (norm)"
-                )
-                confidence = self.config.get("confidence_weights", {}).get(
-                    "partial_match", 0.8
-                )
-                return (business_name, "partial_match", confidence)
-            
-            # Check spaced variants for OCR artifacts
-            mapping_variants = create_spaced_variants(mapping_norm)
-            for variant in mapping_variants:
-                if variant in text_norm:
-                    print(
-                        f"[DEBUG] BusinessMappingManager: Found partial match with variant! '{variant}' (from '{mapping_norm}') is in text (norm)"
-                    )
-                    confidence = self.config.get("confidence_weights", {}).get(
-                        "partial_match", 0.8
-                    )
-                    return (business_name, "partial_match", confidence)
+            confidence = self.config.get("confidence_weights", {}).get(
+                "partial_match", 0.8
+            )
+            return (business_name, "partial_match", confidence)
 
         print("[DEBUG] BusinessMappingManager: No partial matches found")
         return None
 
     def _find_fuzzy_match(self, text: str) -> Optional[Tuple[str, str, float]]:
         """Find fuzzy matches using indicators and similarity algorithms (case-insensitive)."""
-        indicators = self.config.get("indicators", {})
-
         # Check if text contains indicators for any business (case-insensitive)
-        for business_name, required_indicators in indicators.items():
+        for business_name, indicator_re in self._indicator_index:
             # Check if any indicator is in the normalized text
-            if any(indicator.lower() in text for indicator in required_indicators):
+            if indicator_re.search(text):
                 # Try fuzzy matching against this business
                 match = FuzzyMatcher.fuzzy_match(
                     target=text, candidates=[business_name], threshold=0.8
@@ -449,13 +445,35 @@ class BusinessMappingManager:
             self.config[match_type][mapping] = business_name
             self._save_config()
 
+    def remove_mapping(self, mapping: str, match_type: str = "exact_matches") -> bool:
+        """
+        Remove a mapping from the configuration.
+
+        Args:
+            mapping: The mapping string to remove
+            match_type: Type of match ("exact_matches" or "partial_matches")
+
+        Returns:
+            True if removed successfully, False if not found
+        """
+        if mapping not in self.config.get(match_type, {}):
+            return False
+        del self.config[match_type][mapping]
+        self._save_config()
+        return True
+
     def _save_config(self) -> None:
-        """Save the current configuration back to the JSON file."""
+        """Save the current configuration and rebuild the lookup indexes.
+
+        Callers that edit ``config`` directly must save through here so the
+        derived indexes never go stale.
+        """
         try:
             with open(self.mapping_file, "w", encoding="utf-8") as f:
                 json.dump(self.config, f, indent=4, ensure_ascii=False)
         except IOError as e:
             print(f"Warning: Could not save mapping file {self.mapping_file}: {e}")
+        self._rebuild_lookup_index()
 
     def reload_config(self) -> None:
         """Reload the configuration from the JSON file."""
@@ -464,6 +482,7 @@ class BusinessMappingManager:
         self.canonical_names = set(self.config.get("canonical_names", []))
         # Validate mappings
         self._validate_mappings()
+        self._rebuild_lookup_index()
 
     def get_all_business_names(self) -> List[str]:
         """Get all unique business names from the configuration."""
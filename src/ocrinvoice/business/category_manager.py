@@ -254,10 +254,11 @@ class CategoryManager:
         """
         categories = self.get_all_categories()
         matching_categories = []
+        pattern_lower = pattern.lower()
         
         for category in categories:
             cra_code = category.get("cra_code", "")
-            if cra_code and pattern.lower() in cra_code.lower():
+            if cra_code and pattern_lower in cra_code.lower():
                 matching_categories.append(category)
         
         return matching_categories
@@ -8,8 +8,15 @@ invoice data storage and retrieval.
 from typing import Dict, List, Any, Optional
 import logging
 import json
+import os
 from pathlib import Path
 
+# Optional faster JSON serializer
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,15 +28,22 @@ class InvoiceDatabase:
     invoice data from various storage backends.
     """
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[str] = None, autosave: bool = True):
         """
         Initialize the invoice database.
 
         Args:
             db_path: Path to database file (optional)
+            autosave: Save after every change. Batch callers can pass False
+                and call flush() once at the end instead of rewriting the
+                whole file per invoice.
         """
         self.db_path = db_path or "invoice_database.json"
+        self.autosave = autosave
         self.data = []
+        self._dirty = False
+        # Invoices by ID, kept in step with self.data so lookups skip the scan
+        self._id_index: Dict[str, Dict[str, Any]] = {}
 
         if Path(self.db_path).exists():
             self.load_database()
@@ -52,7 +66,10 @@ class InvoiceDatabase:
         invoice_data["created_at"] = "2024-01-15T10:00:00Z"  # Placeholder
 
         self.data.append(invoice_data)
-        self.save_database()
+        self._id_index.setdefault(invoice_id, invoice_data)
+        self._dirty = True
+        if self.autosave:
+            self.save_database()
 
         return invoice_id
 
@@ -69,11 +86,7 @@ class InvoiceDatabase:
         # Placeholder implementation
         logger.info(f"Getting invoice: {invoice_id}")
 
-        for invoice in self.data:
-            if invoice.get("id") == invoice_id:
-                return invoice
-
-        return None
+        return self._id_index.get(invoice_id)
 
     def search_invoices(self, criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -120,23 +133,45 @@ class InvoiceDatabase:
         logger.info(f"Loading database from: {self.db_path}")
 
         try:
-            with open(self.db_path, "r") as f:
-                self.data = json.load(f)
+            self.data = json.loads(Path(self.db_path).read_bytes())
         except (FileNotFoundError, json.JSONDecodeError) as e:
             logger.error(f"Error loading database from {self.db_path}: {e}")
             self.data = []
+        self._dirty = False
+        self._rebuild_id_index()
+
+    def _rebuild_id_index(self) -> None:
+        """Rebuild the invoice ID index; the first invoice with an ID wins."""
+        self._id_index = {}
+        for invoice in self.data:
+            self._id_index.setdefault(invoice.get("id"), invoice)
 
     def save_database(self) -> None:
-        """Save database to file."""
-        # Placeholder implementation
+        """Save database to file.
+
+        The data is written as compact JSON to a temporary file that then
+        replaces the database, so readers never see a partly written file.
+        """
         logger.info(f"Saving database to: {self.db_path}")
 
+        if orjson is not None:
+            payload = orjson.dumps(self.data, option=orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(self.data, separators=(",", ":")).encode("utf-8")
+
+        tmp_path = f"{self.db_path}.tmp"
         try:
-            with open(self.db_path, "w") as f:
-                json.dump(self.data, f, indent=2)
+            Path(tmp_path).write_bytes(payload)
+            os.replace(tmp_path, self.db_path)
+            self._dirty = False
         except OSError as e:
             logger.error(f"Error saving database to {self.db_path}: {e}")
 
+    def flush(self) -> None:
+        """Save the database if it has unsaved changes."""
+        if self._dirty:
+            self.save_database()
+
     def get_all_invoices(self) -> List[Dict[str, Any]]:
         """
         Get all invoices.
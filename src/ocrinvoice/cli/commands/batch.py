@@ -8,8 +8,10 @@ processing multiple PDF invoices.
 import logging
 import json
 import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from ocrinvoice.parsers.invoice_parser import InvoiceParser
@@ -17,8 +19,51 @@ from ocrinvoice.parsers.credit_card_parser import CreditCardBillParser
 from ocrinvoice.config import get_config
 from ocrinvoice.utils.file_manager import FileManager
 
+# Optional faster JSON serializer
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Parser instance owned by each batch worker process
+_worker_parser: Any = None
+
+
+_PARSER_CLASSES = {"invoice": InvoiceParser, "credit_card": CreditCardBillParser}
+
+
+def _parser_class(parser_type: str) -> Any:
+    """Return the parser class for the given parser type."""
+    try:
+        return _PARSER_CLASSES[parser_type.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown parser type: {parser_type}") from None
+
+
+def _create_parser(parser_type: str) -> Any:
+    """Create the parser for the given parser type."""
+    return _parser_class(parser_type)()
+
+
+def _init_worker(parser_type: str) -> None:
+    """Build the parser once per worker process.
+
+    The pool already keeps every core busy, so each worker OCRs its pages one
+    at a time and Tesseract runs single-threaded; the tesseract processes
+    started by pytesseract inherit OMP_THREAD_LIMIT.
+    """
+    global _worker_parser
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    _worker_parser = _create_parser(parser_type)
+    _worker_parser.ocr_engine.max_workers = 1
+
+
+def _parse_one(pdf_path: str) -> Dict[str, Any]:
+    """Parse a single PDF in a worker process."""
+    return _worker_parser.parse(pdf_path)
+
 
 def batch_command(
     folder_path: str,
@@ -27,6 +72,7 @@ def batch_command(
     parser_type: str = "invoice",
     recursive: bool = False,
     document_type: Optional[str] = None,
+    max_workers: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Process multiple PDF invoices in batch.
@@ -37,6 +83,8 @@ def batch_command(
         format: Output format (json, csv)
         parser_type: Type of parser to use (invoice, credit_card)
         recursive: Process subdirectories recursively
+        max_workers: Number of worker processes used for parsing
+            (defaults to the CPU count, 1 parses in-process)
 
     Returns:
         Batch processing result dictionary
@@ -49,10 +97,7 @@ def batch_command(
         raise FileNotFoundError(f"Folder not found: {folder_path}")
 
     # Find PDF files
-    if recursive:
-        pdf_files = list(folder.rglob("*.pdf"))
-    else:
-        pdf_files = list(folder.glob("*.pdf"))
+    pdf_files = find_pdf_files(folder, recursive)
 
     logger.info(f"Found {len(pdf_files)} PDF files")
 
@@ -67,14 +112,18 @@ def batch_command(
             "error_details": [],
         }
 
-    # Initialize parser and file manager
+    # OCR is CPU-bound and independent per file, so parse PDFs in worker
+    # processes; renaming and formatting stay in this process
+    use_pool = max_workers != 1 and len(pdf_files) > 1
+
+    # Initialize parser and file manager. Pool workers build their own
+    # parser, so this process only needs one for the serial path.
     try:
-        if parser_type.lower() == "invoice":
-            parser = InvoiceParser()
-        elif parser_type.lower() == "credit_card":
-            parser = CreditCardBillParser()
+        if use_pool:
+            _parser_class(parser_type)
+            parser = None
         else:
-            raise ValueError(f"Unknown parser type: {parser_type}")
+            parser = _create_parser(parser_type)
 
         # Initialize file manager for renaming
         config = get_config()
@@ -102,40 +151,66 @@ def batch_command(
     errors = []
     start_time = datetime.now()
 
-    # Process each PDF
-    for i, pdf_file in enumerate(pdf_files, 1):
-        try:
-            logger.info(f"Processing {i}/{len(pdf_files)}: {pdf_file.name}")
-
-            # Parse the PDF
-            result = parser.parse(str(pdf_file))
-
-            # Handle file renaming if enabled
-            new_path = file_manager.process_file(pdf_file, result)
-
-            # Update the result with the new file path if it was renamed or dry-run
-            if new_path != pdf_file:
-                result["original_filename"] = pdf_file.name
-                result["new_filename"] = new_path.name
-                result["file_renamed"] = True
-            else:
-                result["file_renamed"] = False
-
-            # Format the result
-            formatted_result = format_batch_result(result, pdf_file, parser_type)
-            results.append(formatted_result)
-
-            logger.info(f"✓ Processed: {pdf_file.name}")
-
-        except Exception as e:
-            error_info = {
-                "filename": pdf_file.name,
-                "filepath": str(pdf_file),
-                "error": str(e),
-                "timestamp": datetime.now().isoformat(),
-            }
-            errors.append(error_info)
-            logger.error(f"✗ Error processing {pdf_file.name}: {e}")
+    executor = None
+    futures = []
+    # Bind loop-invariant methods once rather than per file
+    process_file = file_manager.process_file
+    try:
+        if use_pool:
+            # No more workers than files: each one pays for building a parser
+            executor = ProcessPoolExecutor(
+                max_workers=min(max_workers or os.cpu_count() or 1, len(pdf_files)),
+                initializer=_init_worker,
+                initargs=(parser_type,),
+            )
+            futures = [executor.submit(_parse_one, str(f)) for f in pdf_files]
+        else:
+            parse = parser.parse
+
+        # Process each PDF
+        for i, pdf_file in enumerate(pdf_files, 1):
+            try:
+                logger.info(f"Processing {i}/{len(pdf_files)}: {pdf_file.name}")
+
+                # Parse the PDF
+                if executor:
+                    result = futures[i - 1].result()
+                else:
+                    result = parse(str(pdf_file))
+
+                # Handle file renaming if enabled
+                new_path = process_file(pdf_file, result)
+
+                # Update the result with the new file path if it was renamed or dry-run
+                if new_path != pdf_file:
+                    result["original_filename"] = pdf_file.name
+                    result["new_filename"] = new_path.name
+                    result["file_renamed"] = True
+                else:
+                    result["file_renamed"] = False
+
+                # Format the result
+                formatted_result = format_batch_result(result, pdf_file, parser_type)
+                results.append(formatted_result)
+
+                logger.info(f"✓ Processed: {pdf_file.name}")
+
+            except Exception as e:
+                error_info = {
+                    "filename": pdf_file.name,
+                    "filepath": str(pdf_file),
+                    "error": str(e),
+                    "timestamp": datetime.now().isoformat(),
+                }
+                errors.append(error_info)
+                logger.error(f"✗ Error processing {pdf_file.name}: {e}")
+    finally:
+        if executor:
+            # On Ctrl-C or an unexpected error, drop the files still queued
+            # so shutdown only waits for those already being parsed
+            for future in futures:
+                future.cancel()
+            executor.shutdown()
 
     # Calculate processing time
     end_time = datetime.now()
@@ -169,6 +244,32 @@ def batch_command(
     return batch_result
 
 
+def find_pdf_files(folder: Path, recursive: bool = False) -> List[Path]:
+    """
+    Find PDF files in a folder.
+
+    Uses os.scandir so file type and name come from the directory entry
+    without an extra stat() per file.
+
+    Args:
+        folder: Folder to search
+        recursive: Also search subdirectories
+
+    Returns:
+        List of PDF file paths
+    """
+    pdf_files = []
+    pending = [folder]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.lower().endswith(".pdf"):
+                    pdf_files.append(Path(entry.path))
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    pending.append(Path(entry.path))
+    return pdf_files
+
+
 def format_batch_result(
     parser_result: Dict[str, Any], pdf_file: Path, parser_type: str
 ) -> Dict[str, Any]:
@@ -242,16 +343,14 @@ def save_batch_result(result: Dict[str, Any], output_path: str, format: str) ->
     try:
         # Save based on format
         if format.lower() == "json":
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            save_batch_as_json(result, output_path)
 
         elif format.lower() == "csv":
             save_batch_as_csv(result, output_path)
 
         else:
             logger.warning(f"Unsupported format: {format}, saving as JSON")
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            save_batch_as_json(result, output_path)
 
         logger.info(f"Batch result saved to: {output_path}")
 
@@ -260,6 +359,22 @@ def save_batch_result(result: Dict[str, Any], output_path: str, format: str) ->
         raise
 
 
+def save_batch_as_json(result: Dict[str, Any], output_path: str) -> None:
+    """
+    Save batch result as indented JSON, using orjson when it is installed.
+
+    Args:
+        result: Batch processing result
+        output_path: Output file path
+    """
+    if orjson is not None:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        Path(output_path).write_bytes(orjson.dumps(result, option=options, default=str))
+    else:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False, default=str)
+
+
 def save_batch_as_csv(result: Dict[str, Any], output_path: str) -> None:
     """
     Save batch result as CSV format.
@@ -297,18 +412,14 @@ def save_batch_as_csv(result: Dict[str, Any], output_path: str) -> None:
                 if key not in ["raw_result", "timestamp"]
             ]
 
-            writer.writerow(headers)
-
-            # Write results
-            for item in results:
-                row = []
-                for header in headers:
-                    value = item.get(header, "")
-                    # Convert complex objects to string
-                    if isinstance(value, (dict, list)):
-                        value = str(value)
-                    row.append(value)
-                writer.writerow(row)
+            # Write the results table in one vectorized call; object dtype keeps
+            # values as-is (no int->float upcasting) and complex objects are
+            # written as their string form
+            import pandas as pd
+
+            pd.DataFrame(results, columns=headers, dtype=object).to_csv(
+                f, index=False, lineterminator="\r\n"
+            )
 
         # Write errors if any
         errors = result.get("error_details", [])
@@ -8,6 +8,7 @@ parsing single PDF invoices.
 import logging
 import json
 import csv
+import os
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -141,7 +142,7 @@ def format_parsing_result(
 
     return {
         "status": "success",
-        "filename": Path(pdf_path).name,
+        "filename": os.path.basename(pdf_path),
         "filepath": pdf_path,
         "parser": parser_type,
         "data": data,
@@ -235,6 +235,12 @@ def parse(
     type=click.Choice(["facture", "relevé"], case_sensitive=False),
     help="Document type to prefix filename (facture or relevé)",
 )
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    help="Number of worker processes for parsing (default: CPU count)",
+)
 def batch(
     folder_path: Path,
     output: Optional[Path],
@@ -245,6 +251,7 @@ def batch(
     rename: bool,
     rename_dry_run: bool,
     document_type: Optional[str],
+    workers: Optional[int],
 ):
     """
     Process multiple PDF invoices in batch.
@@ -284,6 +291,7 @@ def batch(
             parser,
             recursive,
             document_type,
+            workers,
         )
 
         if result.get("status") == "success":
@@ -607,8 +615,7 @@ def remove_mapping(mapping: str, match_type: str):
             return
 
         # Remove the mapping
-        del manager.config[match_type][mapping]
-        manager._save_config()
+        manager.remove_mapping(mapping, match_type)
         click.echo(f"✅ Removed mapping '{mapping}' from {match_type}")
 
     except Exception as e:
@@ -629,33 +636,32 @@ def remove_business(name: str):
             click.echo(f"❌ Error: '{name}' is not a business name.")
             return
 
-        # Check for dependencies
-        dependencies = []
-        for match_type in ["exact_matches", "partial_matches"]:
-            for mapping, canonical_name in manager.config.get(match_type, {}).items():
-                if canonical_name == name:
-                    dependencies.append(f"{mapping} ({match_type})")
-
-        if dependencies:
+        # Check for dependencies, collected once and reused for the removal
+        dependencies = {
+            match_type: [
+                mapping
+                for mapping, canonical_name in manager.config.get(
+                    match_type, {}
+                ).items()
+                if canonical_name == name
+            ]
+            for match_type in ["exact_matches", "partial_matches"]
+        }
+
+        if any(dependencies.values()):
             click.echo(f"⚠️  Warning: '{name}' is referenced by the following mappings:")
-            for dep in dependencies:
-                click.echo(f"  • {dep}")
+            for match_type, mappings_to_remove in dependencies.items():
+                for mapping in mappings_to_remove:
+                    click.echo(f"  • {mapping} ({match_type})")
             if not click.confirm(
                 "Remove anyway? This will also remove all dependent mappings."
             ):
                 return
 
             # Remove dependent mappings
-            for match_type in ["exact_matches", "partial_matches"]:
-                mappings_to_remove = [
-                    mapping
-                    for mapping, canonical_name in manager.config.get(
-                        match_type, {}
-                    ).items()
-                    if canonical_name == name
-                ]
+            for match_type, mappings_to_remove in dependencies.items():
                 for mapping in mappings_to_remove:
-                    del manager.config[match_type][mapping]
+                    manager.remove_mapping(mapping, match_type)
 
         # Remove the business name
         success = manager.remove_business_name(name)
@@ -5,9 +5,31 @@ This package contains the fundamental OCR and text extraction capabilities
 that are used by all parsers in the system.
 """
 
-from .ocr_engine import OCREngine
-from .text_extractor import TextExtractor
-from .image_processor import ImageProcessor
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .ocr_engine import OCREngine
+    from .text_extractor import TextExtractor
+    from .image_processor import ImageProcessor
+
+# Each class is imported on first access, so importing one core module does
+# not pull in the dependencies of the others
+_LAZY_EXPORTS = {
+    "OCREngine": ".ocr_engine",
+    "TextExtractor": ".text_extractor",
+    "ImageProcessor": ".image_processor",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "OCREngine",
@@ -2,6 +2,7 @@
 
 import logging
 import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
 
@@ -50,6 +51,15 @@ class ImageProcessor:
             "apply_noise_reduction", True
         )
         self.apply_binarization: bool = self.config.get("apply_binarization", True)
+        # Optional non-local means windows; unset keeps OpenCV's defaults (7
+        # and 21). Smaller windows, e.g. 3 and 9, denoise a 300 DPI page
+        # several times faster at some cost in quality.
+        self.denoise_template_window: Optional[int] = self.config.get(
+            "denoise_template_window"
+        )
+        self.denoise_search_window: Optional[int] = self.config.get(
+            "denoise_search_window"
+        )
         self.debug: bool = self.config.get("debug", False)
 
         # Preprocessing steps in order
@@ -229,8 +239,15 @@ class ImageProcessor:
         # Convert PIL image to numpy array
         img_array = np.array(image)
 
-        # Apply denoising
-        denoised_array = cv2.fastNlMeansDenoising(img_array, h=strength)
+        # Apply denoising, with the configured windows if any
+        window_options: Dict[str, int] = {}
+        if self.denoise_template_window is not None:
+            window_options["templateWindowSize"] = self.denoise_template_window
+        if self.denoise_search_window is not None:
+            window_options["searchWindowSize"] = self.denoise_search_window
+        denoised_array = cv2.fastNlMeansDenoising(
+            img_array, h=strength, **window_options
+        )
 
         # Convert back to PIL image
         denoised_image = Image.fromarray(denoised_array)
@@ -487,31 +504,48 @@ class ImageProcessor:
             }
 
     def batch_preprocess(
-        self, images: List[Union[str, Path, Image.Image]], method: str = "standard"
+        self,
+        images: List[Union[str, Path, Image.Image]],
+        method: str = "standard",
+        max_workers: Optional[int] = None,
     ) -> List[Image.Image]:
         """Preprocess multiple images.
 
+        Images are processed concurrently on a thread pool; OpenCV and PIL
+        release the GIL in their pixel loops, so pages overlap instead of
+        running back to back.
+
         Args:
             images: List of images to preprocess
             method: Preprocessing method
+            max_workers: Maximum number of threads (default: executor default,
+                1 processes images serially)
 
         Returns:
-            List of preprocessed images
+            List of preprocessed images, in input order
         """
-        results = []
-        for image in images:
-            try:
-                processed = self.preprocess_for_ocr(image, method=method)
-                results.append(processed)
-            except Exception as e:
-                self.logger.error(f"Failed to preprocess image {image}: {e}")
-                # Add original image if preprocessing fails
-                if isinstance(image, (str, Path)):
-                    results.append(Image.open(image))
-                else:
-                    results.append(image)
+        if len(images) <= 1 or max_workers == 1:
+            return [self._preprocess_or_original(image, method) for image in images]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda image: self._preprocess_or_original(image, method), images
+                )
+            )
 
-        return results
+    def _preprocess_or_original(
+        self, image: Union[str, Path, Image.Image], method: str
+    ) -> Image.Image:
+        """Preprocess one image, falling back to the original on failure."""
+        try:
+            return self.preprocess_for_ocr(image, method=method)
+        except Exception as e:
+            self.logger.error(f"Failed to preprocess image {image}: {e}")
+            # Add original image if preprocessing fails
+            if isinstance(image, (str, Path)):
+                return Image.open(image)
+            return image
 
     def _validate_preprocessing_steps(self) -> None:
         """Validate preprocessing steps configuration."""
@@ -1,6 +1,7 @@
 """Core OCR engine for text extraction from PDFs and images."""
 
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
 
@@ -70,7 +71,46 @@ class OCREngine:
         self.ocr_language: str = self.config.get("ocr_language", "eng+fra")
         self.ocr_config: str = self.config.get("ocr_config", "--oem 3 --psm 6")
         self.pdf_dpi: int = self.config.get("pdf_dpi", 300)
+        # Opt-in draft pass: with draft_dpi below pdf_dpi, PDFs are first
+        # rasterized at draft_dpi and pages that yield fewer than
+        # min_page_text_length characters are redone at pdf_dpi
+        self.draft_dpi: int = self.config.get("draft_dpi", self.pdf_dpi)
+        self.min_page_text_length: int = self.config.get("min_page_text_length", 20)
+        # With prefer_text_layer, a PDF whose embedded text has at least
+        # min_text_layer_length characters is returned without running OCR
+        self.prefer_text_layer: bool = self.config.get("prefer_text_layer", False)
+        self.min_text_layer_length: int = self.config.get("min_text_layer_length", 200)
         self.debug: bool = self.config.get("debug", False)
+        # Threads used to OCR pages concurrently (None: executor default)
+        self.max_workers: Optional[int] = self.config.get("max_workers")
+        # Run image preprocessing through OpenCV's OpenCL backend when a
+        # device is available
+        self.use_opencl: bool = bool(
+            self.config.get("use_opencl", False)
+            and DEPENDENCIES_AVAILABLE
+            and cv2.ocl.haveOpenCL()
+        )
+
+    def settings_key(self) -> Tuple[Any, ...]:
+        """Return the settings that determine the text extracted from a PDF.
+
+        Callers that cache extracted text include this in their cache key, so
+        text produced under other DPI, language or Tesseract options is never
+        returned.
+
+        Returns:
+            Hashable tuple of the current extraction settings
+        """
+        return (
+            self.ocr_language,
+            self.ocr_config,
+            self.pdf_dpi,
+            self.draft_dpi,
+            self.min_page_text_length,
+            self.prefer_text_layer,
+            self.min_text_layer_length,
+            self.use_opencl,
+        )
 
     def _validate_dependencies(self) -> None:
         """Validate that all required dependencies are available."""
@@ -104,7 +144,8 @@ class OCREngine:
 
         Args:
             pdf_path: Path to the PDF file
-            force_ocr: If True, skip text extraction and use OCR directly (deprecated, OCR is now default)
+            force_ocr: If True, skip text extraction and use OCR directly (only
+                relevant when prefer_text_layer is enabled, OCR is the default)
 
         Returns:
             Extracted text from the PDF
@@ -119,7 +160,15 @@ class OCREngine:
 
         self.logger.info(f"Extracting text from PDF: {pdf_path}")
 
-        # Always try OCR first for better consistency
+        # A rich embedded text layer is returned as is; OCR takes seconds
+        layer_text = None
+        if self.prefer_text_layer and not force_ocr:
+            layer_text = self._extract_text_with_pdfplumber(pdf_path)
+            if self._is_text_layer_sufficient(layer_text):
+                self.logger.info(f"Using PDF text layer, skipping OCR: {pdf_path}")
+                return layer_text
+
+        # Otherwise try OCR first for better consistency
         self.logger.info(f"Using OCR for PDF: {pdf_path}")
         ocr_text = self._extract_text_with_ocr(pdf_path)
 
@@ -129,8 +178,10 @@ class OCREngine:
                 f"OCR returned empty text, trying text extraction methods: {pdf_path}"
             )
 
-            # Try pdfplumber as fallback
-            text = self._extract_text_with_pdfplumber(pdf_path)
+            # Try pdfplumber as fallback, unless it already ran above
+            if layer_text is None:
+                layer_text = self._extract_text_with_pdfplumber(pdf_path)
+            text = layer_text
             if text.strip():
                 return text
 
@@ -141,6 +192,20 @@ class OCREngine:
 
         return ocr_text
 
+    def _is_text_layer_sufficient(self, text: str) -> bool:
+        """Check if a PDF's embedded text is complete enough to skip OCR.
+
+        Args:
+            text: Text extracted from the PDF's text layer
+
+        Returns:
+            True if the text is long enough and contains several words
+        """
+        stripped = text.strip()
+        return (
+            len(stripped) >= self.min_text_layer_length and len(stripped.split()) >= 3
+        )
+
     def _extract_text_with_pdfplumber(self, pdf_path: Path) -> str:
         """Extract text using pdfplumber.
 
@@ -152,11 +217,13 @@ class OCREngine:
         """
         try:
             with pdfplumber.open(pdf_path) as pdf:
-                text = ""
+                # Collect pages and join once; += would recopy the text per page
+                page_texts = []
                 for page in pdf.pages:
                     page_text = page.extract_text()
                     if page_text:
-                        text += page_text + "\n"
+                        page_texts.append(page_text + "\n")
+                text = "".join(page_texts)
 
                 if text.strip():
                     self.logger.info(
@@ -180,11 +247,13 @@ class OCREngine:
         try:
             with open(pdf_path, "rb") as file:
                 reader = PdfReader(file)
-                text = ""
+                # Collect pages and join once; += would recopy the text per page
+                page_texts = []
                 for page in reader.pages:
                     page_text = page.extract_text()
                     if page_text:
-                        text += page_text + "\n"
+                        page_texts.append(page_text + "\n")
+                text = "".join(page_texts)
 
                 if text.strip():
                     self.logger.info(
@@ -206,11 +275,30 @@ class OCREngine:
             Extracted text from OCR
         """
         try:
-            # Convert PDF to images
-            images = self.convert_pdf_to_images(pdf_path)
+            # Convert PDF to images. Most invoices OCR fine at the draft
+            # resolution, which has well under half the pixels of pdf_dpi
+            draft_dpi = min(self.draft_dpi, self.pdf_dpi)
+            images = self.convert_pdf_to_images(pdf_path, dpi=draft_dpi)
 
             # Extract text from images
-            text = self.extract_text_from_images(images)
+            page_texts = self._extract_pages_text(images)
+
+            if draft_dpi < self.pdf_dpi:
+                for i, page_text in enumerate(page_texts):
+                    if len(page_text.strip()) >= self.min_page_text_length:
+                        continue
+                    # Too little text at draft resolution: rasterize only this
+                    # page again at full resolution
+                    self.logger.info(
+                        f"Retrying OCR for page {i + 1} at {self.pdf_dpi} DPI"
+                    )
+                    retry_images = self.convert_pdf_to_images(
+                        pdf_path, dpi=self.pdf_dpi, first_page=i + 1, last_page=i + 1
+                    )
+                    if retry_images:
+                        page_texts[i] = self._extract_page_text(i, retry_images[0])
+
+            text = "\n".join(page_text for page_text in page_texts if page_text.strip())
 
             self.logger.info(f"Successfully extracted text using OCR from {pdf_path}")
             return text
@@ -219,11 +307,20 @@ class OCREngine:
             self.logger.error(f"OCR extraction failed for {pdf_path}: {e}")
             return ""
 
-    def convert_pdf_to_images(self, pdf_path: Union[str, Path]) -> List[Image.Image]:
+    def convert_pdf_to_images(
+        self,
+        pdf_path: Union[str, Path],
+        dpi: Optional[int] = None,
+        first_page: Optional[int] = None,
+        last_page: Optional[int] = None,
+    ) -> List[Image.Image]:
         """Convert PDF pages to PIL Images.
 
         Args:
             pdf_path: Path to the PDF file
+            dpi: Rasterization resolution (default: pdf_dpi)
+            first_page: First page to convert, 1-based (default: first page)
+            last_page: Last page to convert, 1-based (default: last page)
 
         Returns:
             List of PIL Image objects
@@ -231,16 +328,24 @@ class OCREngine:
         Raises:
             Exception: If PDF to image conversion fails
         """
+        options: Dict[str, Any] = {"dpi": dpi or self.pdf_dpi}
+        if first_page is not None:
+            options["first_page"] = first_page
+        if last_page is not None:
+            options["last_page"] = last_page
+
         try:
             # Get bundled Poppler path for pdf2image
             poppler_path = get_pdf2image_poppler_path()
             
             if poppler_path:
                 self.logger.info(f"Using bundled Poppler at: {poppler_path}")
-                images = convert_from_path(pdf_path, dpi=self.pdf_dpi, poppler_path=poppler_path)
+                images = convert_from_path(
+                    pdf_path, poppler_path=poppler_path, **options
+                )
             else:
                 self.logger.info("Using system Poppler (bundled not found)")
-                images = convert_from_path(pdf_path, dpi=self.pdf_dpi)
+                images = convert_from_path(pdf_path, **options)
                 
             self.logger.info(f"Converted PDF to {len(images)} images: {pdf_path}")
             return images
@@ -251,41 +356,66 @@ class OCREngine:
     def extract_text_from_images(self, images: List[Image.Image]) -> str:
         """Extract text from images using OCR.
 
+        Each page is recognized by its own Tesseract process, so pages are
+        processed concurrently on a thread pool instead of one after another.
+
         Args:
             images: List of PIL Image objects
 
         Returns:
-            Combined text from all images
+            Combined text from all images, in page order
         """
         if not images:
             return ""
 
-        all_text = []
+        # Combine all text
+        page_texts = self._extract_pages_text(images)
+        combined_text = "\n".join(text for text in page_texts if text.strip())
+        return combined_text
 
-        for i, image in enumerate(images):
-            try:
-                # Preprocess image for better OCR
-                processed_image = self.preprocess_image(image)
+    def _extract_pages_text(self, images: List[Image.Image]) -> List[str]:
+        """OCR each page concurrently, returning the texts in page order.
 
-                # Extract text using Tesseract
-                text = pytesseract.image_to_string(
-                    processed_image, config=self.ocr_config, lang=self.ocr_language
-                )
+        Args:
+            images: List of PIL Image objects
 
-                if text.strip():
-                    all_text.append(text)
-                    if self.debug:
-                        self.logger.debug(
-                            f"Extracted text from image {i}: {text[:100]}..."
-                        )
+        Returns:
+            Extracted text of each page (empty for pages that failed)
+        """
+        if len(images) <= 1 or self.max_workers == 1:
+            return [self._extract_page_text(i, image) for i, image in enumerate(images)]
 
-            except Exception as e:
-                self.logger.error(f"Error in OCR for image {i}: {e}")
-                continue
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(
+                executor.map(self._extract_page_text, range(len(images)), images)
+            )
 
-        # Combine all text
-        combined_text = "\n".join(all_text)
-        return combined_text
+    def _extract_page_text(self, i: int, image: Image.Image) -> str:
+        """OCR one page, returning an empty string if it fails.
+
+        Args:
+            i: Index of the page, for logging
+            image: PIL Image of the page
+
+        Returns:
+            Extracted text from the page
+        """
+        try:
+            # Preprocess image for better OCR
+            processed_image = self.preprocess_image(image)
+
+            # Extract text using Tesseract
+            text = pytesseract.image_to_string(
+                processed_image, config=self.ocr_config, lang=self.ocr_language
+            )
+
+            if text.strip() and self.debug:
+                self.logger.debug(f"Extracted text from image {i}: {text[:100]}...")
+            return text
+
+        except Exception as e:
+            self.logger.error(f"Error in OCR for image {i}: {e}")
+            return ""
 
     def extract_text_from_image(self, image: Union[str, Path, Image.Image]) -> str:
         """Extract text from a single image.
@@ -323,18 +453,26 @@ class OCREngine:
         Returns:
             Preprocessed PIL Image
         """
-        # Convert to numpy array for OpenCV processing
-        img_array = np.array(image)
+        # View the image as a numpy array for OpenCV processing; every step
+        # below writes a new buffer, so the extra copy np.array makes is not
+        # needed
+        img_array = np.asarray(image)
+        height, width = img_array.shape[:2]
+        is_color = len(img_array.shape) == 3
+
+        # With OpenCL, upload the page once; every step below then runs on
+        # the device and only the final result is copied back
+        if self.use_opencl:
+            img_array = cv2.UMat(img_array)
 
         # Convert to grayscale if not already
-        if len(img_array.shape) == 3:
+        if is_color:
             gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
         else:
             gray = img_array
 
         # Apply preprocessing techniques
         # 1. Resize if too small
-        height, width = gray.shape
         if width < 800:
             scale_factor = 800 / width
             new_width = int(width * scale_factor)
@@ -343,15 +481,15 @@ class OCREngine:
                 gray, (new_width, new_height), interpolation=cv2.INTER_CUBIC
             )
 
-        # 2. Apply Gaussian blur to reduce noise
-        blurred = cv2.GaussianBlur(gray, (1, 1), 0)
-
-        # 3. Apply thresholding
-        _, thresh = cv2.threshold(blurred, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        # 2. Apply thresholding. No blur pass first: a 1x1 Gaussian kernel is
+        # the identity, so it only cost a full-page copy
+        _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
 
-        # 4. Apply morphological operations to clean up
+        # 3. Apply morphological operations to clean up
         kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
         cleaned = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
+        if self.use_opencl:
+            cleaned = cleaned.get()
 
         # Convert back to PIL Image
         processed_image = Image.fromarray(cleaned)
@@ -378,6 +516,7 @@ class OCREngine:
             "ocr_language": self.ocr_language,
             "ocr_config": self.ocr_config,
             "pdf_dpi": self.pdf_dpi,
+            "draft_dpi": self.draft_dpi,
             "dependencies_available": DEPENDENCIES_AVAILABLE,
             "debug_mode": self.debug,
         }
@@ -32,6 +32,9 @@ class TextExtractor:
     present in the PDF.
     """
 
+    # OCR artifacts dropped by _clean_text; useful punctuation is kept
+    _ARTIFACT_RE = re.compile(r"[^\w\s.,$€£¥%\-/#:!?@&*()]")
+
     def __init__(self, config: Optional[Dict[str, Any]] = None) -> None:
         """Initialize the text extractor.
 
@@ -129,18 +132,19 @@ class TextExtractor:
         # Convert Path to string for pdfplumber
         pdf_path_str = str(pdf_path)
         with pdfplumber.open(pdf_path_str) as pdf:
-            text = ""
+            # Collect pages and join once; += would recopy the text per page
+            page_texts = []
             for page_num, page in enumerate(pdf.pages):
                 page_text = page.extract_text()
                 if page_text:
-                    text += page_text + "\n"
+                    page_texts.append(page_text)
 
                 if self.debug:
                     self.logger.debug(
                         f"Page {page_num + 1}: {len(page_text)} characters"
                     )
 
-            return text.strip()
+            return "\n".join(page_texts).strip()
 
     def _extract_with_pypdf2(self, pdf_path: Path) -> str:
         """Extract text using PyPDF2.
@@ -155,19 +159,20 @@ class TextExtractor:
         pdf_path_str = str(pdf_path)
         with open(pdf_path_str, "rb") as file:
             reader = PdfReader(file)
-            text = ""
+            # Collect pages and join once; += would recopy the text per page
+            page_texts = []
 
             for page_num, page in enumerate(reader.pages):
                 page_text = page.extract_text()
                 if page_text:
-                    text += page_text + "\n"
+                    page_texts.append(page_text)
 
                 if self.debug:
                     self.logger.debug(
                         f"Page {page_num + 1}: {len(page_text)} characters"
                     )
 
-            return text.strip()
+            return "\n".join(page_texts).strip()
 
     def _extract_with_fallback(self, pdf_path: Path) -> str:
         """Fallback text extraction method.
@@ -206,7 +211,7 @@ class TextExtractor:
         cleaned = " ".join(text.split())
 
         # Remove only problematic OCR artifacts, preserve useful characters
-        cleaned = re.sub(r"[^\w\s.,$€£¥%\-/#:!?@&*()]", "", cleaned)
+        cleaned = self._ARTIFACT_RE.sub("", cleaned)
 
         return cleaned.strip()
 
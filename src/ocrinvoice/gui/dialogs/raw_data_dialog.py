@@ -26,6 +26,11 @@ from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont, QTextCursor, QSyntaxHighlighter, QTextCharFormat, QColor
 
 
+def _truncate(text: str, limit: int = 500) -> str:
+    """Return text cut to limit characters, with "..." if anything was cut."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
 class JSONHighlighter(QSyntaxHighlighter):
     """Syntax highlighter for JSON text."""
     
@@ -207,15 +212,20 @@ class RawDataDialog(QDialog):
         
         self.tab_widget.addTab(summary_widget, "📋 Summary")
     
-    def populate_data(self):
-        """Populate all views with the data."""
-        # Create a copy of data with processed raw_text for display
+    def _build_display_data(self) -> Dict[str, Any]:
+        """Copy the data with raw_text line breaks expanded for display."""
         display_data = self.data.copy()
-        
+
         # Process raw_text to replace \n with actual line breaks for display
         if "raw_text" in display_data and isinstance(display_data["raw_text"], str):
             # Replace literal \n with actual line breaks for display
             display_data["raw_text"] = display_data["raw_text"].replace("\\n", "\n")
+        return display_data
+    
+    def populate_data(self):
+        """Populate all views with the data."""
+        # Build the display copy once and share it with every view
+        display_data = self._build_display_data()
         
         # Populate JSON view with custom formatting for raw_text
         try:
@@ -246,22 +256,17 @@ class RawDataDialog(QDialog):
             self.json_text.setPlainText(f"Error formatting JSON: {str(e)}\n\nRaw data: {str(display_data)}")
         
         # Populate tree view
-        self.populate_tree_view()
+        self.populate_tree_view(display_data)
         
         # Populate summary view
-        self.populate_summary_view()
+        self.populate_summary_view(display_data)
     
-    def populate_tree_view(self):
+    def populate_tree_view(self, display_data: Optional[Dict[str, Any]] = None):
         """Populate the tree view with data."""
         self.tree_widget.clear()
         
-        # Create a copy of data with processed raw_text for display
-        display_data = self.data.copy()
-        
-        # Process raw_text to replace \n with actual line breaks for display
-        if "raw_text" in display_data and isinstance(display_data["raw_text"], str):
-            # Replace literal \n with actual line breaks for display
-            display_data["raw_text"] = display_data["raw_text"].replace("\\n", "\n")
+        if display_data is None:
+            display_data = self._build_display_data()
         
         def add_item(parent, key, value):
             """Recursively add items to the tree."""
@@ -299,17 +304,12 @@ class RawDataDialog(QDialog):
         # Expand all items
         self.tree_widget.expandAll()
     
-    def populate_summary_view(self):
+    def populate_summary_view(self, display_data: Optional[Dict[str, Any]] = None):
         """Populate the summary view."""
         summary_lines = []
         
-        # Create a copy of data with processed raw_text for display
-        display_data = self.data.copy()
-        
-        # Process raw_text to replace \n with actual line breaks for display
-        if "raw_text" in display_data and isinstance(display_data["raw_text"], str):
-            # Replace literal \n with actual line breaks for display
-            display_data["raw_text"] = display_data["raw_text"].replace("\\n", "\n")
+        if display_data is None:
+            display_data = self._build_display_data()
         
         # Basic statistics
         summary_lines.append("📊 DATA SUMMARY")
@@ -362,10 +362,7 @@ class RawDataDialog(QDialog):
             summary_lines.append("📄 RAW TEXT PREVIEW:")
             summary_lines.append("-" * 30)
             # Show first 500 characters
-            preview = raw_text[:500]
-            if len(raw_text) > 500:
-                preview += "..."
-            summary_lines.append(preview)
+            summary_lines.append(_truncate(raw_text))
         
         self.summary_text.setPlainText("\n".join(summary_lines))
     
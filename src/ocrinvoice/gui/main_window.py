@@ -285,8 +285,9 @@ class MainWindow(QMainWindow):
             try:
                 # Delete from manager
                 match_type = selected_mapping.get("match_type", "exact_matches")
-                del self.mapping_manager.config[match_type][selected_mapping["mapping"]]
-                self.mapping_manager._save_config()
+                self.mapping_manager.remove_mapping(
+                    selected_mapping["mapping"], match_type
+                )
 
                 # Reload table
                 self._load_mappings()
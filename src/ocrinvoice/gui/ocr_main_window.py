@@ -52,10 +52,18 @@ class OCRProcessingThread(QThread):
     processing_error = pyqtSignal(str)  # Emits error message
     processing_progress = pyqtSignal(int)  # Emits progress percentage
 
-    def __init__(self, pdf_path: str, config: Dict[str, Any]):
+    def __init__(
+        self,
+        pdf_path: str,
+        config: Dict[str, Any],
+        parser: Optional[InvoiceParser] = None,
+    ):
         super().__init__()
         self.pdf_path = pdf_path
         self.config = config
+        # Reuse the window's parser so each PDF doesn't rebuild the OCR engine
+        # and business mappings
+        self.parser = parser
         self._is_cancelled = False
 
     def cancel(self) -> None:
@@ -72,8 +80,8 @@ class OCRProcessingThread(QThread):
             if self._is_cancelled:
                 return
 
-            # Initialize parser with config
-            parser = InvoiceParser(self.config)
+            # Initialize parser with config unless a shared one was provided
+            parser = self.parser or InvoiceParser(self.config)
             self.processing_progress.emit(30)
 
             # Check if cancelled
@@ -745,7 +753,7 @@ class OCRMainWindow(QMainWindow):
             self.ocr_thread.wait()
 
         # Create and start new OCR thread
-        self.ocr_thread = OCRProcessingThread(pdf_path, self.config)
+        self.ocr_thread = OCRProcessingThread(pdf_path, self.config, self.ocr_parser)
         self.ocr_thread.processing_started.connect(self._on_ocr_started)
         self.ocr_thread.processing_finished.connect(self._on_ocr_finished)
         self.ocr_thread.processing_error.connect(self._on_ocr_error)
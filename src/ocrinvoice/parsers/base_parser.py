@@ -1,7 +1,8 @@
 """Base parser class for all document parsers."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List, Union
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Pattern, Tuple, Union
 from pathlib import Path
 import logging
 import re
@@ -9,6 +10,13 @@ from datetime import datetime
 
 from ..core.ocr_engine import OCREngine
 
+try:
+    # google-re2 matches in linear time, so adversarial OCR text cannot
+    # trigger catastrophic backtracking; the stdlib engine is the fallback
+    import re2
+except ImportError:
+    re2 = None
+
 try:
     from ..utils.fuzzy_matcher import FuzzyMatcher
     from ..utils.amount_normalizer import AmountNormalizer
@@ -37,6 +45,56 @@ except ImportError:
 
     UTILS_AVAILABLE = False
 
+# Currency symbol and thousands separator removed in one pass before float
+# conversion
+_AMOUNT_STRIP_TABLE = str.maketrans("", "", "$,")
+
+# Date regexes shared by every parser module, compiled once at import time
+ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+NUMERIC_DATE_RE = re.compile(r"\d{1,2}/\d{1,2}/\d{2,4}")
+
+# Character-class checks used when scoring invoice numbers
+_LETTER_RE = re.compile(r"[A-Z]", re.IGNORECASE)
+_DIGIT_RE = re.compile(r"\d")
+
+
+@lru_cache(maxsize=32)
+def compile_keyword_pattern(keywords: Tuple[str, ...], flags: int = 0) -> Pattern[str]:
+    """Compile keywords into one alternation regex, cached per keyword tuple.
+
+    The alternation sits in a zero-width lookahead so ``finditer`` reports
+    every keyword occurrence, including overlapping ones such as "total"
+    inside "grand total".
+
+    Args:
+        keywords: Keywords to match literally, already case-folded
+        flags: Regex flags, e.g. re.IGNORECASE to match offsets in the
+            original text rather than in a lower-cased copy
+
+    Returns:
+        Compiled pattern matching at the start of any keyword
+    """
+    return re.compile("(?=(?:%s))" % "|".join(map(re.escape, keywords)), flags)
+
+
+@lru_cache(maxsize=32)
+def compile_keyword_line_pattern(keywords: Tuple[str, ...]) -> Pattern[str]:
+    """Compile a multiline regex matching every line that contains a keyword.
+
+    Lets callers walk keyword lines with one ``finditer`` over the whole
+    text instead of splitting it and testing each line in Python. The lazy
+    prefix stops at the first keyword rather than backtracking from the
+    line end. Compiled with RE2 when google-re2 is installed.
+
+    Args:
+        keywords: Keywords to match literally, case-insensitively
+
+    Returns:
+        Compiled pattern whose matches span entire keyword lines
+    """
+    engine = re2 if re2 is not None else re
+    return engine.compile("(?im)^.*?(?:%s).*$" % "|".join(map(engine.escape, keywords)))
+
 
 class BaseParser(ABC):
     """Abstract base class for all document parsers.
@@ -45,6 +103,9 @@ class BaseParser(ABC):
     of documents (invoices, credit card bills, etc.) using OCR.
     """
 
+    # Number of OCR results kept per parser for re-parsing unchanged files
+    _PDF_TEXT_CACHE_SIZE = 16
+
     def __init__(self, config: Dict[str, Any]) -> None:
         """Initialize the parser with configuration.
 
@@ -77,6 +138,9 @@ class BaseParser(ABC):
         # Load company aliases if available
         self.company_aliases: Dict[str, str] = config.get("company_aliases", {})
 
+        # OCR text of recently parsed files, oldest first
+        self._pdf_text_cache: Dict[Tuple[Any, ...], str] = {}
+
     @abstractmethod
     def parse(self, pdf_path: Union[str, Path]) -> Dict[str, Any]:
         """Parse document and return structured data.
@@ -165,6 +229,21 @@ class BaseParser(ABC):
         """
         path = self.validate_pdf_path(pdf_path)
         force_ocr = self.config.get("force_ocr", False)
+        stat = path.stat()
+
+        # Re-parsing an unchanged file with unchanged engine settings reuses
+        # the earlier OCR pass; the modification time and size make an edited
+        # or replaced file miss the cache
+        cache_key = (
+            str(path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            force_ocr,
+            self.ocr_engine.settings_key(),
+        )
+        cached_text = self._pdf_text_cache.get(cache_key)
+        if cached_text is not None:
+            return cached_text
 
         for attempt in range(self.max_retries):
             try:
@@ -172,6 +251,9 @@ class BaseParser(ABC):
                     str(path), force_ocr=force_ocr
                 )
                 if text.strip():
+                    if len(self._pdf_text_cache) >= self._PDF_TEXT_CACHE_SIZE:
+                        del self._pdf_text_cache[next(iter(self._pdf_text_cache))]
+                    self._pdf_text_cache[cache_key] = text
                     return text
                 else:
                     self.logger.warning(
@@ -218,13 +300,19 @@ class BaseParser(ABC):
         Returns:
             Extracted amount or None if not found
         """
+        if not context_keywords:
+            return None
+
         lines = text.split("\n")
+        keyword_pattern = compile_keyword_pattern(
+            tuple(keyword.lower() for keyword in context_keywords)
+        )
 
         for line in lines:
             line_lower = line.lower()
 
             # Check if any context keyword is in the line (exact match)
-            if any(keyword.lower() in line_lower for keyword in context_keywords):
+            if keyword_pattern.search(line_lower):
                 # Extract amounts from this line
                 amounts = self.amount_normalizer.extract_amounts_from_text(line)
 
@@ -235,19 +323,23 @@ class BaseParser(ABC):
         return None
 
     def extract_date_with_patterns(
-        self, text: str, date_patterns: List[str]
+        self, text: str, date_patterns: List[Union[str, Pattern[str]]]
     ) -> Optional[str]:
         """Extract date using specific patterns.
 
         Args:
             text: Text to search in
-            date_patterns: List of regex patterns for date matching
+            date_patterns: Regex patterns for date matching; strings are
+                matched case-insensitively, compiled patterns use their own flags
 
         Returns:
             Extracted date in ISO format or None if not found
         """
         for pattern in date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            if isinstance(pattern, str):
+                matches = re.findall(pattern, text, re.IGNORECASE)
+            else:
+                matches = pattern.findall(text)
 
             for match in matches:
                 try:
@@ -315,26 +407,26 @@ class BaseParser(ABC):
             if len(str(value)) > 2:
                 confidence += 0.3
             # Additional confidence if it matches business aliases
-            if hasattr(self, "company_aliases") and str(value).lower() in [
-                alias.lower() for alias in self.company_aliases
-            ]:
-                confidence += 0.2
+            if hasattr(self, "company_aliases"):
+                value_lower = str(value).lower()
+                if any(alias.lower() == value_lower for alias in self.company_aliases):
+                    confidence += 0.2
         elif field == "total":
             if self.amount_normalizer.validate_amount(str(value)):
                 confidence += 0.3
             # Additional confidence for reasonable amounts (not too small or too large)
             try:
-                amount = float(str(value).replace("$", "").replace(",", ""))
+                amount = float(str(value).translate(_AMOUNT_STRIP_TABLE))
                 if 0.01 <= amount <= 1000000:  # Reasonable range for invoice amounts
                     confidence += 0.1
             except (ValueError, TypeError):
                 pass
         elif field == "date":
-            if self._parse_date_string(str(value)):
+            parsed_date = self._parse_date_string(str(value))
+            if parsed_date:
                 confidence += 0.3
             # Additional confidence for recent dates
             try:
-                parsed_date = self._parse_date_string(str(value))
                 if parsed_date:
                     from datetime import datetime, timedelta
 
@@ -347,9 +439,10 @@ class BaseParser(ABC):
             # Confidence based on pattern matching
             if len(str(value)) >= 4:
                 confidence += 0.2
-            if re.search(r"[A-Z]", str(value), re.IGNORECASE):
+            value_str = str(value)
+            if _LETTER_RE.search(value_str):
                 confidence += 0.1
-            if re.search(r"\d", str(value)):
+            if _DIGIT_RE.search(value_str):
                 confidence += 0.1
 
         return min(confidence, 1.0)  # Cap at 1.0
@@ -4,9 +4,15 @@ import logging
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
 
-from .base_parser import BaseParser
+from .base_parser import (
+    ISO_DATE_RE,
+    NUMERIC_DATE_RE,
+    BaseParser,
+    compile_keyword_pattern,
+)
 from .date_extractor import DateExtractor
 from ..business.business_mapping_manager import BusinessMappingManager
+from ..utils.substring_index import compile_substring_index
 
 
 class CreditCardBillParser(BaseParser):
@@ -60,19 +66,31 @@ class CreditCardBillParser(BaseParser):
         known_companies = self.config.get("known_companies", [])
         if not text:
             return None
-        lines = text.split("\n")
-        search_lines = lines[:20]
+        # Only the header is searched; stop splitting once it is reached
+        search_lines = text.split("\n", 20)[:20]
         candidates = []
-        for company in known_companies:
-            if company.lower() in text.lower():
-                candidates.append((company, 15))
-                break
+        text_lower = text.lower()
+        company = compile_substring_index(tuple(known_companies)).first_match(
+            text_lower
+        )
+        if company is not None:
+            candidates.append((company, 15))
         if not candidates and self.company_aliases:
+            aliases = [
+                (alias.lower(), real_name)
+                for alias, real_name in self.company_aliases.items()
+            ]
+            # One scan rejects lines without any alias; only matching lines
+            # are searched for the first alias in configured order
+            alias_re = compile_keyword_pattern(tuple(alias for alias, _ in aliases))
             for line in search_lines:
                 line_clean = line.strip()
                 if len(line_clean) > 5:
-                    for alias, real_name in self.company_aliases.items():
-                        if alias.lower() in line_clean.lower():
+                    line_lower = line_clean.lower()
+                    if not alias_re.search(line_lower):
+                        continue
+                    for alias, real_name in aliases:
+                        if alias in line_lower:
                             candidates.append((real_name, 12))
                             break
         if not candidates:
@@ -129,5 +147,4 @@ class CreditCardBillParser(BaseParser):
         date = DateExtractor.extract_date_from_text(text)
         if date:
             return date
-        patterns = [r"\d{1,2}/\d{1,2}/\d{2,4}", r"\d{4}-\d{2}-\d{2}"]
-        return self.extract_date_with_patterns(text, patterns)
+        return self.extract_date_with_patterns(text, [NUMERIC_DATE_RE, ISO_DATE_RE])
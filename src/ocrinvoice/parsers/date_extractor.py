@@ -2,10 +2,18 @@
 
 import logging
 import re
-from typing import Optional, Tuple
+from typing import List, NamedTuple, Optional, Tuple
 from datetime import datetime
 
 
+class DateCandidate(NamedTuple):
+    """A parsed date found in the text, ranked by priority."""
+
+    date: str
+    source: str
+    priority: int
+
+
 class DateExtractor:
     """Robust date extraction from invoice text with OCR correction."""
 
@@ -93,27 +101,90 @@ class DateExtractor:
         "T": "7",
         "t": "7",  # T/t often misread as 7
     }
+    # Every correction is a single character, so one translate pass applies
+    # them all; years use the same table without the "i" correction
+    _OCR_TRANSLATION = str.maketrans(OCR_CORRECTIONS)
+    _YEAR_TRANSLATION = str.maketrans(
+        {wrong: right for wrong, right in OCR_CORRECTIONS.items() if wrong != "i"}
+    )
+    # Digit runs that contain a misread letter; a run must start at a digit
+    # boundary and hold at least one letter, so plain numbers (translate
+    # no-ops) are skipped without a substitution callback
+    _NUMERIC_PART_RE = re.compile(r"(?<!\d)\d+[IlOoSGBZAE]+\d*")
+    _DAY_RE = re.compile(r"\d{1,2}")
+    # Every robust date pattern needs a digit, so lines without one are
+    # rejected before the pattern battery
+    _DIGIT_RE = re.compile(r"\d")
+
+    # Robust date patterns, compiled once. They are matched against
+    # lower-cased lines, so they are written in lower case and skip
+    # IGNORECASE, whose per-character case folding roughly doubles scan time.
+    # The raw pattern string (``.pattern``) drives _parse_robust_date_match
+    # dispatch.
+    ROBUST_DATE_PATTERNS = tuple(
+        re.compile(pattern)
+        for pattern in (
+            r"(\d{3}[0-9Oo])\s*[/\-]\s*(\d{1,2})\s*[/\-]\s*(\d{1,2})",
+            r"(\d{1,2})\s*[/\-]\s*(\d{1,2})\s*[/\-]\s*(\d{3}[0-9Oo])",
+            r"(\d{1,2})\s+(january|february|march|april|may|june|july|august|september|october|november|december|jan|feb|mar|apr|jun|jul|aug|sep|oct|nov|dec)\s+(\d{3}[0-9Oo])",
+            r"(\d{1,2})\s+(janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre|jan|fév|mar|avr|juil|aoû|sept|oct|nov|déc|fevrier|aout|decembre)\s+(\d{3}[0-9Oo])",
+            r"(january|february|march|april|may|june|july|august|september|october|november|december|jan|feb|mar|apr|jun|jul|aug|sep|oct|nov|dec)\s+(\d{1,2}),?\s+(\d{3}[0-9Oo])",
+            r"(janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre|jan|fév|mar|avr|juil|aoû|sept|oct|nov|déc|fevrier|aout|decembre)\s+(\d{1,2}),?\s+(\d{3}[0-9Oo])",
+            r"(\d{1,2})\.(\d{1,2})\.(\d{3}[0-9Oo])",
+            r"(juillet|juil)\s+(\d{1,2})[il](\d{1,2})",
+            r"(juillet|juil)\s+(\d{4})",
+            r"(\d{1,2})\s+(jan|fév|mar|avr|mai|juin|juil|aoû|sept|oct|nov|déc|fevrier|aout|decembre)\s+(\d{3}[0-9OoSs])",
+            r"date\s+du\s+relevé\s*:\s*(\d{1,2})\s+(jan|fév|mar|avr|mai|juin|juil|aoû|sept|oct|nov|déc|fevrier|aout|decembre)\s+(\d{3}[0-9OoSs])",
+            r"date\s+du\s+relevé\s*:\s*(\d{1,2})\s+(jan|fév|mar|avr|mai|juin|juil|aoû|sept|oct|nov|déc|fevrier|aout|decembre)\s+(\d{3}[0-9OoSs])",
+        )
+    )
+
+    # Keywords marking a header line that likely carries the invoice date
+    DATE_KEYWORDS = (
+        "date",
+        "dated",
+        "daté",
+        "datée",
+        "facturé",
+        "facturée",
+        "billed",
+        "invoice date",
+        "date de facture",
+        "date de facturation",
+        "due date",
+        "date d'échéance",
+        "échéance",
+        "due",
+        "issued",
+        "émis",
+        "emission",
+        "émission",
+        "created",
+        "créé",
+        "créée",
+        "creation",
+        "création",
+        "modification",
+        "juillet",
+        "relevé",
+        "releve",
+    )
+    # One alternation scan per line instead of a substring test per keyword
+    _DATE_KEYWORD_RE = re.compile("|".join(map(re.escape, DATE_KEYWORDS)))
 
     @staticmethod
     def ocr_correct_date(text: str) -> str:
         """Apply OCR corrections to date text."""
-        corrected = text
-        for wrong, right in DateExtractor.OCR_CORRECTIONS.items():
-            corrected = corrected.replace(wrong, right)
-        return corrected
+        return text.translate(DateExtractor._OCR_TRANSLATION)
 
     @staticmethod
     def ocr_correct_numeric_only(text: str) -> str:
         """Apply OCR corrections only to numeric parts of dates."""
 
         def correct_numeric(match):
-            numeric_part = match.group(0)
-            corrected = numeric_part
-            for wrong, right in DateExtractor.OCR_CORRECTIONS.items():
-                corrected = corrected.replace(wrong, right)
-            return corrected
+            return match.group(0).translate(DateExtractor._OCR_TRANSLATION)
 
-        corrected = re.sub(r"\d+[IlOoSGBZAE]*\d*", correct_numeric, text)
+        corrected = DateExtractor._NUMERIC_PART_RE.sub(correct_numeric, text)
         return corrected
 
     @staticmethod
@@ -121,69 +192,31 @@ class DateExtractor:
         """Extract date from invoice text using multiple strategies with robust OCR error handling."""
         if not text:
             return None
-        lines = text.split("\n")
-        candidates = []
-        date_keywords = [
-            "date",
-            "dated",
-            "daté",
-            "datée",
-            "facturé",
-            "facturée",
-            "billed",
-            "invoice date",
-            "date de facture",
-            "date de facturation",
-            "due date",
-            "date d'échéance",
-            "échéance",
-            "due",
-            "issued",
-            "émis",
-            "emission",
-            "émission",
-            "created",
-            "créé",
-            "créée",
-            "creation",
-            "création",
-            "modification",
-            "juillet",
-            "relevé",
-            "releve",
+        candidates: List[DateCandidate] = []
+        # Dates live in the header; split off at most the first 30 lines
+        search_lines = text.split("\n", 30)[:30]
+        # Lower-cased once here and shared by the keyword and fallback passes
+        search_lines_lower = [line.lower() for line in search_lines]
+        # Only lines with a digit can hold a date
+        has_digit = [
+            DateExtractor._DIGIT_RE.search(line) is not None for line in search_lines
         ]
-        robust_date_patterns = [
-            r"(\d{3}[0-9Oo])\s*[/\-]\s*(\d{1,2})\s*[/\-]\s*(\d{1,2})",
-            r"(\d{1,2})\s*[/\-]\s*(\d{1,2})\s*[/\-]\s*(\d{3}[0-9Oo])",
-            r"(\d{1,2})\s+(january|february|march|april|may|june|july|august|september|october|november|december|jan|feb|mar|apr|jun|jul|aug|sep|oct|nov|dec)\s+(\d{3}[0-9Oo])",
-            r"(\d{1,2})\s+(janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre|jan|fév|mar|avr|juil|aoû|sept|oct|nov|déc|fevrier|aout|decembre)\s+(\d{3}[0-9Oo])",
-            r"(january|february|march|april|may|june|july|august|september|october|november|december|jan|feb|mar|apr|jun|jul|aug|sep|oct|nov|dec)\s+(\d{1,2}),?\s+(\d{3}[0-9Oo])",
-            r"(janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre|jan|fév|mar|avr|juil|aoû|sept|oct|nov|déc|fevrier|aout|decembre)\s+(\d{1,2}),?\s+(\d{3}[0-9Oo])",
-            r"(\d{1,2})\.(\d{1,2})\.(\d{3}[0-9Oo])",
-            r"(juillet|juil)\s+(\d{1,2})[Il](\d{1,2})",
-            r"(juillet|juil)\s+(\d{4})",
-            r"(\d{1,2})\s+(jan|fév|mar|avr|mai|juin|juil|aoû|sept|oct|nov|déc|fevrier|aout|decembre)\s+(\d{3}[0-9OoSs])",
-            r"date\s+du\s+relevé\s*:\s*(\d{1,2})\s+(jan|fév|mar|avr|mai|juin|juil|aoû|sept|oct|nov|déc|fevrier|aout|decembre)\s+(\d{3}[0-9OoSs])",
-            r"date\s+du\s+relevé\s*:\s*(\d{1,2})\s+(jan|fév|mar|avr|mai|juin|juil|aoû|sept|oct|nov|déc|fevrier|aout|decembre)\s+(\d{3}[0-9OoSs])",
-        ]
-        search_lines = lines[:30]
-        for i, line in enumerate(search_lines):
-            line_lower = line.lower()
-            if any(keyword in line_lower for keyword in date_keywords):
+        for i, (line, line_lower) in enumerate(zip(search_lines, search_lines_lower)):
+            if has_digit[i] and DateExtractor._DATE_KEYWORD_RE.search(line_lower):
                 logging.debug(f"Found date keyword in line {i}: {line.strip()}")
-                for pattern in robust_date_patterns:
-                    matches = re.findall(pattern, line, re.IGNORECASE)
+                for pattern in DateExtractor.ROBUST_DATE_PATTERNS:
+                    matches = pattern.findall(line_lower)
                     for match in matches:
                         logging.debug(
-                            f"Found robust date pattern match: {match} with pattern: {pattern}"
+                            f"Found robust date pattern match: {match} with pattern: {pattern.pattern}"
                         )
                         try:
                             parsed_date = DateExtractor._parse_robust_date_match(
-                                match, pattern
+                                match, pattern.pattern
                             )
                             if parsed_date:
                                 candidates.append(
-                                    (
+                                    DateCandidate(
                                         parsed_date,
                                         f"Robust date keyword match: {line.strip()}",
                                         20,
@@ -196,21 +229,25 @@ class DateExtractor:
                             )
                             continue
         if not candidates:
-            for i, line in enumerate(search_lines):
-                for pattern in robust_date_patterns:
-                    matches = re.findall(pattern, line, re.IGNORECASE)
+            for i, (line, line_lower) in enumerate(
+                zip(search_lines, search_lines_lower)
+            ):
+                if not has_digit[i]:
+                    continue
+                for pattern in DateExtractor.ROBUST_DATE_PATTERNS:
+                    matches = pattern.findall(line_lower)
                     for match in matches:
                         logging.debug(
-                            f"Found robust date pattern match (no keyword): {match} with pattern: {pattern}"
+                            f"Found robust date pattern match (no keyword): {match} with pattern: {pattern.pattern}"
                         )
                         try:
                             parsed_date = DateExtractor._parse_robust_date_match(
-                                match, pattern
+                                match, pattern.pattern
                             )
                             if parsed_date:
                                 priority = 15 if i < 10 else 10
                                 candidates.append(
-                                    (
+                                    DateCandidate(
                                         parsed_date,
                                         f"Robust pattern match: {line.strip()}",
                                         priority,
@@ -222,15 +259,16 @@ class DateExtractor:
                             )
                             continue
         if candidates:
-            candidates.sort(key=lambda x: (x[2]), reverse=True)
-            best_date, source_line, priority = candidates[0]
-            logging.info(f"Found invoice date: '{best_date}' from line: {source_line}")
-            return best_date
+            # First highest-priority candidate, as a stable descending sort gives
+            best = max(candidates, key=lambda candidate: candidate.priority)
+            logging.info(f"Found invoice date: '{best.date}' from line: {best.source}")
+            return best.date
         logging.info("No invoice date found")
         return None
 
     @staticmethod
     def _parse_robust_date_match(match: tuple, pattern: str) -> Optional[str]:
+        pattern_lower = pattern.lower()
         try:
             if len(match) == 3:
                 part1, part2, part3 = match
@@ -250,11 +288,11 @@ class DateExtractor:
                     year = int(part1_corrected)
                     month = int(part2_corrected)
                     day = int(part3_corrected)
-                elif pattern.startswith(r"(\d{1,2})") and "month" in pattern.lower():
+                elif pattern.startswith(r"(\d{1,2})") and "month" in pattern_lower:
                     day = int(part1_corrected)
                     month = DateExtractor._parse_month(part2)
                     year = int(part3_corrected)
-                elif "month" in pattern.lower() and pattern.startswith(
+                elif "month" in pattern_lower and pattern.startswith(
                     r"(january|février"
                 ):
                     month = DateExtractor._parse_month(part1)
@@ -269,7 +307,7 @@ class DateExtractor:
                     month = DateExtractor._parse_month(part1)
                     year = int(part2_corrected)
                     day = 1
-                elif "relevé" in pattern.lower():
+                elif "relevé" in pattern_lower:
                     day = int(part1_corrected)
                     month = DateExtractor._parse_month(part2)
                     year = int(part3_corrected)
@@ -307,27 +345,7 @@ class DateExtractor:
 
     @staticmethod
     def _apply_ocr_correction_to_year(match: str) -> Optional[int]:
-        year_str = match
-        year_str = (
-            year_str.replace("I", "1")
-            .replace("l", "1")
-            .replace("O", "0")
-            .replace("o", "0")
-            .replace("S", "5")
-            .replace("s", "5")
-            .replace("G", "6")
-            .replace("g", "6")
-            .replace("B", "8")
-            .replace("b", "8")
-            .replace("Z", "2")
-            .replace("z", "2")
-            .replace("A", "4")
-            .replace("a", "4")
-            .replace("E", "3")
-            .replace("e", "3")
-            .replace("T", "7")
-            .replace("t", "7")
-        )
+        year_str = match.translate(DateExtractor._YEAR_TRANSLATION)
         try:
             return int(year_str)
         except ValueError:
@@ -338,13 +356,13 @@ class DateExtractor:
         line_lower = line.lower()
         for month_name, month_num in DateExtractor.FRENCH_MONTHS.items():
             if month_name in line_lower:
-                day_match = re.search(r"(\d{1,2})", line_lower)
+                day_match = DateExtractor._DAY_RE.search(line_lower)
                 if day_match:
                     day = int(day_match.group(0))
                     return (month_num, day)
         for month_name, month_num in DateExtractor.ENGLISH_MONTHS.items():
             if month_name in line_lower:
-                day_match = re.search(r"(\d{1,2})", line_lower)
+                day_match = DateExtractor._DAY_RE.search(line_lower)
                 if day_match:
                     day = int(day_match.group(0))
                     return (month_num, day)
@@ -2,17 +2,157 @@
 
 import logging
 import re
+from bisect import bisect_left, bisect_right
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, List
-
-from .base_parser import BaseParser
+from typing import Callable, Dict, Any, Optional, Set, Union, List
+
+from .base_parser import (
+    ISO_DATE_RE,
+    BaseParser,
+    compile_keyword_line_pattern,
+    compile_keyword_pattern,
+)
 from .date_extractor import DateExtractor
 from ..business.business_mapping_manager import BusinessMappingManager
+from ..utils.substring_index import compile_substring_index
 
 
 class InvoiceParser(BaseParser):
     """Parser for extracting invoice data from PDFs using OCR."""
 
+    # Currency symbols removed in one pass before float conversion
+    _CURRENCY_SYMBOLS_TABLE = str.maketrans("", "", "$€£¥")
+
+    # Card payment lines that usually repeat the amount charged
+    _CARD_KEYWORDS = (
+        "mastercard",
+        "visa",
+        "amex",
+        "american express",
+        "credit card",
+        "debit card",
+        "card payment",
+    )
+    # "Total:" labels (tolerating OCR noise between "tota" and the colon) and
+    # card keywords fused into one zero-width alternation, so a single scan
+    # of the whole text finds both; the named group tells them apart.
+    # [^a-z\n] keeps a label within its line
+    _TOTAL_OR_CARD_RE = re.compile(
+        r"(?P<total>(?=tota[^a-z\n]*:))|(?P<card>%s)"
+        % compile_keyword_pattern(_CARD_KEYWORDS).pattern
+    )
+
+    # Header lines after which the company name usually follows, and labels
+    # that rule a line out as the company name; matched on upper-cased lines
+    # with one alternation scan each instead of a substring test per keyword
+    _HEADER_KEYWORD_RE = compile_keyword_pattern(("INVOICE", "BILL"))
+    _NON_COMPANY_KEYWORD_RE = compile_keyword_pattern(
+        ("TOTAL", "AMOUNT", "DUE", "BALANCE", "INVOICE", "BILL")
+    )
+
+    # Currency amounts, including whole numbers
+    _CURRENCY_AMOUNT_RE = re.compile(r"\$?\d+(?:[.,]\d{3})*(?:[.,]\d{2})?")
+
+    # Characters an amount token can contain, for aligning scan windows
+    _AMOUNT_CHARS = frozenset("$0123456789.,")
+
+    # Cheap pre-check for lines that cannot contain an amount
+    _DIGIT_RE = re.compile(r"\d")
+
+    # Manual patterns for common OCR amount errors, compiled once per class
+    # $1,076 ٠13 or $1,076.13
+    _AMOUNT_RE = re.compile(r"[\$€£¥]?\s*(\d{1,3}(?:,\d{3})*)\s*[٠٫٬\.]\s*(\d{2})")
+    # $1,076 ,.13
+    _COMMA_DOT_AMOUNT_RE = re.compile(
+        r"[\$€£¥]?\s*(\d{1,3}(?:,\d{3})*)\s*,\s*\.\s*(\d{2})"
+    )
+
+    # Rewrites applied to amount text before re-running the normalizer
+    # Arabic/Unicode decimal separators
+    _UNICODE_DECIMAL_RE = re.compile(r"[٠٫٬]")
+    # Space before decimal
+    _SPACE_BEFORE_DECIMAL_RE = re.compile(r"\s+\.\s*")
+    # Space after decimal
+    _SPACE_AFTER_DECIMAL_RE = re.compile(r"\.\s+")
+    # Decimal separators with spaces
+    _SPACED_DECIMAL_RE = re.compile(r"(\d{1,3}(?:,\d{3})*)\s*[٠٫٬\.]\s*(\d{2})")
+    # Comma-dot patterns
+    _SPACED_COMMA_DOT_RE = re.compile(r"(\d{1,3}(?:,\d{3})*)\s*,\s*\.\s*(\d{2})")
+    _SPACED_DOT_RE = re.compile(r"(\d+)\s*\.\s*(\d+)")
+
+    # Separators used to split a single run-on line of OCR text
+    _LONG_LINE_SPLIT_RE = re.compile(r"[;,]|\s{3,}")
+
+    # English month names, full name before abbreviation
+    _MONTH_ALTERNATION = "|".join(
+        (
+            "January|Jan",
+            "February|Feb",
+            "March|Mar",
+            "April|Apr",
+            "May",
+            "June|Jun",
+            "July|Jul",
+            "August|Aug",
+            "September|Sep",
+            "October|Oct",
+            "November|Nov",
+            "December|Dec",
+        )
+    )
+
+    # Fallback regexes for common date formats, compiled once per class
+    _DATE_PATTERNS = tuple(
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in (
+            r"\b(\d{4}-\d{2}-\d{2})\b",
+            r"\b(\d{2}/\d{2}/\d{4})\b",
+            r"\b(\d{2}-\d{2}-\d{4})\b",
+            r"\b(\d{1,2}/\d{1,2}/\d{4})\b",
+            r"\b(\d{1,2}-\d{1,2}-\d{4})\b",
+            r"\b(\d{1,2}/\d{1,2}/\d{2})\b",  # M/D/YY format
+            r"\b(\d{2}/\d{2}/\d{2})\b",  # MM/DD/YY format
+            # Month name patterns, one alternation per layout so each layout
+            # is a single scan and the earliest date in the text wins
+            r"\b(%s)\s+(\d{1,2}),?\s+(\d{4})\b" % _MONTH_ALTERNATION,
+            # Day month year patterns
+            r"\b(\d{1,2})\s+(%s)\s+(\d{4})\b" % _MONTH_ALTERNATION,
+        )
+    )
+
+    # Layouts of a single-group date match, checked to reorder it to ISO
+    _DD_MM_YYYY_SLASH_RE = re.compile(r"\d{2}/\d{2}/\d{4}")
+    _DD_MM_YYYY_DASH_RE = re.compile(r"\d{2}-\d{2}-\d{4}")
+    _D_M_YYYY_SLASH_RE = re.compile(r"\d{1,2}/\d{1,2}/\d{4}")
+    _D_M_YYYY_DASH_RE = re.compile(r"\d{1,2}-\d{1,2}-\d{4}")
+    _M_D_YY_SLASH_RE = re.compile(r"\d{1,2}/\d{1,2}/\d{2}")
+    _MM_DD_YY_SLASH_RE = re.compile(r"\d{2}/\d{2}/\d{2}")
+
+    # Checks on a captured invoice number
+    _DIGITS_ONLY_RE = re.compile(r"^\d+$")
+    _LETTER_RE = re.compile(r"[A-Z]", re.IGNORECASE)
+
+    # Invoice number patterns, tried in order of specificity
+    _INVOICE_NUMBER_PATTERNS = tuple(
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in (
+            r"invoice\s*number\s*:\s*([A-Z0-9\-]{4,})",  # Invoice Number: format
+            r"invoice\s*#\s*:\s*([A-Z0-9\-]{4,})",  # Invoice #: format
+            r"invoice\s*:\s*([A-Z0-9\-]{4,})",  # Invoice: format
+            r"inv\s*:\s*([A-Z0-9\-]{4,})",  # INV: format
+            r"bill\s*#\s*:\s*([A-Z0-9\-]{4,})",  # Bill #: format
+            r"bill\s*#\s*([A-Z0-9\-]{4,})",  # Bill # format
+            r"bill\s*#?\s*([A-Z0-9\-]{4,})",  # Fallback bill pattern
+            # Invoice ID: format (case insensitive)
+            r"invoice\s*id\s*:\s*([A-Z0-9\-]{4,})",
+            r"([A-Z]{2,4}-\d{4}-\d{3})",
+            r"([A-Z]{2,4}\d{4}\d{3})",
+            r"([A-Z]{2,4}-\d{3})",  # BILL-001 format
+            r"(\d{4}-\d{3})",  # 2023-001 format
+            r"(\d{4,})",  # Allow digit-only numbers if at least 4 digits
+        )
+    )
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         # Ensure config is never None
         config = config or {}
@@ -51,29 +191,24 @@ class InvoiceParser(BaseParser):
         if text is None:
             text = ""
 
-        # Try extraction on raw text first, then fallback to corrected text if not found
-        ocr_corrections = self.ocr_corrections
-        corrected_text = ocr_corrections.correct_text(text)
-
-        # Company
-        company = self.extract_company(text)
-        if not company:
-            company = self.extract_company(corrected_text)
-
-        # Total
-        total = self.extract_total(text)
-        if not total:
-            total = self.extract_total(corrected_text)
-
-        # Date
-        date = self.extract_date(text)
-        if not date:
-            date = self.extract_date(corrected_text)
-
-        # Invoice number
-        invoice_number = self.extract_invoice_number(text)
-        if not invoice_number:
-            invoice_number = self.extract_invoice_number(corrected_text)
+        # Try extraction on raw text first, then fallback to corrected text if not found.
+        # The OCR correction pass only runs once some field needs it, so clean
+        # text never pays for it
+        corrected_text: Optional[str] = None
+
+        def extract_with_fallback(extract: Callable[[str], Any]) -> Any:
+            nonlocal corrected_text
+            value = extract(text)
+            if not value:
+                if corrected_text is None:
+                    corrected_text = self.ocr_corrections.correct_text(text)
+                value = extract(corrected_text)
+            return value
+
+        company = extract_with_fallback(self.extract_company)
+        total = extract_with_fallback(self.extract_total)
+        date = extract_with_fallback(self.extract_date)
+        invoice_number = extract_with_fallback(self.extract_invoice_number)
 
         result = {
             "company": company,
@@ -137,43 +272,39 @@ class InvoiceParser(BaseParser):
         text_lower = text.lower()
         known_companies = self.config.get("known_companies", [])
         if known_companies:
-            for company in known_companies:
-                if company.lower() in text_lower:
-                    self.logger.debug(
-                        f"extract_company: Found known company: '{company}'"
-                    )
-                    return company.lower()
+            # One pass over the text finds every known company at once
+            company = compile_substring_index(tuple(known_companies)).first_match(
+                text_lower
+            )
+            if company is not None:
+                self.logger.debug(f"extract_company: Found known company: '{company}'")
+                return company.lower()
         # 2. After 'INVOICE' or similar, next non-empty line is likely company
         found_header = False
+        company_keywords = tuple(keyword.lower() for keyword in self.company_keywords)
+        company_keyword_re = (
+            compile_keyword_pattern(company_keywords) if company_keywords else None
+        )
         for line in search_lines:
             if not line:
                 continue
+            # Case-fold each line once and reuse it for every keyword check
+            line_lower = line.lower()
+            line_upper = line.upper()
             # Do not return lines that look like dates or contain 'Date:'
-            if re.match(r"\d{4}-\d{2}-\d{2}", line) or "date:" in line.lower():
+            if ISO_DATE_RE.match(line) or "date:" in line_lower:
                 continue
-            if any(
-                keyword.lower() in line.lower() for keyword in self.company_keywords
-            ):
+            if company_keyword_re and company_keyword_re.search(line_lower):
                 parts = line.split(":", 1)
                 if len(parts) > 1:
                     company = parts[1].strip()
                     if company:
                         return company.lower()
-            if not found_header and any(h in line.upper() for h in ["INVOICE", "BILL"]):
+            if not found_header and self._HEADER_KEYWORD_RE.search(line_upper):
                 found_header = True
                 continue
-            if (
-                found_header
-                and line
-                and not any(
-                    kw in line.upper()
-                    for kw in ["TOTAL", "AMOUNT", "DUE", "BALANCE", "INVOICE", "BILL"]
-                )
-            ):
-                # Do not return lines that look like dates or contain 'Date:'
-                if re.match(r"\d{4}-\d{2}-\d{2}", line) or "date:" in line.lower():
-                    continue
-                return line.lower()
+            if found_header and not self._NON_COMPANY_KEYWORD_RE.search(line_upper):
+                return line_lower
         # 3. Fuzzy match: extract candidate lines and match to known_companies
         # Note: This fallback is only used if BusinessMappingManager is not available
         # All business names should be configured in business_aliases.json
@@ -183,16 +314,16 @@ class InvoiceParser(BaseParser):
         candidate_lines = [
             line
             for line in lines
-            if line
-            and not re.match(r"\d{4}-\d{2}-\d{2}", line)
-            and "date:" not in line.lower()
+            if line and not ISO_DATE_RE.match(line) and "date:" not in line.lower()
         ]
         best_match = None
         best_score = 0.0
         known_companies = self.config.get("known_companies", [])
         if known_companies:
-            for candidate in candidate_lines:
-                match, score = fuzzy_matcher.find_best_match(candidate, known_companies)
+            # All candidate lines are scored against the companies in one batch
+            for match, score in fuzzy_matcher.find_best_matches(
+                candidate_lines, known_companies
+            ):
                 if score > best_score:
                     best_score = score
                     best_match = match
@@ -212,41 +343,48 @@ class InvoiceParser(BaseParser):
         ) -> List[str]:
             """Find currency amounts within max_distance characters of any keyword."""
             amounts: List[str] = []
-            text_lower = text.lower()
-            # Find all keyword positions
-            keyword_positions: List[int] = []
-            for keyword in keywords:
-                pos = 0
+            # Find all keyword positions in a single pass over the text. The
+            # scan is case-insensitive on text itself: lower() can lengthen
+            # a string ("İ"), so its offsets would not line up with text
+            keyword_pattern = compile_keyword_pattern(tuple(keywords), re.IGNORECASE)
+            keyword_positions: List[int] = [
+                match.start() for match in keyword_pattern.finditer(text)
+            ]
+
+            def is_near_keyword(offset: int) -> bool:
+                index = bisect_left(keyword_positions, offset - max_distance)
+                return (
+                    index < len(keyword_positions)
+                    and keyword_positions[index] <= offset + max_distance
+                )
+
+            # Scan for amounts only in the windows around keyword anchors.
+            # A window start is moved back over amount characters so the
+            # scan never begins mid-number, keeping tokens identical to a
+            # full-text scan; pos carries on from the previous window.
+            amount_re = self._CURRENCY_AMOUNT_RE
+            amount_chars = self._AMOUNT_CHARS
+            pos = 0
+            for keyword_pos in keyword_positions:
+                window_start = keyword_pos - max_distance
+                if window_start > pos:
+                    while window_start > pos and text[window_start - 1] in amount_chars:
+                        window_start -= 1
+                    pos = window_start
+                window_end = keyword_pos + max_distance
                 while True:
-                    pos = text_lower.find(keyword, pos)
-                    if pos == -1:
-                        break
-                    keyword_positions.append(pos)
-                    pos += 1
-            # Find all currency amounts (including whole numbers)
-            currency_pattern = r"\$?\d+(?:[.,]\d{3})*(?:[.,]\d{2})?"
-            for match in re.finditer(currency_pattern, text):
-                amount_start = match.start()
-                amount_end = match.end()
-                amount_text = match.group()
-                # Check if this amount is near any keyword
-                for keyword_pos in keyword_positions:
-                    if (
-                        abs(amount_start - keyword_pos) <= max_distance
-                        or abs(amount_end - keyword_pos) <= max_distance
-                    ):
-                        amounts.append(amount_text)
+                    match = amount_re.search(text, pos)
+                    if match is None or match.start() > window_end:
                         break
+                    pos = match.end()
+                    # Check if this amount is near any keyword
+                    if is_near_keyword(match.start()) or is_near_keyword(pos):
+                        amounts.append(match.group())
             return amounts
 
         def normalize_amount(amount_str: str) -> float:
             """Convert amount string to float, handling different decimal separators."""
-            cleaned = (
-                amount_str.replace("$", "")
-                .replace("€", "")
-                .replace("£", "")
-                .replace("¥", "")
-            )
+            cleaned = amount_str.translate(self._CURRENCY_SYMBOLS_TABLE)
             if "," in cleaned and "." in cleaned:
                 comma_pos = cleaned.rfind(",")
                 dot_pos = cleaned.rfind(".")
@@ -333,13 +471,16 @@ class InvoiceParser(BaseParser):
 
         # Fallback: line-based search for amounts on lines containing keywords
         print("[DEBUG] Proximity search failed, trying line-based fallback.")
-        lines = [line.strip() for line in text.split("\n")]
+        # One scan over the whole text yields each keyword line; amounts are
+        # then read in place via pos/endpos without slicing out the line
+        keyword_lines = compile_keyword_line_pattern(tuple(total_keywords))
         line_amounts = []
-        for line in lines:
-            line_lower = line.lower()
-            if any(kw in line_lower for kw in total_keywords):
-                found = re.findall(r"\$?\d+(?:[.,]\d{3})*(?:[.,]\d{2})?", line)
-                line_amounts.extend(found)
+        for line_match in keyword_lines.finditer(text):
+            line_amounts.extend(
+                self._CURRENCY_AMOUNT_RE.findall(
+                    text, line_match.start(), line_match.end()
+                )
+            )
         print("[DEBUG] Line-based fallback amounts:", line_amounts)
         line_floats = filter_valid_amounts(line_amounts)
         line_floats = filter_out_years_and_small_ints(line_floats)
@@ -362,10 +503,11 @@ class InvoiceParser(BaseParser):
                 )
                 return float(most_common)
 
-        lines = [line.strip() for line in text.split("\n")]
-        if len(lines) == 1 and len(lines[0]) > 200:
-            long_line = lines[0]
-            split_text = re.split(r"[;,]|\s{3,}", long_line)
+        # Lines are stripped lazily, only once they pass the label checks
+        lines = text.split("\n")
+        if len(lines) == 1 and len(lines[0].strip()) > 200:
+            long_line = lines[0].strip()
+            split_text = self._LONG_LINE_SPLIT_RE.split(long_line)
             lines = [line.strip() for line in split_text if line.strip()]
 
         def find_total_candidates(
@@ -374,30 +516,30 @@ class InvoiceParser(BaseParser):
             total_amounts: List[str] = []
             preferred_amounts: List[str] = []
             total_line_amounts: List[str] = []
-            for line in lines:
-                line_lower = line.lower()
-                if (
-                    re.search(r"tota[^a-z]*\s*:", line_lower)
-                    and "subtotal:" not in line_lower
-                ):
-                    amounts = extract_amounts_func(line)
+            # Scan the lower-cased lines once as a single text and note which
+            # kinds of keyword each line holds; lines without any are skipped
+            lines_lower = "\n".join(lines).lower().split("\n")
+            line_starts: List[int] = []
+            offset = 0
+            for line_lower in lines_lower:
+                line_starts.append(offset)
+                offset += len(line_lower) + 1
+            line_kinds: Dict[int, Set[str]] = {}
+            for match in self._TOTAL_OR_CARD_RE.finditer("\n".join(lines_lower)):
+                index = bisect_right(line_starts, match.start()) - 1
+                line_kinds.setdefault(index, set()).add(match.lastgroup)
+            for index in sorted(line_kinds):
+                line = lines[index]
+                line_lower = lines_lower[index]
+                kinds = line_kinds[index]
+                if "total" in kinds and "subtotal:" not in line_lower:
+                    amounts = extract_amounts_func(line.strip())
                     if amounts:
                         total_amounts.extend(amounts)
                         preferred_amounts.extend(amounts)
                         total_line_amounts.extend(amounts)
-                elif any(
-                    keyword in line_lower
-                    for keyword in [
-                        "mastercard",
-                        "visa",
-                        "amex",
-                        "american express",
-                        "credit card",
-                        "debit card",
-                        "card payment",
-                    ]
-                ):
-                    amounts = extract_amounts_func(line)
+                elif "card" in kinds:
+                    amounts = extract_amounts_func(line.strip())
                     if amounts:
                         total_amounts.extend(amounts)
                         preferred_amounts.extend(amounts)
@@ -437,16 +579,18 @@ class InvoiceParser(BaseParser):
 
     def _extract_amounts_with_ocr_correction(self, text: str) -> List[str]:
         """Extract amounts from text with enhanced OCR correction."""
+        # Every amount pattern needs a digit; skip the regex passes otherwise
+        if not self._DIGIT_RE.search(text):
+            return []
+
         # First try the normal amount normalizer
         amounts = self.amount_normalizer.extract_amounts_from_text(text)
 
         # Try with additional OCR corrections
         corrected_text = text
-        # Arabic/Unicode decimal separators
-        corrected_text = re.sub(r"[٠٫٬]", ".", corrected_text)
-        # Space before decimal
-        corrected_text = re.sub(r"\s+\.\s*", ".", corrected_text)
-        corrected_text = re.sub(r"\.\s+", ".", corrected_text)  # Space after decimal
+        corrected_text = self._UNICODE_DECIMAL_RE.sub(".", corrected_text)
+        corrected_text = self._SPACE_BEFORE_DECIMAL_RE.sub(".", corrected_text)
+        corrected_text = self._SPACE_AFTER_DECIMAL_RE.sub(".", corrected_text)
         more_amounts = self.amount_normalizer.extract_amounts_from_text(corrected_text)
         for amt in more_amounts:
             if amt not in amounts:
@@ -454,27 +598,17 @@ class InvoiceParser(BaseParser):
 
         # More aggressive OCR correction
         corrected_text = text
-        # Fix decimal separators with spaces
-        pattern1 = r"(\d{1,3}(?:,\d{3})*)\s*[٠٫٬\.]\s*(\d{2})"
-        corrected_text = re.sub(pattern1, r"\1.\2", corrected_text)
-        # Fix comma-dot patterns
-        pattern2 = r"(\d{1,3}(?:,\d{3})*)\s*,\s*\.\s*(\d{2})"
-        corrected_text = re.sub(pattern2, r"\1.\2", corrected_text)
-        corrected_text = re.sub(r"(\d+)\s*\.\s*(\d+)", r"\1.\2", corrected_text)
+        corrected_text = self._SPACED_DECIMAL_RE.sub(r"\1.\2", corrected_text)
+        corrected_text = self._SPACED_COMMA_DOT_RE.sub(r"\1.\2", corrected_text)
+        corrected_text = self._SPACED_DOT_RE.sub(r"\1.\2", corrected_text)
         more_amounts = self.amount_normalizer.extract_amounts_from_text(corrected_text)
         for amt in more_amounts:
             if amt not in amounts:
                 amounts.append(amt)
 
         # Manual pattern matching for common OCR errors
-        patterns = [
-            # $1,076 ٠13 or $1,076.13
-            r"[\$€£¥]?\s*(\d{1,3}(?:,\d{3})*)\s*[٠٫٬\.]\s*(\d{2})",
-            # $1,076 ,.13
-            r"[\$€£¥]?\s*(\d{1,3}(?:,\d{3})*)\s*,\s*\.\s*(\d{2})",
-        ]
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
+        for pattern in (self._AMOUNT_RE, self._COMMA_DOT_AMOUNT_RE):
+            matches = pattern.findall(text)
             for match in matches:
                 if len(match) == 2:
                     amount_str = f"${match[0]}.{match[1]}"
@@ -489,42 +623,6 @@ class InvoiceParser(BaseParser):
         date = DateExtractor.extract_date_from_text(text)
         if date:
             return date
-        # Fallback: regex for common date formats
-        date_patterns = [
-            r"\b(\d{4}-\d{2}-\d{2})\b",
-            r"\b(\d{2}/\d{2}/\d{4})\b",
-            r"\b(\d{2}-\d{2}-\d{4})\b",
-            r"\b(\d{1,2}/\d{1,2}/\d{4})\b",
-            r"\b(\d{1,2}-\d{1,2}-\d{4})\b",
-            r"\b(\d{1,2}/\d{1,2}/\d{2})\b",  # M/D/YY format
-            r"\b(\d{2}/\d{2}/\d{2})\b",  # MM/DD/YY format
-            # Month name patterns
-            r"\b(January|Jan)\s+(\d{1,2}),?\s+(\d{4})\b",
-            r"\b(February|Feb)\s+(\d{1,2}),?\s+(\d{4})\b",
-            r"\b(March|Mar)\s+(\d{1,2}),?\s+(\d{4})\b",
-            r"\b(April|Apr)\s+(\d{1,2}),?\s+(\d{4})\b",
-            r"\b(May)\s+(\d{1,2}),?\s+(\d{4})\b",
-            r"\b(June|Jun)\s+(\d{1,2}),?\s+(\d{4})\b",
-            r"\b(July|Jul)\s+(\d{1,2}),?\s+(\d{4})\b",
-            r"\b(August|Aug)\s+(\d{1,2}),?\s+(\d{4})\b",
-            r"\b(September|Sep)\s+(\d{1,2}),?\s+(\d{4})\b",
-            r"\b(October|Oct)\s+(\d{1,2}),?\s+(\d{4})\b",
-            r"\b(November|Nov)\s+(\d{1,2}),?\s+(\d{4})\b",
-            r"\b(December|Dec)\s+(\d{1,2}),?\s+(\d{4})\b",
-            # Day month year patterns
-            r"\b(\d{1,2})\s+(January|Jan)\s+(\d{4})\b",
-            r"\b(\d{1,2})\s+(February|Feb)\s+(\d{4})\b",
-            r"\b(\d{1,2})\s+(March|Mar)\s+(\d{4})\b",
-            r"\b(\d{1,2})\s+(April|Apr)\s+(\d{4})\b",
-            r"\b(\d{1,2})\s+(May)\s+(\d{4})\b",
-            r"\b(\d{1,2})\s+(June|Jun)\s+(\d{4})\b",
-            r"\b(\d{1,2})\s+(July|Jul)\s+(\d{4})\b",
-            r"\b(\d{1,2})\s+(August|Aug)\s+(\d{4})\b",
-            r"\b(\d{1,2})\s+(September|Sep)\s+(\d{4})\b",
-            r"\b(\d{1,2})\s+(October|Oct)\s+(\d{4})\b",
-            r"\b(\d{1,2})\s+(November|Nov)\s+(\d{4})\b",
-            r"\b(\d{1,2})\s+(December|Dec)\s+(\d{4})\b",
-        ]
 
         month_map = {
             "january": "01",
@@ -552,27 +650,27 @@ class InvoiceParser(BaseParser):
             "dec": "12",
         }
 
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in self._DATE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 if len(match.groups()) == 1:
                     # Simple pattern like YYYY-MM-DD or DD/MM/YYYY
                     d = match.group(1)
-                    if re.match(r"\d{2}/\d{2}/\d{4}", d):
+                    if self._DD_MM_YYYY_SLASH_RE.match(d):
                         # Convert DD/MM/YYYY to YYYY-MM-DD
                         parts = d.split("/")
                         d = f"{parts[2]}-{parts[1]}-{parts[0]}"
-                    elif re.match(r"\d{2}-\d{2}-\d{4}", d):
+                    elif self._DD_MM_YYYY_DASH_RE.match(d):
                         parts = d.split("-")
                         d = f"{parts[2]}-{parts[1]}-{parts[0]}"
-                    elif re.match(r"\d{1,2}/\d{1,2}/\d{4}", d):
+                    elif self._D_M_YYYY_SLASH_RE.match(d):
                         # Convert D/M/YYYY to YYYY-MM-DD
                         parts = d.split("/")
                         d = f"{parts[2]}-{parts[1].zfill(2)}-{parts[0].zfill(2)}"
-                    elif re.match(r"\d{1,2}-\d{1,2}-\d{4}", d):
+                    elif self._D_M_YYYY_DASH_RE.match(d):
                         parts = d.split("-")
                         d = f"{parts[2]}-{parts[1].zfill(2)}-{parts[0].zfill(2)}"
-                    elif re.match(r"\d{1,2}/\d{1,2}/\d{2}", d):
+                    elif self._M_D_YY_SLASH_RE.match(d):
                         # Convert M/D/YY to YYYY-MM-DD
                         parts = d.split("/")
                         year = parts[2]
@@ -582,7 +680,7 @@ class InvoiceParser(BaseParser):
                         else:
                             year = "19" + year
                         d = f"{year}-{parts[1].zfill(2)}-{parts[0].zfill(2)}"
-                    elif re.match(r"\d{2}/\d{2}/\d{2}", d):
+                    elif self._MM_DD_YY_SLASH_RE.match(d):
                         # Convert MM/DD/YY to YYYY-MM-DD
                         parts = d.split("/")
                         year = parts[2]
@@ -611,45 +709,26 @@ class InvoiceParser(BaseParser):
     def extract_invoice_number(self, text: str) -> Optional[str]:
         if not text:
             return None
-        # Invoice number patterns
-        patterns = [
-            r"invoice\s*number\s*:\s*([A-Z0-9\-]{4,})",  # Invoice Number: format
-            r"invoice\s*#\s*:\s*([A-Z0-9\-]{4,})",  # Invoice #: format
-            r"invoice\s*:\s*([A-Z0-9\-]{4,})",  # Invoice: format
-            r"inv\s*:\s*([A-Z0-9\-]{4,})",  # INV: format
-            r"bill\s*#\s*:\s*([A-Z0-9\-]{4,})",  # Bill #: format
-            r"bill\s*#\s*([A-Z0-9\-]{4,})",  # Bill # format
-            r"bill\s*#?\s*([A-Z0-9\-]{4,})",  # Fallback bill pattern
-            # Invoice ID: format (case insensitive)
-            r"invoice\s*id\s*:\s*([A-Z0-9\-]{4,})",
-            r"([A-Z]{2,4}-\d{4}-\d{3})",
-            r"([A-Z]{2,4}\d{4}\d{3})",
-            r"([A-Z]{2,4}-\d{3})",  # BILL-001 format
-            r"(\d{4}-\d{3})",  # 2023-001 format
-            r"(\d{4,})",  # Allow digit-only numbers if at least 4 digits
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in self._INVOICE_NUMBER_PATTERNS:
+            match = pattern.search(text)
             if match:
                 group = match.group(1)
                 # Only return if not just the keyword and looks like a real invoice number
                 if group and group.lower() not in ["invoice", "bill", "inv", "number"]:
                     # For digit-only patterns, must be at least 4 digits and not look like a year
-                    if re.match(r"^\d+$", group):
+                    if self._DIGITS_ONLY_RE.match(group):
                         if len(group) >= 4 and not (
                             len(group) == 4 and group.startswith("20")
                         ):
                             return group
                     # Must contain at least one digit and one letter for other patterns
-                    elif re.search(r"[A-Z]", group, re.IGNORECASE) and re.search(
-                        r"\d", group
-                    ):
+                    elif self._LETTER_RE.search(group) and self._DIGIT_RE.search(group):
                         return group
                     # For patterns with digits and hyphens (like 2023-001), must contain digits
-                    elif re.search(r"\d", group) and "-" in group:
+                    elif self._DIGIT_RE.search(group) and "-" in group:
                         return group
                     # For alphanumeric patterns without digits (like ABC123)
-                    elif re.search(r"[A-Z]", group, re.IGNORECASE) and len(group) >= 4:
+                    elif self._LETTER_RE.search(group) and len(group) >= 4:
                         return group
         return None
 
@@ -666,7 +745,7 @@ class InvoiceParser(BaseParser):
         has_date = (
             bool(data.get("date"))
             and isinstance(data.get("date"), str)
-            and bool(re.match(r"\d{4}-\d{2}-\d{2}", data.get("date", "")))
+            and bool(ISO_DATE_RE.match(data.get("date", "")))
         )
         has_invoice_number = bool(data.get("invoice_number"))
 
@@ -9,10 +9,12 @@ from .fuzzy_matcher import FuzzyMatcher
 from .ocr_corrections import OCRCorrections
 from .amount_normalizer import AmountNormalizer
 from .filename_utils import FilenameUtils
+from .substring_index import SubstringIndex
 
 __all__ = [
     "FuzzyMatcher",
     "OCRCorrections",
     "AmountNormalizer",
     "FilenameUtils",
+    "SubstringIndex",
 ]
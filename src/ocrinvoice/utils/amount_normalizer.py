@@ -12,6 +12,35 @@ class AmountNormalizer:
     extracted from OCR text, handling various formats and common OCR errors.
     """
 
+    # Characters stripped while cleaning, compiled once per class
+    _NON_AMOUNT_CHARS_RE = re.compile(r"[^\d.,\-$€£¥%]")
+    _CURRENCY_SYMBOLS_RE = re.compile(r"[\$€£¥]")
+
+    # Amount patterns
+    _AMOUNT_PATTERNS = tuple(
+        re.compile(pattern)
+        for pattern in (
+            r"[\$€£¥]?\s*\d{1,3}(?:,\d{3})*(?:\.\d{2})?",  # $1,234.56
+            r"[\$€£¥]?\s*\d+\.\d{2}",  # $123.45
+            r"[\$€£¥]?\s*\d+",  # $123
+            r"\d{1,3}(?:,\d{3})*(?:\.\d{2})?\s*[\$€£¥]",  # 1,234.56$
+            r"\d+\.\d{2}\s*[\$€£¥]",  # 123.45$
+        )
+    )
+
+    # Every amount pattern needs a digit; text without one skips them all
+    _DIGIT_RE = re.compile(r"\d")
+
+    # Range patterns
+    _RANGE_PATTERNS = tuple(
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in (
+            r"([\d,]+\.?\d*)\s*[-–—]\s*([\d,]+\.?\d*)",  # 100-200
+            r"([\d,]+\.?\d*)\s+to\s+([\d,]+\.?\d*)",  # 100 to 200
+            r"([\d,]+\.?\d*)\s*-\s*([\d,]+\.?\d*)",  # 100 - 200
+        )
+    )
+
     def __init__(self, default_currency: str = "USD") -> None:
         """Initialize the amount normalizer.
 
@@ -30,6 +59,8 @@ class AmountNormalizer:
             "B": "8",  # Letter B to eight
             "g": "9",  # Lowercase G to nine
         }
+        # All corrections are single characters, so they apply in one pass
+        self._ocr_table: Dict[int, str] = str.maketrans(self.ocr_corrections)
 
     def normalize_amount(self, amount_str: str) -> Optional[str]:
         """Normalize a monetary amount string.
@@ -71,7 +102,7 @@ class AmountNormalizer:
         cleaned = " ".join(amount_str.split())
 
         # Remove common non-numeric characters except decimal point and comma
-        cleaned = re.sub(r"[^\d.,\-$€£¥%]", "", cleaned)
+        cleaned = self._NON_AMOUNT_CHARS_RE.sub("", cleaned)
 
         # Handle negative amounts
         if cleaned.startswith("-"):
@@ -81,10 +112,10 @@ class AmountNormalizer:
             is_negative = False
 
         # Remove currency symbols for processing
-        cleaned = re.sub(r"[\$€£¥]", "", cleaned)
+        cleaned = self._CURRENCY_SYMBOLS_RE.sub("", cleaned)
 
         # Remove percentage signs
-        cleaned = re.sub(r"%", "", cleaned)
+        cleaned = cleaned.replace("%", "")
 
         # Add back negative sign if needed
         if is_negative:
@@ -101,13 +132,8 @@ class AmountNormalizer:
         Returns:
             Corrected amount string
         """
-        corrected = amount_str
-
         # Apply character corrections
-        for incorrect, correct in self.ocr_corrections.items():
-            corrected = corrected.replace(incorrect, correct)
-
-        return corrected
+        return amount_str.translate(self._ocr_table)
 
     def _extract_numeric_value(self, amount_str: str) -> Optional[Decimal]:
         """Extract numeric value from amount string.
@@ -166,14 +192,8 @@ class AmountNormalizer:
             Dictionary with min and max values or None if invalid
         """
         # Look for range patterns
-        range_patterns = [
-            r"([\d,]+\.?\d*)\s*[-–—]\s*([\d,]+\.?\d*)",  # 100-200
-            r"([\d,]+\.?\d*)\s+to\s+([\d,]+\.?\d*)",  # 100 to 200
-            r"([\d,]+\.?\d*)\s*-\s*([\d,]+\.?\d*)",  # 100 - 200
-        ]
-
-        for pattern in range_patterns:
-            match = re.search(pattern, amount_str, re.IGNORECASE)
+        for pattern in self._RANGE_PATTERNS:
+            match = pattern.search(amount_str)
             if match:
                 min_str = match.group(1)
                 max_str = match.group(2)
@@ -195,18 +215,12 @@ class AmountNormalizer:
         Returns:
             List of normalized amount strings
         """
-        # Amount patterns
-        amount_patterns = [
-            r"[\$€£¥]?\s*\d{1,3}(?:,\d{3})*(?:\.\d{2})?",  # $1,234.56
-            r"[\$€£¥]?\s*\d+\.\d{2}",  # $123.45
-            r"[\$€£¥]?\s*\d+",  # $123
-            r"\d{1,3}(?:,\d{3})*(?:\.\d{2})?\s*[\$€£¥]",  # 1,234.56$
-            r"\d+\.\d{2}\s*[\$€£¥]",  # 123.45$
-        ]
+        amounts: List[str] = []
+        if not self._DIGIT_RE.search(text):
+            return amounts
 
-        amounts = []
-        for pattern in amount_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in self._AMOUNT_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 normalized = self.normalize_amount(match)
                 if normalized:
@@ -1,9 +1,127 @@
 """Fuzzy string matching utilities for OCR text processing."""
 
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 import re
-from difflib import SequenceMatcher
-from fuzzywuzzy import fuzz
+
+try:
+    # RapidFuzz's scorers are implemented in C++ (bit-parallel Levenshtein)
+    import numpy as np
+    from rapidfuzz import fuzz, process
+    from rapidfuzz.utils import default_process
+except ImportError:
+    from fuzzywuzzy import fuzz
+
+    process = None
+    default_process = None
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+# Patterns for the extract_* and is_likely_* helpers, compiled once
+_NUMBER_PATTERNS = (
+    re.compile(r"\d+\.?\d*"),  # Decimal numbers
+    re.compile(r"\$\d+\.?\d*"),  # Dollar amounts
+    re.compile(r"\d+%"),  # Percentages
+)
+_DATE_PATTERNS = (
+    re.compile(r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}"),  # MM/DD/YYYY or MM-DD-YYYY
+    re.compile(r"\d{4}[/-]\d{1,2}[/-]\d{1,2}"),  # YYYY/MM/DD or YYYY-MM-DD
+    re.compile(r"\w+\s+\d{1,2},?\s+\d{4}"),  # Month DD, YYYY
+)
+_AMOUNT_PATTERNS = (
+    re.compile(r"[\$]?\d{1,3}(?:,\d{3})*(?:\.\d{2})?"),  # $1,234.56 or 1234.56
+    re.compile(r"[\$]?\d+\.\d{2}"),  # $123.45 or 123.45
+    re.compile(r"[\$]?\d+"),  # $123 or 123
+)
+_COMPANY_INDICATOR_PATTERNS = (
+    re.compile(r"\b(?:inc|corp|llc|ltd|co|company|corporation|limited)\b"),
+    re.compile(r"\b(?:&|and)\b"),
+    re.compile(r"[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*"),  # Title case words
+)
+_WHOLE_AMOUNT_PATTERNS = (
+    re.compile(r"^[\$]?\d{1,3}(?:,\d{3})*(?:\.\d{2})?$"),
+    re.compile(r"^[\$]?\d+\.\d{2}$"),
+    re.compile(r"^[\$]?\d+$"),
+)
+_WHOLE_DATE_PATTERNS = (
+    re.compile(r"^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}$"),
+    re.compile(r"^\d{4}[/-]\d{1,2}[/-]\d{1,2}$"),
+    re.compile(r"^\w+\s+\d{1,2},?\s+\d{4}$"),
+)
+
+
+@lru_cache(maxsize=4096)
+def _preprocess(
+    text: str,
+    case_sensitive: bool,
+    remove_punctuation: bool,
+    normalize_whitespace: bool,
+) -> str:
+    """Preprocess text for matching, memoized on the text and matcher flags.
+
+    Business names are compared against the same candidates over and over, so
+    caching the cleaned form avoids redoing the regex and split/join per call.
+    """
+    processed = text
+
+    # Case sensitivity
+    if not case_sensitive:
+        processed = processed.lower()
+
+    # Punctuation removal
+    if remove_punctuation:
+        # Remove punctuation but preserve spaces
+        processed = _PUNCTUATION_RE.sub("", processed)
+
+    # Whitespace normalization (after punctuation removal)
+    if normalize_whitespace:
+        processed = " ".join(processed.split())
+
+    return processed.strip()
+
+
+@lru_cache(maxsize=1024)
+def _match_masks(s: str) -> Dict[str, int]:
+    """Return the per-character match bit vectors of a string.
+
+    Bit i of masks[c] is set when s[i] == c. The query side of a comparison is
+    the same for every candidate, so the vectors are built once and reused.
+    The returned dict is shared between callers and must not be modified.
+    """
+    masks: Dict[str, int] = {}
+    for i, char in enumerate(s):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def indel_ratio(s1: str, s2: str) -> float:
+    """Return the Indel similarity 2 * LCS / (len(s1) + len(s2)) of two strings.
+
+    The LCS length is computed with Hyyrö's bit-parallel algorithm, using a
+    Python int as the bit vector for s1: each character of s2 costs a handful
+    of integer operations instead of a row of the O(m * n) dynamic program.
+
+    Args:
+        s1: First string to compare
+        s2: Second string to compare
+
+    Returns:
+        Similarity score between 0.0 and 1.0
+    """
+    total = len(s1) + len(s2)
+    if not total:
+        return 1.0
+
+    masks = _match_masks(s1)
+    all_ones = (1 << len(s1)) - 1
+    v = all_ones
+    for char in s2:
+        u = v & masks.get(char, 0)
+        v = ((v + u) | (v - u)) & all_ones
+
+    # Every cleared bit of v is one character of the LCS
+    lcs = len(s1) - bin(v).count("1")
+    return 2.0 * lcs / total
 
 
 class FuzzyMatcher:
@@ -47,22 +165,12 @@ class FuzzyMatcher:
         if not text:
             return ""
 
-        processed = text
-
-        # Case sensitivity
-        if not self.case_sensitive:
-            processed = processed.lower()
-
-        # Punctuation removal
-        if self.remove_punctuation:
-            # Remove punctuation but preserve spaces
-            processed = re.sub(r"[^\w\s]", "", processed)
-
-        # Whitespace normalization (after punctuation removal)
-        if self.normalize_whitespace:
-            processed = " ".join(processed.split())
-
-        return processed.strip()
+        return _preprocess(
+            text,
+            self.case_sensitive,
+            self.remove_punctuation,
+            self.normalize_whitespace,
+        )
 
     def _calculate_similarity(self, str1: str, str2: str) -> float:
         """Calculate similarity between two strings.
@@ -78,23 +186,136 @@ class FuzzyMatcher:
         processed1 = self._preprocess_text(str1)
         processed2 = self._preprocess_text(str2)
 
+        return self._score_processed(processed1, processed2)
+
+    def _score_processed(
+        self, processed1: str, processed2: str, score_cutoff: float = 0.0
+    ) -> float:
+        """Score two already preprocessed strings.
+
+        Args:
+            processed1: First preprocessed string
+            processed2: Second preprocessed string
+            score_cutoff: Scores below this value may be reported as lower
+                than they are, letting hopeless comparisons stop early
+
+        Returns:
+            Similarity score between 0.0 and 1.0
+        """
         # Check for exact match first
         if processed1 == processed2:
             return 1.0
 
         # Calculate similarity using multiple methods
-        ratios = [
-            SequenceMatcher(None, processed1, processed2).ratio(),
-            fuzz.ratio(processed1, processed2) / 100.0,
-            fuzz.partial_ratio(processed1, processed2) / 100.0,
-            fuzz.token_sort_ratio(processed1, processed2) / 100.0,
-        ]
+        if default_process is not None:
+            # RapidFuzz's ratio is the exact Indel similarity, which is never
+            # below difflib's SequenceMatcher ratio, so no separate pass for it
+            ratios = [
+                fuzz.ratio(processed1, processed2) / 100.0,
+                fuzz.partial_ratio(processed1, processed2) / 100.0,
+                fuzz.token_sort_ratio(processed1, processed2, processor=default_process)
+                / 100.0,
+            ]
+        else:
+            # Without RapidFuzz the exact Indel similarity comes from the
+            # bit-parallel indel_ratio, which bounds both SequenceMatcher's
+            # ratio and fuzzywuzzy's (rounded) ratio
+            ratios = [
+                fuzz.partial_ratio(processed1, processed2) / 100.0,
+                fuzz.token_sort_ratio(processed1, processed2) / 100.0,
+            ]
+            # The LCS is at most the shorter string, so when the length
+            # difference alone keeps 2 * LCS / total below the cutoff the
+            # bit-parallel pass cannot change the outcome and is skipped
+            total = len(processed1) + len(processed2)
+            shorter = min(len(processed1), len(processed2))
+            if 2.0 * shorter / total >= score_cutoff:
+                ratios.append(indel_ratio(processed1, processed2))
 
         # Use the highest ratio
         similarity = max(ratios)
 
         return similarity
 
+    def _score_candidates(
+        self, query: str, candidates: List[str], score_cutoff: float = 0.0
+    ) -> List[float]:
+        """Score one query against many candidates.
+
+        Args:
+            query: String to find matches for
+            candidates: Candidate strings to score
+            score_cutoff: Scores below this value may be reported as 0.0 (or
+                otherwise lower than they are); scorers use it to give up on
+                candidates that cannot reach it
+
+        Returns:
+            Similarity scores between 0.0 and 1.0, in candidate order
+        """
+        return self._score_matrix([query], candidates, score_cutoff)[0]
+
+    def _score_matrix(
+        self, queries: List[str], candidates: List[str], score_cutoff: float = 0.0
+    ) -> List[List[float]]:
+        """Score many queries against many candidates.
+
+        Every string is preprocessed once. With RapidFuzz, each scorer runs
+        over the whole query/candidate grid in a single cdist call instead of
+        one Python call per pair.
+
+        Args:
+            queries: Strings to find matches for
+            candidates: Candidate strings to score
+            score_cutoff: Scores below this value may be reported as 0.0 (or
+                otherwise lower than they are); scorers use it to give up on
+                candidates that cannot reach it
+
+        Returns:
+            One row of similarity scores between 0.0 and 1.0 per query, in
+            candidate order
+        """
+        processed_queries = [self._preprocess_text(query) for query in queries]
+        processed = [self._preprocess_text(candidate) for candidate in candidates]
+
+        if process is None:
+            return [
+                [
+                    self._score_processed(processed_query, candidate, score_cutoff)
+                    for candidate in processed
+                ]
+                for processed_query in processed_queries
+            ]
+
+        # RapidFuzz scores on a 0-100 scale; back the cutoff off slightly so
+        # float rounding in the scaling never rejects a score sitting exactly
+        # on the threshold
+        cutoff = max(score_cutoff * 100.0 - 1e-6, 0.0)
+
+        scores = np.maximum.reduce(
+            [
+                process.cdist(
+                    processed_queries,
+                    processed,
+                    scorer=scorer,
+                    processor=processor,
+                    score_cutoff=cutoff,
+                    dtype=np.float64,
+                )
+                for scorer, processor in (
+                    (fuzz.ratio, None),
+                    (fuzz.partial_ratio, None),
+                    (fuzz.token_sort_ratio, default_process),
+                )
+            ]
+        )
+        return [
+            [
+                1.0 if candidate == processed_query else score / 100.0
+                for candidate, score in zip(processed, row)
+            ]
+            for processed_query, row in zip(processed_queries, scores.tolist())
+        ]
+
     def similarity(self, str1: str, str2: str) -> float:
         """Calculate similarity between two strings.
 
@@ -124,6 +345,67 @@ class FuzzyMatcher:
         Returns:
             Tuple of (best_match, similarity_score) where best_match can be None
         """
+        prepared = self._prepare_best_match(query, candidates)
+        if not isinstance(prepared[0], tuple):
+            return prepared
+
+        # Look for fuzzy matches, scoring all candidates at once
+        cache_key, valid_candidates = prepared
+        scores = self._score_candidates(query, valid_candidates, self.threshold)
+        return self._finish_best_match(cache_key, valid_candidates, scores)
+
+    def find_best_matches(
+        self, queries: List[str], candidates: List[str]
+    ) -> List[Tuple[Optional[str], float]]:
+        """Find the best match for each of several queries.
+
+        Gives the same results as calling find_best_match once per query, but
+        the queries that need fuzzy scoring are scored together, one
+        RapidFuzz cdist call per scorer for the whole batch.
+
+        Args:
+            queries: Strings to find matches for
+            candidates: List of candidate strings to match against
+
+        Returns:
+            One (best_match, similarity_score) tuple per query, in order
+        """
+        results: List[Tuple[Optional[str], float]] = []
+        pending: List[int] = []
+        pending_keys: List[Tuple[str, Tuple[str, ...]]] = []
+        valid_candidates: List[str] = []
+        for query in queries:
+            prepared = self._prepare_best_match(query, candidates)
+            if isinstance(prepared[0], tuple):
+                cache_key, valid_candidates = prepared
+                pending.append(len(results))
+                pending_keys.append(cache_key)
+                results.append((None, 0.0))
+            else:
+                results.append(prepared)
+
+        if pending:
+            rows = self._score_matrix(
+                [queries[index] for index in pending], valid_candidates, self.threshold
+            )
+            for index, cache_key, scores in zip(pending, pending_keys, rows):
+                results[index] = self._finish_best_match(
+                    cache_key, valid_candidates, scores
+                )
+        return results
+
+    def _prepare_best_match(self, query: str, candidates: List[str]) -> Tuple[Any, Any]:
+        """Validate a best-match lookup and resolve it without scoring if possible.
+
+        Args:
+            query: String to find a match for
+            candidates: List of candidate strings to match against
+
+        Returns:
+            The final (best_match, similarity_score) when the query is empty,
+            cached or an exact match; otherwise (cache_key, valid_candidates)
+            for the caller to score
+        """
         # Validate inputs
         if query is None:
             raise ValueError("Query cannot be None")
@@ -156,10 +438,7 @@ class FuzzyMatcher:
                 return None, 0.0
             return cached_result
 
-        best_match = None
-        best_score = 0.0
-
-        # First pass: look for exact matches
+        # Look for exact matches
         for candidate in valid_candidates:
             if not isinstance(candidate, str):
                 raise TypeError("All candidates must be strings")
@@ -170,11 +449,27 @@ class FuzzyMatcher:
                     self.cache[cache_key] = result
                 return result
 
-        # Second pass: look for fuzzy matches
-        for candidate in valid_candidates:
-            if not isinstance(candidate, str):
-                raise TypeError("All candidates must be strings")
-            score = self._calculate_similarity(query, candidate)
+        return cache_key, valid_candidates
+
+    def _finish_best_match(
+        self,
+        cache_key: Tuple[str, Tuple[str, ...]],
+        valid_candidates: List[str],
+        scores: List[float],
+    ) -> Tuple[Optional[str], float]:
+        """Pick the best scoring candidate above the threshold and cache it.
+
+        Args:
+            cache_key: Key returned by _prepare_best_match
+            valid_candidates: Candidates that were scored
+            scores: Score of each candidate, in candidate order
+
+        Returns:
+            Tuple of (best_match, similarity_score) where best_match can be None
+        """
+        best_match = None
+        best_score = 0.0
+        for candidate, score in zip(valid_candidates, scores):
             if score > best_score and score >= self.threshold:
                 best_score = score
                 best_match = candidate
@@ -214,8 +509,12 @@ class FuzzyMatcher:
         # Filter out None values from candidates
         valid_candidates = [c for c in candidates if c is not None]
 
-        for candidate in valid_candidates:
-            score = self.similarity(query, candidate)
+        scores = self._score_candidates(
+            query,
+            [c if isinstance(c, str) else str(c) for c in valid_candidates],
+            threshold,
+        )
+        for candidate, score in zip(valid_candidates, scores):
             if score >= threshold:
                 matches.append((candidate, score))
 
@@ -257,7 +556,7 @@ class FuzzyMatcher:
         normalized = " ".join(normalized.split())
 
         # Remove common punctuation that might be OCR errors
-        normalized = re.sub(r"[^\w\s]", "", normalized)
+        normalized = _PUNCTUATION_RE.sub("", normalized)
 
         return normalized.strip()
 
@@ -271,16 +570,9 @@ class FuzzyMatcher:
             List of extracted number strings
         """
         # Find all number patterns
-        number_patterns = [
-            r"\d+\.?\d*",  # Decimal numbers
-            r"\$\d+\.?\d*",  # Dollar amounts
-            r"\d+%",  # Percentages
-        ]
-
         numbers = []
-        for pattern in number_patterns:
-            matches = re.findall(pattern, text)
-            numbers.extend(matches)
+        for pattern in _NUMBER_PATTERNS:
+            numbers.extend(pattern.findall(text))
 
         return numbers
 
@@ -293,16 +585,9 @@ class FuzzyMatcher:
         Returns:
             List of extracted date strings
         """
-        date_patterns = [
-            r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}",  # MM/DD/YYYY or MM-DD-YYYY
-            r"\d{4}[/-]\d{1,2}[/-]\d{1,2}",  # YYYY/MM/DD or YYYY-MM-DD
-            r"\w+\s+\d{1,2},?\s+\d{4}",  # Month DD, YYYY
-        ]
-
         dates = []
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text)
-            dates.extend(matches)
+        for pattern in _DATE_PATTERNS:
+            dates.extend(pattern.findall(text))
 
         return dates
 
@@ -315,16 +600,9 @@ class FuzzyMatcher:
         Returns:
             List of extracted amount strings
         """
-        amount_patterns = [
-            r"[\$]?\d{1,3}(?:,\d{3})*(?:\.\d{2})?",  # $1,234.56 or 1234.56
-            r"[\$]?\d+\.\d{2}",  # $123.45 or 123.45
-            r"[\$]?\d+",  # $123 or 123
-        ]
-
         amounts = []
-        for pattern in amount_patterns:
-            matches = re.findall(pattern, text)
-            amounts.extend(matches)
+        for pattern in _AMOUNT_PATTERNS:
+            amounts.extend(pattern.findall(text))
 
         return amounts
 
@@ -337,16 +615,9 @@ class FuzzyMatcher:
         Returns:
             True if text is likely a company name
         """
-        # Company name indicators
-        company_indicators = [
-            r"\b(?:inc|corp|llc|ltd|co|company|corporation|limited)\b",
-            r"\b(?:&|and)\b",
-            r"[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*",  # Title case words
-        ]
-
         text_lower = text.lower()
-        for pattern in company_indicators:
-            if re.search(pattern, text_lower):
+        for pattern in _COMPANY_INDICATOR_PATTERNS:
+            if pattern.search(text_lower):
                 return True
 
         return False
@@ -360,15 +631,8 @@ class FuzzyMatcher:
         Returns:
             True if text is likely a monetary amount
         """
-        # Amount patterns
-        amount_patterns = [
-            r"^[\$]?\d{1,3}(?:,\d{3})*(?:\.\d{2})?$",
-            r"^[\$]?\d+\.\d{2}$",
-            r"^[\$]?\d+$",
-        ]
-
-        for pattern in amount_patterns:
-            if re.match(pattern, text):
+        for pattern in _WHOLE_AMOUNT_PATTERNS:
+            if pattern.match(text):
                 return True
 
         return False
@@ -382,15 +646,8 @@ class FuzzyMatcher:
         Returns:
             True if text is likely a date
         """
-        # Date patterns
-        date_patterns = [
-            r"^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}$",
-            r"^\d{4}[/-]\d{1,2}[/-]\d{1,2}$",
-            r"^\w+\s+\d{1,2},?\s+\d{4}$",
-        ]
-
-        for pattern in date_patterns:
-            if re.match(pattern, text):
+        for pattern in _WHOLE_DATE_PATTERNS:
+            if pattern.match(text):
                 return True
 
         return False
@@ -401,7 +658,7 @@ class FuzzyMatcher:
 
     def update_candidates(self, candidates: List[str]) -> None:
         """Update the list of candidate strings for matching.
-        
+
         Args:
             candidates: List of candidate strings to use for matching
         """
@@ -419,7 +676,7 @@ class FuzzyMatcher:
         return {
             "cache_size": len(self.cache),
             "max_cache_size": self.cache_size,
-            "cache_hit_ratio": 0.0  # Could be enhanced to track hits
+            "cache_hit_ratio": 0.0,  # Could be enhanced to track hits
         }
 
     @staticmethod
@@ -439,8 +696,24 @@ class FuzzyMatcher:
         if not target or not candidates:
             return None
 
+        # Well-formed calls are memoized; the same OCR fragments are matched
+        # against the same business names on every page and invoice
+        if isinstance(target, str) and isinstance(candidates, list):
+            return _cached_fuzzy_match(target, tuple(candidates), threshold)
+
         # Create a temporary FuzzyMatcher instance
         matcher = FuzzyMatcher({"threshold": threshold})
         best_match, score = matcher.find_best_match(target, candidates)
-        
+
         return best_match if score >= threshold else None
+
+
+@lru_cache(maxsize=1024)
+def _cached_fuzzy_match(
+    target: str, candidates: Tuple[str, ...], threshold: float
+) -> Optional[str]:
+    """Run FuzzyMatcher.fuzzy_match once per target, candidates and threshold."""
+    matcher = FuzzyMatcher({"threshold": threshold})
+    best_match, score = matcher.find_best_match(target, list(candidates))
+
+    return best_match if score >= threshold else None
@@ -1,6 +1,6 @@
 """OCR correction utilities for improving text accuracy."""
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple, Union
 import re
 import logging
 
@@ -14,6 +14,16 @@ class OCRCorrections:
     such as character misrecognitions and formatting issues.
     """
 
+    # Spacing and formatting fixes, compiled once per class
+    _WHITESPACE_RE = re.compile(r"\s+")
+    _DIGIT_LETTER_RE = re.compile(r"(\d)\s*([A-Za-z])")
+    _LETTER_DIGIT_RE = re.compile(r"([A-Za-z])\s*(\d)")
+    _SPACED_DECIMAL_RE = re.compile(r"(\d)\s*([.,])\s*(\d)")
+    _SPACED_CENTS_RE = re.compile(r"([.,])\s*(\d{2})\s*$")
+    _SPACED_DATE_SINGLE_RE = re.compile(r"(\d)\s*[/-]\s*(\d)\s*[/-]\s*(\d)")
+    _SPACED_DATE_RE = re.compile(r"(\d{1,2})\s*[/-]\s*(\d{1,2})\s*[/-]\s*(\d{2,4})")
+    _INVOICE_NUMBER_JUNK_RE = re.compile(r"[^\w\-]")
+
     def __init__(self) -> None:
         """Initialize the OCR corrections utility."""
         # Common OCR character corrections
@@ -44,6 +54,48 @@ class OCRCorrections:
             "Y0utube": "YouTube",
         }
 
+        # character_corrections compiled into translate tables and replace
+        # steps; rebuilt whenever the corrections are changed
+        self._correction_source: Tuple[Tuple[str, str], ...] = ()
+        self._correction_steps: List[Union[Dict[int, str], Tuple[str, str]]] = []
+
+    def _apply_character_corrections(self, text: str) -> str:
+        """Apply character_corrections to text, in order.
+
+        Runs of single-character corrections are applied with one
+        ``str.translate`` pass instead of one ``str.replace`` scan each. A run
+        is cut wherever a correction would act on an earlier one's output, so
+        the result matches replacing one correction at a time.
+
+        Args:
+            text: Text to correct
+
+        Returns:
+            Text with every character correction applied
+        """
+        source = tuple(self.character_corrections.items())
+        if source != self._correction_source:
+            steps: List[Union[Dict[int, str], Tuple[str, str]]] = []
+            table: Dict[int, str] = {}
+            for incorrect, correct in source:
+                if len(incorrect) != 1:
+                    steps.append((incorrect, correct))
+                    table = {}
+                    continue
+                if not table or any(incorrect in out for out in table.values()):
+                    table = {}
+                    steps.append(table)
+                table[ord(incorrect)] = correct
+            self._correction_source = source
+            self._correction_steps = steps
+
+        for step in self._correction_steps:
+            if isinstance(step, tuple):
+                text = text.replace(*step)
+            else:
+                text = text.translate(step)
+        return text
+
     def correct_text(self, text: str) -> str:
         """Apply general OCR corrections to text.
 
@@ -56,17 +108,15 @@ class OCRCorrections:
         corrected = text
 
         # Apply character corrections
-        for incorrect, correct in self.character_corrections.items():
-            corrected = corrected.replace(incorrect, correct)
+        corrected = self._apply_character_corrections(corrected)
 
         # Fix common spacing issues
-        corrected = re.sub(r"\s+", " ", corrected)  # Multiple spaces to single
-        corrected = re.sub(
-            r"(\d)\s*([A-Za-z])", r"\1 \2", corrected
-        )  # Add space between number and letter
-        corrected = re.sub(
-            r"([A-Za-z])\s*(\d)", r"\1 \2", corrected
-        )  # Add space between letter and number
+        # Multiple spaces to single
+        corrected = self._WHITESPACE_RE.sub(" ", corrected)
+        # Add space between number and letter
+        corrected = self._DIGIT_LETTER_RE.sub(r"\1 \2", corrected)
+        # Add space between letter and number
+        corrected = self._LETTER_DIGIT_RE.sub(r"\1 \2", corrected)
 
         return corrected.strip()
 
@@ -80,13 +130,16 @@ class OCRCorrections:
             Corrected company name
         """
         corrected = company_name
+        # Lower-cased again only after a correction changes the name
+        corrected_lower = corrected.lower()
 
         # Apply company-specific corrections
         for incorrect, correct in self.company_corrections.items():
-            if incorrect.lower() in corrected.lower():
+            if incorrect.lower() in corrected_lower:
                 corrected = corrected.replace(incorrect, correct)
                 corrected = corrected.replace(incorrect.lower(), correct)
                 corrected = corrected.replace(incorrect.title(), correct)
+                corrected_lower = corrected.lower()
 
         # Apply general character corrections
         corrected = self.correct_text(corrected)
@@ -105,16 +158,13 @@ class OCRCorrections:
         corrected = amount_str
 
         # Apply character corrections for numbers
-        for incorrect, correct in self.character_corrections.items():
-            corrected = corrected.replace(incorrect, correct)
+        corrected = self._apply_character_corrections(corrected)
 
         # Fix common amount formatting issues
-        corrected = re.sub(
-            r"(\d)\s*([.,])\s*(\d)", r"\1\2\3", corrected
-        )  # Remove spaces around decimal
-        corrected = re.sub(
-            r"([.,])\s*(\d{2})\s*$", r"\1\2", corrected
-        )  # Fix cents formatting
+        # Remove spaces around decimal
+        corrected = self._SPACED_DECIMAL_RE.sub(r"\1\2\3", corrected)
+        # Fix cents formatting
+        corrected = self._SPACED_CENTS_RE.sub(r"\1\2", corrected)
 
         return corrected
 
@@ -130,16 +180,12 @@ class OCRCorrections:
         corrected = date_str
 
         # Apply character corrections
-        for incorrect, correct in self.character_corrections.items():
-            corrected = corrected.replace(incorrect, correct)
+        corrected = self._apply_character_corrections(corrected)
 
         # Fix common date formatting issues
-        corrected = re.sub(
-            r"(\d)\s*[/-]\s*(\d)\s*[/-]\s*(\d)", r"\1/\2/\3", corrected
-        )  # Standardize separators
-        corrected = re.sub(
-            r"(\d{1,2})\s*[/-]\s*(\d{1,2})\s*[/-]\s*(\d{2,4})", r"\1/\2/\3", corrected
-        )
+        # Standardize separators
+        corrected = self._SPACED_DATE_SINGLE_RE.sub(r"\1/\2/\3", corrected)
+        corrected = self._SPACED_DATE_RE.sub(r"\1/\2/\3", corrected)
 
         return corrected
 
@@ -155,13 +201,11 @@ class OCRCorrections:
         corrected = invoice_number
 
         # Apply character corrections
-        for incorrect, correct in self.character_corrections.items():
-            corrected = corrected.replace(incorrect, correct)
+        corrected = self._apply_character_corrections(corrected)
 
         # Remove common OCR artifacts
-        corrected = re.sub(
-            r"[^\w\-]", "", corrected
-        )  # Keep only alphanumeric and hyphens
+        # Keep only alphanumeric and hyphens
+        corrected = self._INVOICE_NUMBER_JUNK_RE.sub("", corrected)
 
         return corrected
 
@@ -0,0 +1,70 @@
+"""
+Multi-substring search utilities.
+
+This module contains the SubstringIndex class, which finds which of many
+configured strings occur in a text, keeping the configuration order.
+"""
+
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+
+try:
+    # Aho-Corasick finds every needle in a single pass over the text
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+class SubstringIndex:
+    """Find the first entry, in configuration order, that occurs in a text.
+
+    Each entry is a list of needle variants and the value it stands for. With
+    pyahocorasick installed all needles are matched in one linear pass over
+    the text; otherwise the needles are checked in order with ``in``.
+    """
+
+    def __init__(self, needles: List[Tuple[List[str], str]]) -> None:
+        self.needles = needles
+        self.automaton: Any = None
+        # An empty needle occurs in every text
+        self.always_matches: Optional[int] = next(
+            (i for i, (variants, _) in enumerate(needles) if "" in variants), None
+        )
+
+        if ahocorasick is not None and needles:
+            automaton = ahocorasick.Automaton()
+            for order, (variants, _) in enumerate(needles):
+                for variant in variants:
+                    # Keep the earliest entry for needles shared by several
+                    if variant and not automaton.exists(variant):
+                        automaton.add_word(variant, order)
+            if len(automaton):
+                automaton.make_automaton()
+                self.automaton = automaton
+
+    def first_match(self, text: str) -> Optional[str]:
+        """Return the value of the first entry found in text."""
+        if self.automaton is not None:
+            orders = {order for _, order in self.automaton.iter(text)}
+            if self.always_matches is not None:
+                orders.add(self.always_matches)
+            return self.needles[min(orders)][1] if orders else None
+
+        for variants, value in self.needles:
+            if any(variant in text for variant in variants):
+                return value
+        return None
+
+
+@lru_cache(maxsize=32)
+def compile_substring_index(values: Tuple[str, ...]) -> SubstringIndex:
+    """Build a case-insensitive SubstringIndex, cached per value tuple.
+
+    Args:
+        values: Strings to look for, in priority order
+
+    Returns:
+        Index whose ``first_match`` takes lower-cased text and returns the
+        first value, as given, whose lower-cased form occurs in it
+    """
+    return SubstringIndex([([value.lower()], value) for value in values])
@@ -194,6 +194,27 @@ class TestBaseParserTextExtraction:
 
         assert mock_engine.extract_text_from_pdf.call_count == 2
 
+    def test_extract_text_cached_until_file_changes(self, parser, tmp_path):
+        """Test that an unchanged PDF is only OCR'd once per engine."""
+        # Setup
+        pdf_file = tmp_path / "test.pdf"
+        pdf_file.write_text("dummy content")
+
+        mock_engine = Mock()
+        mock_engine.extract_text_from_pdf.side_effect = ["First pass", "Second pass"]
+        parser.ocr_engine = mock_engine
+
+        # Execute
+        first = parser.extract_text(pdf_file)
+        second = parser.extract_text(pdf_file)
+        pdf_file.write_text("changed content, different size")
+        third = parser.extract_text(pdf_file)
+
+        # Verify
+        assert first == second == "First pass"
+        assert third == "Second pass"
+        assert mock_engine.extract_text_from_pdf.call_count == 2
+
 
 class TestBaseParserTextProcessing:
     """Test BaseParser text processing methods."""
@@ -0,0 +1,104 @@
+# mypy: disable-error-code="no-untyped-def,var-annotated"
+"""Unit tests for the BusinessMappingManager lookup indexes."""
+
+import json
+import os
+import sys
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "src"))
+
+from ocrinvoice.business.business_mapping_manager import (  # noqa: E402
+    BusinessMappingManager,
+)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Create a manager backed by a temporary mapping file."""
+    mapping_file = tmp_path / "business_mappings.json"
+    mapping_file.write_text(
+        json.dumps(
+            {
+                "business_names": ["Hydro-Québec", "RONA"],
+                "exact_matches": {"hydro quebec": "Hydro-Québec"},
+                "partial_matches": {"rona inc": "RONA"},
+                "fuzzy_candidates": [],
+                "indicators": {},
+            }
+        ),
+        encoding="utf-8",
+    )
+    return BusinessMappingManager(str(mapping_file))
+
+
+class TestBusinessMappingLookup:
+    """Test case-insensitive name and alias lookups."""
+
+    def test_is_business_name_is_case_insensitive(self, manager) -> None:
+        """Business names are found regardless of case."""
+        assert manager.is_business_name("rona")
+        assert manager.is_business_name("HYDRO-QUÉBEC")
+        assert not manager.is_business_name("hydro quebec")
+        assert not manager.is_business_name("")
+
+    def test_index_follows_business_name_changes(self, manager) -> None:
+        """Adding, renaming and removing business names refreshes the index."""
+        manager.add_business_name("Costco")
+        assert manager.is_business_name("costco")
+
+        manager.update_business_name("Costco", "Costco Wholesale")
+        assert not manager.is_business_name("costco")
+        assert manager.is_business_name("costco wholesale")
+
+        manager.remove_business_name("Costco Wholesale")
+        assert not manager.is_business_name("costco wholesale")
+
+    def test_find_business_match_uses_indexed_mappings(self, manager) -> None:
+        """Exact and partial mappings are found, including OCR spacing variants."""
+        assert manager.find_business_match("Facture HYDRO QUEBEC 2024") == (
+            "Hydro-Québec",
+            "exact_match",
+            1.0,
+        )
+        assert manager.find_business_match("merci - h y d r o q u e b e c")[0] == (
+            "Hydro-Québec"
+        )
+        assert manager.find_business_match("RONA   Inc. Saint-Jean") == (
+            "RONA",
+            "partial_match",
+            0.8,
+        )
+        assert manager.find_business_match("Costco Wholesale") is None
+
+        manager.add_mapping("costco", "RONA", "partial_matches")
+        assert manager.find_business_match("Costco Wholesale")[0] == "RONA"
+
+    def test_index_follows_direct_config_edits_on_save(self, manager) -> None:
+        """Editing config directly and saving refreshes the mapping indexes."""
+        del manager.config["exact_matches"]["hydro quebec"]
+        manager._save_config()
+
+        assert manager.find_business_match("invoice hydro quebec 2024") is None
+
+    def test_removed_mapping_no_longer_matches(self, manager) -> None:
+        """A removed mapping stops matching and is dropped from the file."""
+        assert manager.remove_mapping("hydro quebec", "exact_matches")
+        assert not manager.remove_mapping("hydro quebec", "exact_matches")
+
+        assert manager.find_business_match("Facture hydro quebec 2024") is None
+        with open(manager.mapping_file, encoding="utf-8") as f:
+            saved = json.load(f)
+        assert "hydro quebec" not in saved["exact_matches"]
+
+    def test_indicator_index_follows_config_edits_on_save(self, manager) -> None:
+        """Indicators edited in config take effect once the config is saved."""
+        manager.config["indicators"]["RONA"] = ["rona"]
+        manager._save_config()
+        assert manager.find_business_match("rona") == ("RONA", "fuzzy_match", 0.6)
+
+        del manager.config["indicators"]["RONA"]
+        manager._save_config()
+        assert manager.find_business_match("rona") is None
@@ -0,0 +1,40 @@
+# mypy: disable-error-code="no-untyped-def,var-annotated"
+"""Unit tests for InvoiceDatabase persistence."""
+
+import json
+import os
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "src"))
+
+from ocrinvoice.business.database import InvoiceDatabase  # noqa: E402
+
+
+class TestInvoiceDatabasePersistence:
+    """Test saving and reloading invoices."""
+
+    def test_add_invoice_saves_and_reloads(self, tmp_path) -> None:
+        """Invoices added with autosave are written and read back."""
+        db_path = tmp_path / "invoices.json"
+        database = InvoiceDatabase(str(db_path))
+
+        invoice_id = database.add_invoice({"company": "Hydro-Québec", "total": 76.5})
+
+        reloaded = InvoiceDatabase(str(db_path))
+        assert reloaded.get_invoice(invoice_id)["company"] == "Hydro-Québec"
+        assert not (tmp_path / "invoices.json.tmp").exists()
+
+    def test_batch_inserts_are_written_on_flush(self, tmp_path) -> None:
+        """Without autosave the file is only written by flush()."""
+        db_path = tmp_path / "invoices.json"
+        database = InvoiceDatabase(str(db_path), autosave=False)
+
+        for total in (10.0, 20.0, 30.0):
+            database.add_invoice({"company": "RONA", "total": total})
+        assert not db_path.exists()
+
+        database.flush()
+        with open(db_path, encoding="utf-8") as f:
+            saved = json.load(f)
+        assert [invoice["total"] for invoice in saved] == [10.0, 20.0, 30.0]
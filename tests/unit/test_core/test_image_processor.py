@@ -234,6 +234,24 @@ class TestImageProcessorImageDenoising:
             assert result == mock_pil_image
             mock_cv2.fastNlMeansDenoising.assert_called_once_with(mock_array, h=2.0)
 
+    @patch("ocrinvoice.core.image_processor.cv2")
+    @patch("ocrinvoice.core.image_processor.np.array")
+    def test_denoise_image_with_configured_windows(
+        self, mock_np_array, mock_cv2, processor
+    ):
+        """Test image denoising with smaller windows set in config."""
+        mock_array = np.array([[1, 2], [3, 4]])
+        mock_np_array.return_value = mock_array
+        processor.denoise_template_window = 3
+        processor.denoise_search_window = 9
+
+        with patch("ocrinvoice.core.image_processor.Image.fromarray"):
+            processor._denoise_image(Mock())
+
+        mock_cv2.fastNlMeansDenoising.assert_called_once_with(
+            mock_array, h=1.0, templateWindowSize=3, searchWindowSize=9
+        )
+
     @patch("ocrinvoice.core.image_processor.cv2")
     @patch("ocrinvoice.core.image_processor.np.array")
     def test_denoise_image_failure(self, mock_np_array, mock_cv2, processor):
@@ -558,6 +576,24 @@ class TestImageProcessorPerformance:
         assert len(errors) == 0
         assert all(result == mock_processed for result in results)
 
+    def test_batch_preprocess_preserves_order(self, processor):
+        """Test that threaded batch preprocessing keeps input order."""
+        images = [Mock(name=f"page{i}") for i in range(6)]
+        failing = images[3]
+
+        def fake_preprocess(image, method="standard"):
+            if image is failing:
+                raise RuntimeError("bad page")
+            return (image, method)
+
+        with patch.object(processor, "preprocess_for_ocr", side_effect=fake_preprocess):
+            result = processor.batch_preprocess(images, method="aggressive")
+
+        assert result[3] is failing
+        assert [r for i, r in enumerate(result) if i != 3] == [
+            (image, "aggressive") for i, image in enumerate(images) if i != 3
+        ]
+
 
 class TestImageProcessorIntegration:
     """Test ImageProcessor integration scenarios."""
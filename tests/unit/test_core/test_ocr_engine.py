@@ -80,6 +80,19 @@ class TestOCREngineDependencyValidation:
         ):
             OCREngine()
 
+    @patch("ocrinvoice.core.ocr_engine.DEPENDENCIES_AVAILABLE", False)
+    @patch.object(OCREngine, "_validate_dependencies")
+    @patch.object(OCREngine, "_configure_tesseract")
+    def test_use_opencl_without_opencv(self, mock_configure, mock_validate):
+        """Test use_opencl is ignored instead of touching a missing cv2."""
+        import ocrinvoice.core.ocr_engine as ocr_engine_module
+
+        with patch.dict(ocr_engine_module.__dict__):
+            del ocr_engine_module.__dict__["cv2"]
+            engine = OCREngine(config={"use_opencl": True})
+
+        assert engine.use_opencl is False
+
 
 class TestOCREnginePDFTextExtraction:
     """Test OCREngine PDF text extraction methods."""
@@ -170,6 +183,30 @@ class TestOCREnginePDFTextExtraction:
                     mock_pdfplumber.assert_called_once_with(pdf_file)
                     mock_pypdf2.assert_not_called()
 
+    def test_extract_text_from_pdf_prefers_text_layer(self, engine, tmp_path):
+        """Test OCR is skipped when the PDF text layer is sufficient."""
+        pdf_file = tmp_path / "test.pdf"
+        pdf_file.write_text("dummy content")
+        engine.prefer_text_layer = True
+        engine.min_text_layer_length = 20
+        layer_text = "Invoice from Test Company Inc. Total: $100.00"
+
+        with patch.object(engine, "_extract_text_with_ocr") as mock_ocr:
+            mock_ocr.return_value = "OCR extracted text"
+
+            with patch.object(
+                engine, "_extract_text_with_pdfplumber"
+            ) as mock_pdfplumber:
+                mock_pdfplumber.return_value = layer_text
+
+                result = engine.extract_text_from_pdf(str(pdf_file))
+                forced = engine.extract_text_from_pdf(str(pdf_file), force_ocr=True)
+
+                assert result == layer_text
+                assert forced == "OCR extracted text"
+                mock_ocr.assert_called_once_with(pdf_file)
+                mock_pdfplumber.assert_called_once_with(pdf_file)
+
     def test_extract_text_from_pdf_file_not_found(self, engine):
         """Test text extraction with non-existent file."""
         with pytest.raises(FileNotFoundError):
@@ -309,6 +346,22 @@ class TestOCREngineImageTextExtraction:
             with pytest.raises(Exception, match="OCR failed"):
                 engine.extract_text_from_image(mock_image)
 
+    @patch("ocrinvoice.core.ocr_engine.pytesseract")
+    def test_extract_text_from_images_keeps_page_order(self, mock_pytesseract, engine):
+        """Test pages OCR'd concurrently are joined in order, skipping failures."""
+        pages = [MagicMock(name=f"page{i}") for i in range(4)]
+
+        def fake_ocr(image, config, lang):
+            if image is pages[2]:
+                raise Exception("OCR failed")
+            return f"text {pages.index(image)}"
+
+        mock_pytesseract.image_to_string.side_effect = fake_ocr
+        with patch.object(engine, "preprocess_image", side_effect=lambda image: image):
+            result = engine.extract_text_from_images(pages)
+
+        assert result == "text 0\ntext 1\ntext 3"
+
 
 class TestOCREngineImageProcessing:
     """Test OCREngine image processing methods."""
@@ -322,7 +375,7 @@ class TestOCREngineImageProcessing:
             return OCREngine()
 
     @patch("ocrinvoice.core.ocr_engine.cv2")
-    @patch("ocrinvoice.core.ocr_engine.np.array")
+    @patch("ocrinvoice.core.ocr_engine.np.asarray")
     def test_preprocess_image_success(self, mock_np_array, mock_cv2, engine):
         import numpy as real_np
 
@@ -334,7 +387,6 @@ class TestOCREngineImageProcessing:
         mock_cv2.cvtColor.return_value = (
             arr_gray  # After conversion, should be grayscale
         )
-        mock_cv2.GaussianBlur.return_value = arr_gray
         mock_cv2.threshold.return_value = (127.0, arr_gray)
         mock_pil_image = MagicMock()
         with patch("ocrinvoice.core.ocr_engine.Image.fromarray") as mock_fromarray:
@@ -342,8 +394,27 @@ class TestOCREngineImageProcessing:
             result = engine.preprocess_image(mock_image)
             assert result == mock_pil_image
             mock_cv2.cvtColor.assert_called_once()
-            mock_cv2.GaussianBlur.assert_called_once()
+            mock_cv2.GaussianBlur.assert_not_called()
+            mock_cv2.threshold.assert_called_once()
+
+    @patch("ocrinvoice.core.ocr_engine.cv2")
+    @patch("ocrinvoice.core.ocr_engine.np.asarray")
+    def test_preprocess_image_with_opencl(self, mock_np_array, mock_cv2, engine):
+        """Test the OpenCL path uploads the page once and reads it back once."""
+        import numpy as real_np
+
+        engine.use_opencl = True
+        mock_np_array.return_value = real_np.zeros((100, 1000), dtype=real_np.uint8)
+        mock_cv2.threshold.return_value = (127.0, MagicMock())
+        cleaned = mock_cv2.morphologyEx.return_value
+        with patch("ocrinvoice.core.ocr_engine.Image.fromarray") as mock_fromarray:
+            engine.preprocess_image(MagicMock())
+
+            mock_cv2.UMat.assert_called_once_with(mock_np_array.return_value)
             mock_cv2.threshold.assert_called_once()
+            assert mock_cv2.threshold.call_args[0][0] is mock_cv2.UMat.return_value
+            cleaned.get.assert_called_once_with()
+            mock_fromarray.assert_called_once_with(cleaned.get.return_value)
 
 
 class TestOCREnginePDFImageExtraction:
@@ -371,6 +442,41 @@ class TestOCREnginePDFImageExtraction:
         assert str(called_arg) == str(pdf_file)
         assert mock_convert.call_args[1]["dpi"] == 300
 
+    @patch("ocrinvoice.core.ocr_engine.pytesseract")
+    @patch("ocrinvoice.core.ocr_engine.convert_from_path")
+    def test_ocr_retries_sparse_pages_at_full_dpi(
+        self, mock_convert, mock_pytesseract, engine, tmp_path
+    ):
+        """Test pages are OCR'd at draft DPI and only sparse ones are redone."""
+        assert engine.draft_dpi == engine.pdf_dpi  # the draft pass is opt-in
+        engine.draft_dpi = 200
+        pdf_file = tmp_path / "test.pdf"
+        pdf_file.write_text("dummy content")
+        draft_pages = [MagicMock(name="draft1"), MagicMock(name="draft2")]
+        full_page = MagicMock(name="full2")
+        mock_convert.side_effect = [draft_pages, [full_page]]
+        texts = {
+            id(draft_pages[0]): "Invoice from Test Company Inc.",
+            id(draft_pages[1]): "",
+            id(full_page): "Total: $100.00 due on receipt",
+        }
+        mock_pytesseract.image_to_string.side_effect = lambda image, **kwargs: texts[
+            id(image)
+        ]
+
+        with patch.object(engine, "preprocess_image", side_effect=lambda image: image):
+            result = engine._extract_text_with_ocr(pdf_file)
+
+        assert result == (
+            "Invoice from Test Company Inc.\nTotal: $100.00 due on receipt"
+        )
+        assert mock_convert.call_args_list[0][1]["dpi"] == 200
+        assert mock_convert.call_args_list[1][1] == {
+            "dpi": 300,
+            "first_page": 2,
+            "last_page": 2,
+        }
+
 
 class TestOCREngineErrorHandling:
     """Test OCREngine error handling and recovery."""
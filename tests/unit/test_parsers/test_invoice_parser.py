@@ -84,6 +84,17 @@ class TestInvoiceParserCompanyExtraction:
 
         assert result == "hydro-québec"
 
+    def test_extract_company_known_companies_in_config_order(
+        self, parser: InvoiceParser
+    ) -> None:
+        """Test the first configured known company wins, wherever it appears."""
+        parser.business_mapping_manager = None
+        parser.config = {"known_companies": ["Bell Canada", "RONA", "Costco"]}
+
+        text = "RONA Inc.\nPaid with Bell Canada points\nCOSTCO"
+
+        assert parser.extract_company(text) == "bell canada"
+
     @patch("ocrinvoice.business.business_mapping_manager.FuzzyMatcher")
     def test_extract_company_after_invoice_header(
         self, mock_fuzzy_matcher: MagicMock, parser: InvoiceParser
@@ -236,6 +247,16 @@ class TestInvoiceParserTotalExtraction:
 
         assert result == 250.00
 
+    def test_extract_total_after_text_that_lengthens_when_lowered(
+        self, parser: InvoiceParser
+    ) -> None:
+        """Keyword offsets stay aligned when lower() would lengthen the text."""
+        text = "İ" * 200 + " total 12.00"
+
+        result = parser.extract_total(text)
+
+        assert result == 12.00
+
     def test_extract_total_no_match(self, parser: InvoiceParser) -> None:
         """Test total extraction when no total is found."""
         text = """
@@ -554,6 +575,45 @@ class TestInvoiceParserFullParsing:
         assert result["parser_type"] == "invoice"
         assert "confidence" in result
 
+    def test_parse_corrects_text_only_when_needed(
+        self, parser: InvoiceParser, tmp_path: Path
+    ) -> None:
+        """Test OCR correction runs at most once, and only for missing fields."""
+        pdf_path = tmp_path / "invoice.pdf"
+        pdf_path.write_text("")
+        parser.ocr_corrections.correct_text = MagicMock(return_value="corrected")
+
+        with patch.object(parser, "extract_text", return_value="raw"), patch.object(
+            parser, "extract_company", return_value="Test Company"
+        ), patch.object(parser, "extract_total", return_value=100.0), patch.object(
+            parser, "extract_date", return_value="2024-01-15"
+        ), patch.object(
+            parser, "extract_invoice_number", side_effect=[None, "INV-001"]
+        ) as mock_invoice_number:
+            result = parser.parse(pdf_path)
+
+        assert result["invoice_number"] == "INV-001"
+        mock_invoice_number.assert_called_with("corrected")
+        parser.ocr_corrections.correct_text.assert_called_once_with("raw")
+
+    def test_extract_text_reuses_ocr_until_settings_change(
+        self, parser: InvoiceParser, tmp_path: Path
+    ) -> None:
+        """Test unchanged files are OCRed once per engine settings."""
+        pdf_path = tmp_path / "invoice.pdf"
+        pdf_path.write_text("")
+
+        with patch.object(
+            parser.ocr_engine, "extract_text_from_pdf", return_value="text"
+        ) as mock_extract:
+            assert parser.extract_text(pdf_path) == "text"
+            assert parser.extract_text(pdf_path) == "text"
+            assert mock_extract.call_count == 1
+
+            parser.ocr_engine.pdf_dpi += 100
+            assert parser.extract_text(pdf_path) == "text"
+            assert mock_extract.call_count == 2
+
     def test_parse_with_error_handling(
         self, parser: InvoiceParser, tmp_path: Path
     ) -> None:
@@ -5,13 +5,14 @@ import os
 import sys
 import threading
 import time
+from unittest.mock import patch
 
 import pytest
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "src"))
 
-from ocrinvoice.utils.fuzzy_matcher import FuzzyMatcher  # noqa: E402
+from ocrinvoice.utils.fuzzy_matcher import FuzzyMatcher, indel_ratio  # noqa: E402
 
 
 class TestFuzzyMatcherInitialization:
@@ -173,6 +174,19 @@ class TestFuzzyMatcherStringComparison:
         similarity = matcher._calculate_similarity("hello world", "hello  world")
         assert similarity == 1.0  # Should be 1.0 after preprocessing
 
+    def test_indel_ratio_matches_lcs_definition(self):
+        """Test the bit-parallel Indel similarity against 2 * LCS / total length."""
+        assert indel_ratio("", "") == 1.0
+        assert indel_ratio("hello", "") == 0.0
+        assert indel_ratio("hello", "hello") == 1.0
+        # LCS("kitten", "sitting") is "ittn": 2 * 4 / 13
+        assert indel_ratio("kitten", "sitting") == pytest.approx(8 / 13)
+        # Longer than a machine word still works with Python ints
+        long_text = "costco wholesale canada " * 4
+        assert indel_ratio(long_text, long_text[1:]) == pytest.approx(
+            2 * (len(long_text) - 1) / (2 * len(long_text) - 1)
+        )
+
 
 class TestFuzzyMatcherBestMatchFinding:
     """Test FuzzyMatcher best match finding methods."""
@@ -253,6 +267,19 @@ class TestFuzzyMatcherBestMatchFinding:
         assert result == "ABC Company Inc."
         assert similarity > 0.8
 
+    def test_find_best_matches_matches_single_lookups(self, matcher):
+        """Test batched lookups give the same results as one call per query."""
+        candidates = ["apple", "banana", "orange"]
+        queries = ["appl", "banana", "xyz", ""]
+
+        results = matcher.find_best_matches(queries, candidates)
+
+        assert results == [
+            FuzzyMatcher().find_best_match(query, candidates) for query in queries
+        ]
+        assert results[1] == ("banana", 1.0)
+        assert results[2] == (None, 0.0)
+
 
 class TestFuzzyMatcherMultipleMatches:
     """Test FuzzyMatcher multiple match finding methods."""
@@ -387,6 +414,17 @@ class TestFuzzyMatcherCaching:
 
         assert len(matcher._cache) == 0
 
+    def test_static_fuzzy_match_is_memoized(self):
+        """Test repeated static fuzzy_match calls reuse the first result."""
+        candidates = ["Hydro-Québec", "Bell Canada"]
+        first = FuzzyMatcher.fuzzy_match("hydro-quebec", candidates, threshold=0.8)
+
+        with patch.object(FuzzyMatcher, "find_best_match") as mock_find:
+            second = FuzzyMatcher.fuzzy_match("hydro-quebec", candidates, threshold=0.8)
+
+        assert first == second == "Hydro-Québec"
+        mock_find.assert_not_called()
+
 
 class TestFuzzyMatcherPerformance:
     """Test FuzzyMatcher performance characteristics."""